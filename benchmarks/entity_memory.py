@@ -0,0 +1,88 @@
+"""Compares the memory held by `Maniphest` tasks that keep their Conduit payload vs compact tasks
+
+Usage: python benchmarks/entity_memory.py [num_tasks]
+"""
+# Python Standard Library Imports
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+
+
+# isort: off
+
+
+def make_payloads(num_tasks):
+    """Makes Conduit-like `maniphest.search` payloads, decoded from JSON like real responses
+    """
+    now = int(time.time())
+    payloads = []
+    for i in range(num_tasks):
+        created_ts = now - random.randint(0, 365 * 24 * 60 * 60)
+        closed_ts = created_ts + random.randint(60, 90 * 24 * 60 * 60)
+        payload = {
+            'id': i + 1,
+            'type': 'TASK',
+            'phid': f'PHID-TASK-{i + 1:020d}',
+            'fields': {
+                'name': f'Task {i + 1}',
+                'description': {'raw': 'Some description'},
+                'authorPHID': f'PHID-USER-{random.randint(1, 50):020d}',
+                'ownerPHID': f'PHID-USER-{random.randint(1, 50):020d}',
+                'status': {'value': 'resolved', 'name': 'Resolved', 'color': None},
+                'priority': {'value': 50, 'subpriority': 0, 'name': 'Normal', 'color': 'orange'},
+                'points': random.choice([None, '1', '2', '3', '5', '8']),
+                'subtype': random.choice(['bug', 'default', 'feature', 'story']),
+                'closerPHID': f'PHID-USER-{random.randint(1, 50):020d}',
+                'dateClosed': closed_ts,
+                'spacePHID': None,
+                'dateCreated': created_ts,
+                'dateModified': closed_ts,
+                'policy': {'view': 'users', 'interact': 'users', 'edit': 'users'},
+            },
+            'attachments': {
+                'projects': {
+                    'projectPHIDs': [
+                        f'PHID-PROJ-{random.randint(1, 30):020d}'
+                        for _ in range(random.randint(1, 3))
+                    ],
+                },
+            },
+        }
+        payloads.append(json.dumps(payload))
+    return payloads
+
+
+def measure(payloads, keep_raw_data):
+    """Returns the bytes still allocated after parsing `payloads` into tasks
+    """
+    gc.collect()
+    tracemalloc.start()
+    tasks = [Maniphest(json.loads(payload), keep_raw_data=keep_raw_data) for payload in payloads]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return size
+
+
+def main():
+    num_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    payloads = make_payloads(num_tasks)
+
+    raw_size = measure(payloads, keep_raw_data=True)
+    compact_size = measure(payloads, keep_raw_data=False)
+
+    print(f'{num_tasks} tasks')
+    print(f'With Conduit payloads: {raw_size / 2**20:.1f} MiB ({raw_size / num_tasks:.0f} bytes/task)')
+    print(f'Compact:               {compact_size / 2**20:.1f} MiB ({compact_size / num_tasks:.0f} bytes/task)')
+    print(f'Reduction: {raw_size / compact_size:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
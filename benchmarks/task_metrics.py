@@ -0,0 +1,116 @@
+"""Compares computing `TaskMetric` values from `Maniphest` objects vs from `TaskColumns`
+
+Usage: python benchmarks/task_metrics.py [num_tasks]
+"""
+# Python Standard Library Imports
+import random
+import sys
+import time
+
+# Third Party (PyPI) Imports
+import numpy
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.metrics.columns import TaskColumns
+from phablytics.metrics.metrics import TaskMetric
+
+
+# isort: off
+
+
+EMPTY_COLUMNS = TaskColumns.from_tasks([])
+
+
+def make_tasks(num_tasks):
+    now = int(time.time())
+    tasks = []
+    for i in range(num_tasks):
+        created_ts = now - random.randint(0, 365 * 24 * 60 * 60)
+        closed_ts = created_ts + random.randint(60, 90 * 24 * 60 * 60)
+        task = Maniphest({
+            'id': i + 1,
+            'phid': f'PHID-TASK-{i + 1}',
+            'fields': {
+                'name': f'Task {i + 1}',
+                'status': {'value': 'resolved', 'name': 'Resolved'},
+                'points': random.choice([None, '1', '2', '3', '5', '8']),
+                'dateCreated': created_ts,
+                'dateModified': closed_ts,
+                'dateClosed': closed_ts,
+                'subtype': random.choice(['bug', 'default', 'feature', 'story']),
+                'authorPHID': f'PHID-USER-{random.randint(1, 50)}',
+                'ownerPHID': f'PHID-USER-{random.randint(1, 50)}',
+            },
+        }, keep_raw_data=False)
+        tasks.append(task)
+    return tasks
+
+
+class ObjectTaskMetric(TaskMetric):
+    """`TaskMetric` as it was computed before `TaskColumns`: per-task property lookups on every access
+    """
+    @property
+    def num_closed(self):
+        return len(self.tasks_closed)
+
+    @property
+    def points_completed(self):
+        return sum([task.points for task in self.tasks_closed])
+
+    @property
+    def mean_days_to_resolution(self):
+        values = [task.days_to_resolution for task in self.tasks_closed]
+        return numpy.mean(values) if values else 0
+
+    @property
+    def days_to_resolution_per_point(self):
+        days = sum([task.days_to_resolution for task in self.tasks_closed])
+        return 1.0 * days / max(self.points_completed, 1)
+
+
+ATTRIBUTES = [
+    'points_completed',
+    'num_closed',
+    'mean_days_to_resolution',
+    'days_to_resolution_per_point',
+    'points_per_task',
+    'tasks_per_point',
+]
+
+
+def compute_from_objects(tasks):
+    metric = ObjectTaskMetric('', None, None, [], tasks, created_columns=EMPTY_COLUMNS, closed_columns=EMPTY_COLUMNS)
+    values = [getattr(metric, attr) for attr in ATTRIBUTES]
+    return values
+
+
+def compute_from_columns(tasks):
+    metric = TaskMetric('', None, None, [], tasks)
+    values = [getattr(metric, attr) for attr in ATTRIBUTES]
+    return values
+
+
+def timed(f, *args):
+    start = time.perf_counter()
+    result = f(*args)
+    elapsed = time.perf_counter() - start
+    return result, elapsed
+
+
+def main():
+    num_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    tasks = make_tasks(num_tasks)
+
+    objects_result, objects_elapsed = timed(compute_from_objects, tasks)
+    columns_result, columns_elapsed = timed(compute_from_columns, tasks)
+
+    print(f'{num_tasks} closed tasks, {len(ATTRIBUTES)} metric values')
+    print(f'Maniphest objects: {objects_elapsed * 1000:.1f} ms')
+    print(f'TaskColumns:       {columns_elapsed * 1000:.1f} ms (including building the columns)')
+    print(f'Speedup: {objects_elapsed / columns_elapsed:.1f}x')
+    assert numpy.allclose(objects_result, columns_result)
+
+
+if __name__ == '__main__':
+    main()
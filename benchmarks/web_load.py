@@ -0,0 +1,116 @@
+"""Load tests the web UI with concurrent requests
+
+Usage:
+- python benchmarks/web_load.py URL [concurrency] [num_requests]
+    Sends `num_requests` GETs to `URL` (e.g. a running `phablytics-web --production`),
+    `concurrency` at a time, and reports throughput and latencies
+- python benchmarks/web_load.py
+    Compares a single-threaded server (as `phablytics-web`) with `PreforkWSGIServer`,
+    serving a stand-in app whose requests wait on I/O like Conduit-bound pages
+"""
+# Python Standard Library Imports
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party (PyPI) Imports
+from werkzeug.serving import make_server
+
+# Phablytics Imports
+from phablytics.web.prefork import PreforkWSGIServer
+
+
+# isort: off
+
+
+REQUEST_SECONDS = 0.05
+
+
+def slow_app(environ, start_response):
+    """Stand-in for a page which mostly waits on Conduit
+    """
+    time.sleep(REQUEST_SECONDS)
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'ok']
+
+
+def load_test(url, concurrency, num_requests):
+    """Returns `(requests_per_second, latencies)`
+    """
+    def _get(i):
+        start = time.perf_counter()
+        with urllib.request.urlopen(url, timeout=60) as response:
+            response.read()
+        latency = time.perf_counter() - start
+        return latency
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(_get, range(num_requests)))
+    elapsed = time.perf_counter() - start
+
+    requests_per_second = num_requests / elapsed
+    return requests_per_second, latencies
+
+
+def print_results(label, requests_per_second, latencies):
+    p50 = latencies[len(latencies) // 2]
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f'{label:<28} {requests_per_second:8.1f} req/s   p50 {p50 * 1000:7.1f} ms   p95 {p95 * 1000:7.1f} ms')
+
+
+def compare_servers(concurrency, num_requests):
+    host = '127.0.0.1'
+
+    server = make_server(host, 0, slow_app, threaded=False)
+    port = server.server_port
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    print_results('single-threaded', *load_test(f'http://{host}:{port}/', concurrency, num_requests))
+    server.shutdown()
+    server.server_close()
+
+    workers, threads = 2, 8
+    port = port + 1
+    pid = os.fork()
+    if pid == 0:
+        try:
+            PreforkWSGIServer(slow_app, host, port, workers=workers, threads=threads, graceful_timeout=5).run()
+        finally:
+            os._exit(0)
+
+    time.sleep(1)
+    try:
+        print_results(
+            f'prefork {workers} workers x {threads}',
+            *load_test(f'http://{host}:{port}/', concurrency, num_requests)
+        )
+    finally:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+
+
+def main():
+    # don't log every request
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    args = sys.argv[1:]
+    url = args.pop(0) if args and '://' in args[0] else None
+    concurrency = int(args[0]) if len(args) > 0 else 16
+    num_requests = int(args[1]) if len(args) > 1 else 200
+
+    print(f'{num_requests} requests, {concurrency} at a time')
+    if url:
+        print_results(url, *load_test(url, concurrency, num_requests))
+    else:
+        print(f'(each request waits {REQUEST_SECONDS * 1000:.0f} ms)')
+        compare_servers(concurrency, num_requests)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+# Phablytics Imports
+from phablytics.cache.utils import (
+    cached,
+    get_cache_backend,
+    get_cache_stats,
+    invalidate_caches,
+    register_cache_stats,
+    set_cache_backend,
+)
+
+
+__all__ = [
+    'cached',
+    'get_cache_backend',
+    'get_cache_stats',
+    'invalidate_caches',
+    'register_cache_stats',
+    'set_cache_backend',
+]
@@ -0,0 +1,355 @@
+# Python Standard Library Imports
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from urllib.parse import urlparse
+
+
+# isort: off
+
+
+class CacheMiss:
+    def __repr__(self):
+        return 'CACHE_MISS'
+
+
+CACHE_MISS = CacheMiss()
+
+
+class CacheBackend:
+    """This is the base class for cache backends.
+
+    Values are arbitrary Python objects. `get()` returns `CACHE_MISS` for
+    missing or expired keys, since `None` is a legitimate cached value.
+
+    Backends SHOULD NOT raise on connectivity problems; the cache is an
+    optimization, so failures are reported as misses and counted in `num_errors`.
+    Likewise for entries which can't be unpickled (corrupt, or pickled from a
+    class which has since changed), which are also deleted.
+    """
+    def __init__(self):
+        self.num_errors = 0
+        self._num_errors_lock = threading.Lock()
+
+    def _record_error(self):
+        with self._num_errors_lock:
+            self.num_errors += 1
+
+    def _serialize(self, value):
+        """Returns `value` pickled, or None if it can't be pickled
+        """
+        try:
+            data = pickle.dumps(value)
+        except Exception:
+            self._record_error()
+            data = None
+        return data
+
+    def _deserialize(self, key, data):
+        """Returns the value unpickled from `data`, stored at `key`, or `CACHE_MISS` (deleting `key`) if it can't be
+        """
+        try:
+            value = pickle.loads(data)
+        except Exception:
+            self._record_error()
+            self.delete(key)
+            value = CACHE_MISS
+        return value
+
+    def get(self, key):
+        raise Exception('Not implemented')
+
+    def set(self, key, value, ttl=None):
+        raise Exception('Not implemented')
+
+    def delete(self, key):
+        raise Exception('Not implemented')
+
+    def delete_prefix(self, prefix):
+        """Deletes all keys starting with `prefix`
+        """
+        raise Exception('Not implemented')
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process LRU cache, with TTLs
+    """
+    def __init__(self, maxsize=1024):
+        super(LRUCacheBackend, self).__init__()
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                value = CACHE_MISS
+            else:
+                expires_at, value = entry
+                if expires_at is not None and expires_at <= time.time():
+                    del self._entries[key]
+                    value = CACHE_MISS
+                else:
+                    self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value, )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache persisted to an SQLite file, shared by every process on this host
+    """
+    TABLE_NAME = 'cache'
+
+    def __init__(self, db_file):
+        super(SQLiteCacheBackend, self).__init__()
+        self.db_file = db_file
+
+        with self._connect() as conn, conn:
+            conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self.TABLE_NAME}(key VARCHAR PRIMARY KEY, value BLOB, expires_at REAL)"""
+            )
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=10)
+        return closing(conn)
+
+    def get(self, key):
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    f"""SELECT value, expires_at FROM {self.TABLE_NAME} WHERE key = ?""",
+                    (key, )
+                ).fetchone()
+        except sqlite3.Error:
+            self._record_error()
+            row = None
+
+        if row is None:
+            value = CACHE_MISS
+        else:
+            data, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                self.delete(key)
+                value = CACHE_MISS
+            else:
+                value = self._deserialize(key, data)
+
+        return value
+
+    def set(self, key, value, ttl=None):
+        data = self._serialize(value)
+        if data is None:
+            return
+
+        expires_at = time.time() + ttl if ttl else None
+        try:
+            with self._connect() as conn, conn:
+                conn.execute(
+                    f"""INSERT OR REPLACE INTO {self.TABLE_NAME} (key, value, expires_at) VALUES (?, ?, ?)""",
+                    (key, data, expires_at, )
+                )
+        except sqlite3.Error:
+            self._record_error()
+
+    def delete(self, key):
+        try:
+            with self._connect() as conn, conn:
+                conn.execute(f"""DELETE FROM {self.TABLE_NAME} WHERE key = ?""", (key, ))
+        except sqlite3.Error:
+            self._record_error()
+
+    def delete_prefix(self, prefix):
+        try:
+            with self._connect() as conn, conn:
+                conn.execute(
+                    f"""DELETE FROM {self.TABLE_NAME} WHERE substr(key, 1, ?) = ?""",
+                    (len(prefix), prefix, )
+                )
+        except sqlite3.Error:
+            self._record_error()
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache stored on a server speaking the Redis protocol (RESP)
+
+    Only `GET`, `SET ... EX`, `DEL`, `SCAN`, `AUTH` and `SELECT` are used,
+    so any RESP-compatible server (Redis, KeyDB, Valkey, a local stand-in) works.
+
+    `url` is of the form `redis://[:password@]host[:port][/db]`
+    """
+    def __init__(self, url, socket_timeout=1.0):
+        super(RedisCacheBackend, self).__init__()
+
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.socket_timeout = socket_timeout
+
+        self._lock = threading.Lock()
+        self._sock = None
+        self._reader = None
+        self._pid = os.getpid()
+
+    ##
+    # Protocol
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port, ), timeout=self.socket_timeout)
+        self._reader = self._sock.makefile('rb')
+        if self.password:
+            self._send_command('AUTH', self.password)
+        if self.db:
+            self._send_command('SELECT', self.db)
+
+    def _disconnect(self):
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    def _send_command(self, *args):
+        parts = [f'*{len(args)}\r\n'.encode()]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode('utf-8')
+            parts.append(f'${len(arg)}\r\n'.encode())
+            parts.append(arg)
+            parts.append(b'\r\n')
+        self._sock.sendall(b''.join(parts))
+        reply = self._read_reply()
+        return reply
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError('Connection closed by server')
+
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b'+':
+            reply = payload.decode('utf-8')
+        elif prefix == b'-':
+            raise RedisError(payload.decode('utf-8'))
+        elif prefix == b':':
+            reply = int(payload)
+        elif prefix == b'$':
+            length = int(payload)
+            if length == -1:
+                reply = None
+            else:
+                reply = self._reader.read(length + 2)[:-2]
+        elif prefix == b'*':
+            length = int(payload)
+            reply = None if length == -1 else [self._read_reply() for i in range(length)]
+        else:
+            raise RedisError(f'Unexpected reply: {line!r}')
+
+        return reply
+
+    def execute(self, *args):
+        """Executes a command, reconnecting once if the connection was dropped
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # the connection was inherited from a parent process (e.g. a pre-forking web server) and
+                # stays the parent's; open a new one rather than interleave commands on the same socket
+                self._sock = None
+                self._reader = None
+                self._pid = os.getpid()
+
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    reply = self._send_command(*args)
+                    break
+                except (OSError, ConnectionError):
+                    self._disconnect()
+                    if attempt > 0:
+                        raise
+        return reply
+
+    ##
+    # Cache operations
+
+    def get(self, key):
+        try:
+            data = self.execute('GET', key)
+        except (OSError, ConnectionError, RedisError):
+            self._record_error()
+            data = None
+
+        value = CACHE_MISS if data is None else self._deserialize(key, data)
+        return value
+
+    def set(self, key, value, ttl=None):
+        data = self._serialize(value)
+        if data is None:
+            return
+
+        args = ['SET', key, data]
+        if ttl:
+            args.extend(['EX', int(ttl)])
+        try:
+            self.execute(*args)
+        except (OSError, ConnectionError, RedisError):
+            self._record_error()
+
+    def delete(self, key):
+        try:
+            self.execute('DEL', key)
+        except (OSError, ConnectionError, RedisError):
+            self._record_error()
+
+    def delete_prefix(self, prefix):
+        # `SCAN MATCH` takes a glob pattern, so the prefix is matched literally
+        pattern = ''.join(f'\\{c}' if c in '*?[]\\' else c for c in prefix) + '*'
+        try:
+            cursor = '0'
+            while True:
+                cursor, keys = self.execute('SCAN', cursor, 'MATCH', pattern, 'COUNT', 100)
+                cursor = cursor.decode('utf-8')
+                if keys:
+                    self.execute('DEL', *keys)
+                if cursor == '0':
+                    break
+        except (OSError, ConnectionError, RedisError):
+            self._record_error()
+
+
+CACHE_BACKENDS = {
+    'lru': LRUCacheBackend,
+    'sqlite': SQLiteCacheBackend,
+    'redis': RedisCacheBackend,
+}
@@ -0,0 +1,208 @@
+# Python Standard Library Imports
+import functools
+import threading
+
+# Phablytics Imports
+import phablytics
+from phablytics.cache.backends import (
+    CACHE_BACKENDS,
+    CACHE_MISS,
+    LRUCacheBackend,
+)
+from phablytics.settings import (
+    CACHE_BACKEND,
+    CACHE_DEFAULT_TTL,
+    CACHE_KEY_PREFIX,
+    CACHE_LRU_MAXSIZE,
+    CACHE_REDIS_URL,
+    CACHE_SQLITE_DB_FILE,
+    CACHE_TTLS,
+)
+
+
+# isort: off
+
+
+_BACKENDS = {}
+_BACKENDS_LOCK = threading.Lock()
+
+# name of the backend used by `cached()` functions, see `set_cache_backend()`
+_BACKEND_NAME = CACHE_BACKEND
+
+CACHED_FUNCTIONS = {}
+
+# hit/miss counters of caches other than `cached()` functions, see `register_cache_stats()`
+CACHE_STATS = {}
+
+# functions dropping all entries of caches other than `cached()` functions, see `register_cache_stats()`
+CACHE_INVALIDATORS = {}
+
+
+def get_cache_backend(local=False):
+    """Returns the configured cache backend (`CACHE_BACKEND`, unless changed by `set_cache_backend()`)
+
+    If `local` is True, returns the in-process LRU backend instead,
+    regardless of the configured backend.
+    """
+    backend_name = 'lru' if local else _BACKEND_NAME
+
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(backend_name)
+        if backend is None:
+            if backend_name == 'lru':
+                backend = LRUCacheBackend(maxsize=CACHE_LRU_MAXSIZE)
+            elif backend_name == 'sqlite':
+                backend = CACHE_BACKENDS[backend_name](CACHE_SQLITE_DB_FILE)
+            elif backend_name == 'redis':
+                backend = CACHE_BACKENDS[backend_name](CACHE_REDIS_URL)
+            else:
+                raise Exception(f'Invalid cache backend: {backend_name}')
+
+            _BACKENDS[backend_name] = backend
+
+    return backend
+
+
+def set_cache_backend(backend_name):
+    """Uses the backend `backend_name` instead of `CACHE_BACKEND` from now on
+
+    E.g. a backend shared by several processes, see `WEB_SHARED_CACHE_BACKEND`.
+    """
+    global _BACKEND_NAME
+
+    if backend_name not in CACHE_BACKENDS:
+        raise Exception(f'Invalid cache backend: {backend_name}')
+
+    _BACKEND_NAME = backend_name
+
+
+class CacheStats:
+    """Hit/miss counters, safe to update from several threads
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hits=0, misses=0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        rate = 1.0 * self.hits / total if total else 0
+        return rate
+
+    def as_dict(self):
+        data = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+        }
+        return data
+
+
+def cached(name=None, ttl=None, local=False):
+    """Decorator which caches the return value of a function by its arguments
+
+    - `name`: cache name, defaults to the function name
+    - `ttl`: time to live in seconds, defaults to `CACHE_TTLS[name]`, then `CACHE_DEFAULT_TTL`
+    - `local`: always use the in-process LRU backend; use for values read in hot loops
+
+    The decorated function gains:
+    - `invalidate(*args, **kwargs)`: drops the entry for a particular set of arguments
+    - `invalidate_all()`: drops all entries for the function
+    - `cache_stats`: hit/miss counters for this process
+    """
+    def decorator(f):
+        cache_name = name or f.__name__
+        # versioned, so that entries persisted by a previous release (e.g. in a SQLite or Redis
+        # cache surviving a deploy) are not read back, in case cached classes have changed
+        key_prefix = f'{CACHE_KEY_PREFIX}{phablytics.__version__}:{cache_name}:'
+
+        def _make_key(args, kwargs):
+            key = f'{key_prefix}{args!r}:{sorted(kwargs.items())!r}'
+            return key
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            backend = get_cache_backend(local=local)
+            key = _make_key(args, kwargs)
+
+            value = backend.get(key)
+            if value is CACHE_MISS:
+                wrapper.cache_stats.record(misses=1)
+                value = f(*args, **kwargs)
+                backend.set(key, value, ttl=wrapper.ttl)
+            else:
+                wrapper.cache_stats.record(hits=1)
+
+            return value
+
+        def invalidate(*args, **kwargs):
+            get_cache_backend(local=local).delete(_make_key(args, kwargs))
+
+        def invalidate_all():
+            get_cache_backend(local=local).delete_prefix(key_prefix)
+
+        wrapper.ttl = ttl if ttl is not None else CACHE_TTLS.get(cache_name, CACHE_DEFAULT_TTL)
+        wrapper.invalidate = invalidate
+        wrapper.invalidate_all = invalidate_all
+        wrapper.cache_stats = CacheStats()
+
+        CACHED_FUNCTIONS[cache_name] = wrapper
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_caches(names=None):
+    """Drops all cached entries for the cached functions `names`, or all cached functions
+
+    Caches registered with an `invalidate_all`, see `register_cache_stats()`, are included.
+    """
+    names = list(CACHED_FUNCTIONS.keys()) + list(CACHE_INVALIDATORS.keys()) if names is None else names
+    for name in names:
+        if name in CACHED_FUNCTIONS:
+            CACHED_FUNCTIONS[name].invalidate_all()
+        else:
+            CACHE_INVALIDATORS[name]()
+
+
+def register_cache_stats(name, invalidate_all=None):
+    """Returns the hit/miss counters for a cache other than a `cached()` function,
+    reported by `get_cache_stats()` as `name`
+
+    If given, `invalidate_all()` is called by `invalidate_caches()` to drop all of its entries.
+    """
+    stats = CACHE_STATS.setdefault(name, CacheStats())
+    if invalidate_all is not None:
+        CACHE_INVALIDATORS[name] = invalidate_all
+    return stats
+
+
+def get_cache_stats():
+    """Returns hit/miss statistics for every cached function, and other registered caches,
+    and the number of errors of each cache backend in use
+    """
+    stats = {
+        name: f.cache_stats.as_dict()
+        for name, f
+        in CACHED_FUNCTIONS.items()
+    }
+    stats.update({
+        name: cache_stats.as_dict()
+        for name, cache_stats
+        in CACHE_STATS.items()
+    })
+    stats.update({
+        f'backend:{backend_name}': {
+            'num_errors': backend.num_errors,
+        }
+        for backend_name, backend
+        in _BACKENDS.items()
+    })
+    return stats
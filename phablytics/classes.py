@@ -1,7 +1,7 @@
 # Python Standard Library Imports
 import datetime
 import re
-from functools import cached_property
+import sys
 
 # Third Party (PyPI) Imports
 import markdown
@@ -27,7 +27,17 @@ DATE_FORMAT = '%Y-%m-%d'
 # isort: off
 
 
+def _intern(value):
+    """Interns strings (PHIDs, statuses, ...) repeated across many entities, so that only one copy is kept
+    """
+    interned = sys.intern(value) if isinstance(value, str) else value
+    return interned
+
+
 class PhabricatorEntity:
+    # subclasses without `__slots__` (most of them) still get a `__dict__`
+    __slots__ = ('raw_data', )
+
     def __init__(self, raw_data):
         self.raw_data = raw_data
 
@@ -126,10 +136,118 @@ class PhabricatorEntity:
 
 
 class Maniphest(PhabricatorEntity):
+    """A Maniphest task
+
+    The attributes used by reports and metrics are parsed once from the Conduit
+    payload into `__slots__`. The payload itself is kept (as `raw_data`), so that
+    `fields` and `attachments` include everything Conduit returned, e.g. `priority`,
+    `description` and custom fields, unless `keep_raw_data` is False. Metrics,
+    which hold tens of thousands of tasks, use that to keep them compact;
+    `fields` and `attachments` then only have the parsed attributes.
+    """
+    __slots__ = (
+        'id_',
+        'phid',
+        'type_',
+        'name',
+        'status_value',
+        'status_name',
+        'subtype',
+        'points',
+        'created_ts',
+        'modified_ts',
+        'closed_ts',
+        'author_phid',
+        'owner_phid',
+        'closer_phid',
+        'project_phids',
+        'board_column_phids',
+        # computed on first access
+        '_created_at',
+        '_closed_at',
+        '_projects',
+        '_services',
+        '_customers',
+    )
+
+    def __init__(self, raw_data, keep_raw_data=True):
+        super(Maniphest, self).__init__(raw_data if keep_raw_data else None)
+
+        fields = raw_data['fields']
+        status = fields['status']
+
+        self.id_ = raw_data['id']
+        self.phid = _intern(raw_data['phid'])
+        self.type_ = _intern(raw_data.get('type'))
+        self.name = fields['name']
+        self.status_value = _intern(status['value'])
+        self.status_name = _intern(status.get('name'))
+        self.subtype = _intern(fields.get('subtype'))
+        self.points = float(fields['points'] or 0)
+        self.created_ts = fields['dateCreated']
+        self.modified_ts = fields['dateModified']
+        self.closed_ts = fields['dateClosed']
+        self.author_phid = _intern(fields['authorPHID'])
+        self.owner_phid = _intern(fields['ownerPHID'])
+        self.closer_phid = _intern(fields.get('closerPHID'))
+        self.project_phids = tuple(
+            _intern(phid)
+            for phid
+            in raw_data.get('attachments', {}).get('projects', {}).get('projectPHIDs', [])
+        )
+        # (project PHID, column PHID) of the workboard columns the task is in, if columns were attached
+        boards = raw_data.get('attachments', {}).get('columns', {}).get('boards') or {}
+        self.board_column_phids = tuple(
+            (_intern(project_phid), _intern(column['phid']), )
+            for project_phid, board in boards.items()
+            for column in board['columns']
+        )
+
+        self._created_at = None
+        self._closed_at = None
+        self._projects = None
+        self._services = None
+        self._customers = None
+
     def __str__(self):
         value = f'**[{self.task_id}]({self.url})** {self.name} *({self.status_value}, {self.points} pts)*'
         return value
 
+    def to_raw_data(self):
+        """Returns the Conduit payload, or if it was not kept, an equivalent of the parsed attributes
+        """
+        if self.raw_data is not None:
+            raw_data = self.raw_data
+        else:
+            raw_data = {
+                'id': self.id_,
+                'phid': self.phid,
+                'type': self.type_,
+                'fields': {
+                    'name': self.name,
+                    'status': self.status,
+                    'subtype': self.subtype,
+                    'points': self.points,
+                    'dateCreated': self.created_ts,
+                    'dateModified': self.modified_ts,
+                    'dateClosed': self.closed_ts,
+                    'authorPHID': self.author_phid,
+                    'ownerPHID': self.owner_phid,
+                    'closerPHID': self.closer_phid,
+                },
+                'attachments': {
+                    'projects': {
+                        'projectPHIDs': list(self.project_phids),
+                    },
+                },
+            }
+            if self.board_column_phids:
+                boards = {}
+                for project_phid, column_phid in self.board_column_phids:
+                    boards.setdefault(project_phid, {'columns': []})['columns'].append({'phid': column_phid})
+                raw_data['attachments']['columns'] = {'boards': boards}
+        return raw_data
+
     @property
     def html(self):
         html = markdown.markdown(self.__str__())
@@ -148,45 +266,61 @@ class Maniphest(PhabricatorEntity):
         url = f'{PHABRICATOR_INSTANCE_BASE_URL}/{self.task_id}'
         return url
 
-    ##
-    # Fields attributes
+    @property
+    def status(self):
+        status = {
+            'value': self.status_value,
+            'name': self.status_name,
+        }
+        return status
 
     @property
-    def author_phid(self):
-        phid = self.fields['authorPHID']
-        return phid
+    def created_at(self):
+        if self._created_at is None:
+            self._created_at = datetime.datetime.fromtimestamp(self.created_ts)
+        return self._created_at
 
     @property
-    def owner_phid(self):
-        owner_phid = self.fields['ownerPHID']
-        return owner_phid
+    def closed_at(self):
+        if self._closed_at is None and self.closed_ts:
+            self._closed_at = datetime.datetime.fromtimestamp(self.closed_ts)
+        return self._closed_at
+
+    ##
+    # Top-level attributes
 
     @property
-    def points(self):
-        points = float(self.fields['points'] or 0)
-        return points
+    def fields(self):
+        fields = self.to_raw_data()['fields']
+        return fields
+
+    @property
+    def attachments(self):
+        attachments = self.to_raw_data().get('attachments', {})
+        return attachments
 
     ##
     # Nested attributes
 
     @property
-    def project_phids(self):
-        project_phids = [
-            phid
-            for phid
-            in self.attachments.get('projects', {}).get('projectPHIDs', [])
-        ]
-        return project_phids
+    def column_phids(self):
+        """PHIDs of the workboard columns the task is in
+
+        Only available for tasks fetched with columns attached, see `get_maniphest_tasks()`
+        """
+        phids = [column_phid for _, column_phid in self.board_column_phids]
+        return phids
 
-    @cached_property
+    @property
     def projects(self):
-        from phablytics.utils import lookup_project_by_phid
-        projects = [
-            lookup_project_by_phid(phid)
-            for phid
-            in self.project_phids
-        ]
-        return projects
+        if self._projects is None:
+            from phablytics.utils import lookup_project_by_phid
+            self._projects = [
+                lookup_project_by_phid(phid)
+                for phid
+                in self.project_phids
+            ]
+        return self._projects
 
     ##
     # Derived attributes
@@ -203,19 +337,18 @@ class Maniphest(PhabricatorEntity):
 
         return days
 
-    @cached_property
+    @property
     def services(self):
-        from phablytics.utils import lookup_project_by_phid
+        if self._services is None:
+            self._services = [
+                project
+                for project
+                in self.projects
+                if project and project.name.startswith(SERVICE_PREFIX)
+            ]
+        return self._services
 
-        services = [
-            project
-            for project
-            in self.projects
-            if project and project.name.startswith(SERVICE_PREFIX)
-        ]
-        return services
-
-    @cached_property
+    @property
     def service_name(self):
         if len(self.services) == 1:
             service_name = self.services[0].service_name
@@ -225,19 +358,20 @@ class Maniphest(PhabricatorEntity):
             service_name = None
         return service_name
 
-    @cached_property
+    @property
     def customers(self):
-        from phablytics.utils import is_customer
+        if self._customers is None:
+            from phablytics.utils import is_customer
 
-        customers = [
-            project
-            for project
-            in self.projects
-            if is_customer(project)
-        ]
-        return customers
+            self._customers = [
+                project
+                for project
+                in self.projects
+                if is_customer(project)
+            ]
+        return self._customers
 
-    @cached_property
+    @property
     def customer_name(self):
         if len(self.customers) == 1:
             customer_name = self.customers[0].customer_name
@@ -323,6 +457,122 @@ class Repo(PhabricatorEntity):
 
 
 class Revision(PhabricatorEntity):
+    """A Differential revision
+
+    Like `Maniphest`, parsed once into `__slots__`; the payload is kept unless `keep_raw_data` is False.
+    """
+    __slots__ = (
+        'id_',
+        'phid',
+        'type_',
+        'title',
+        'status_value',
+        'status_name',
+        'created_ts',
+        'modified_ts',
+        'author_phid',
+        'repo_phid',
+        'reviewers',
+        # reviewer state, classified once from `reviewers`
+        'reviewer_phids',
+        'acceptor_phids',
+        'group_acceptor_phids',
+        'blocker_phids',
+        'group_blocker_phids',
+        '_reviewer_phid_set',
+    )
+
+    def __init__(self, raw_data, keep_raw_data=True):
+        super(Revision, self).__init__(raw_data if keep_raw_data else None)
+
+        fields = raw_data['fields']
+        status = fields['status']
+
+        self.id_ = raw_data['id']
+        self.phid = _intern(raw_data['phid'])
+        self.type_ = _intern(raw_data.get('type'))
+        self.title = fields['title'].strip()
+        self.status_value = _intern(status['value'])
+        self.status_name = _intern(status.get('name'))
+        self.created_ts = fields['dateCreated']
+        self.modified_ts = fields['dateModified']
+        self.author_phid = _intern(fields['authorPHID'])
+        self.repo_phid = _intern(fields['repositoryPHID'])
+        self.reviewers = [
+            {
+                'reviewerPHID': _intern(reviewer['reviewerPHID']),
+                'status': _intern(reviewer.get('status')),
+                'isBlocking': reviewer.get('isBlocking', False),
+            }
+            for reviewer
+            in raw_data.get('attachments', {}).get('reviewers', {}).get('reviewers', [])
+        ]
+        self._classify_reviewers()
+
+    def _classify_reviewers(self):
+        """Classifies `reviewers` once, so that reviewer predicates don't rescan them
+
+        User reviewers are told apart from group (PROJ) reviewers by their PHID.
+        """
+        reviewer_phids = []
+        acceptor_phids = []
+        group_acceptor_phids = []
+        blocker_phids = []
+        group_blocker_phids = []
+
+        for reviewer in self.reviewers:
+            phid = reviewer['reviewerPHID']
+            status = reviewer['status']
+            is_user = 'USER' in phid
+
+            reviewer_phids.append(phid)
+
+            if status == 'accepted':
+                group_acceptor_phids.append(phid)
+                if is_user:
+                    acceptor_phids.append(phid)
+
+            if reviewer['isBlocking']:
+                group_blocker_phids.append(phid)
+                blocker_phids.append(phid)
+            elif status in ('blocking', 'rejected', ):
+                group_blocker_phids.append(phid)
+                if is_user:
+                    blocker_phids.append(phid)
+
+        self.reviewer_phids = tuple(reviewer_phids)
+        self.acceptor_phids = tuple(acceptor_phids)
+        self.group_acceptor_phids = tuple(group_acceptor_phids)
+        self.blocker_phids = tuple(blocker_phids)
+        self.group_blocker_phids = tuple(group_blocker_phids)
+        self._reviewer_phid_set = frozenset(reviewer_phids)
+
+    def to_raw_data(self):
+        """Returns the Conduit payload, or if it was not kept, an equivalent of the parsed attributes
+        """
+        if self.raw_data is not None:
+            raw_data = self.raw_data
+        else:
+            raw_data = {
+                'id': self.id_,
+                'phid': self.phid,
+                'type': self.type_,
+                'fields': {
+                    'title': self.title,
+                    'status': self.status,
+                    'dateCreated': self.created_ts,
+                    'dateModified': self.modified_ts,
+                    'authorPHID': self.author_phid,
+                    'repositoryPHID': self.repo_phid,
+                },
+                'attachments': {
+                    'reviewers': {
+                        'reviewers': self.reviewers,
+                    },
+                },
+            }
+        return raw_data
+
     ##
     # Primary attributes
 
@@ -337,36 +587,29 @@ class Revision(PhabricatorEntity):
         return url
 
     @property
-    def repo_phid(self):
-        phid = self.fields['repositoryPHID']
-        return phid
+    def status(self):
+        status = {
+            'value': self.status_value,
+            'name': self.status_name,
+        }
+        return status
+
+    ##
+    # Top-level attributes
 
     @property
-    def title(self):
-        title = self.fields['title'].strip()
-        return title
+    def fields(self):
+        fields = self.to_raw_data()['fields']
+        return fields
 
     @property
-    def author_phid(self):
-        phid = self.fields['authorPHID']
-        return phid
+    def attachments(self):
+        attachments = self.to_raw_data().get('attachments', {})
+        return attachments
 
     ##
     # Nested attributes
 
-    @property
-    def reviewers(self):
-        reviewers = self.attachments['reviewers']['reviewers']
-        return reviewers
-
-    @property
-    def reviewer_phids(self):
-        """Gets the reviewer PHIDs for this revision
-        """
-        reviewers = self.reviewers
-        phids = [reviewer['reviewerPHID'] for reviewer in reviewers]
-        return phids
-
     @property
     def is_accepted(self):
         is_accepted = self.status_value == 'accepted'
@@ -378,32 +621,10 @@ class Revision(PhabricatorEntity):
     def get_acceptor_phids(self, include_groups=False):
         """Get PHIDs of accepting reviewer entities
 
-        If `include_groups` is True, only include USER reviewers,
-        else, also includes group (PROJ) reviewers.
+        If `include_groups` is True, also includes group (PROJ) reviewers,
+        else, only includes USER reviewers.
         """
-        reviewers = self.reviewers
-        phids = [
-            reviewer['reviewerPHID']
-            for reviewer
-            in reviewers
-            if (
-                reviewer.get('status') == 'accepted'
-                and (
-                    include_groups
-                    or 'USER' in reviewer['reviewerPHID']
-                )
-            )
-        ]
-        return phids
-
-    @property
-    def acceptor_phids(self):
-        phids = self.get_acceptor_phids(include_groups=False)
-        return phids
-
-    @property
-    def group_acceptor_phids(self):
-        phids = self.get_acceptor_phids(include_groups=True)
+        phids = self.group_acceptor_phids if include_groups else self.acceptor_phids
         return phids
 
     @property
@@ -412,41 +633,10 @@ class Revision(PhabricatorEntity):
 
     def get_blocker_phids(self, include_groups=False):
         """Get PHIDs of blocking reviewer entities
-        """
-        def _is_blocking(reviewer):
-            is_blocking = False
-            if reviewer.get('isBlocking'):
-                is_blocking = True
-            elif (
-                reviewer['status'] in ['blocking', 'rejected']
-                and (
-                    include_groups
-                    or 'USER' in reviewer['reviewerPHID']
-                )
-            ):
-                is_blocking = True
-            else:
-                pass
-
-            return is_blocking
-
-        reviewers = self.reviewers
-        phids = [
-            reviewer['reviewerPHID']
-            for reviewer
-            in reviewers
-            if _is_blocking(reviewer)
-        ]
-        return phids
-
-    @property
-    def blocker_phids(self):
-        phids = self.get_blocker_phids(include_groups=False)
-        return phids
 
-    @property
-    def group_blocker_phids(self):
-        phids = self.get_blocker_phids(include_groups=True)
+        Reviewers marked as blocking are always included, whether users or groups.
+        """
+        phids = self.group_blocker_phids if include_groups else self.blocker_phids
         return phids
 
     @property
@@ -459,35 +649,21 @@ class Revision(PhabricatorEntity):
         Accepting reviewers must be:
         - actual users, not groups
         - not a member of the blocking reviewer group (not in `user_phids`)
-        """
-        non_group_acceptances = 0
 
-        user_phids_set = set(user_phids)
-        for reviewer in self.reviewers:
-            reviewer_phid = reviewer['reviewerPHID']
-            if (
-                reviewer_phid not in user_phids_set
-                and 'USER' in reviewer_phid
+        Pass `user_phids` as a frozenset when checking many revisions against the same group.
+        """
+        user_phids_set = user_phids if isinstance(user_phids, frozenset) else frozenset(user_phids)
 
-                and reviewer.get('status') == 'accepted'
-            ):
+        non_group_acceptances = 0
+        for reviewer_phid in self.acceptor_phids:
+            if reviewer_phid not in user_phids_set:
                 non_group_acceptances += 1
-        else:
-            pass
 
         has_sufficient_acceptances = non_group_acceptances >= acceptance_threshold
         return has_sufficient_acceptances
 
     def has_reviewer_among_group(self, user_phids):
-        has_reviewer = False
-
-        user_phids_set = set(user_phids)
-
-        for reviewer in self.reviewers:
-            if reviewer['reviewerPHID'] in user_phids_set:
-                has_reviewer = True
-                break
-
+        has_reviewer = not self._reviewer_phid_set.isdisjoint(user_phids)
         return has_reviewer
 
     ##
@@ -495,7 +671,7 @@ class Revision(PhabricatorEntity):
 
     @property
     def meets_acceptance_criteria(self):
-        value = self.is_accepted and len(self.acceptor_phids) >= REVISION_ACCEPTANCE_THRESHOLD
+        value = self.is_accepted and self.num_acceptors >= REVISION_ACCEPTANCE_THRESHOLD
         return value
 
     @property
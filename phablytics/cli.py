@@ -1,11 +1,21 @@
 # Python Standard Library Imports
 import argparse
 import pprint
+import sys
+import time
 
 # Third Party (PyPI) Imports
 from htk.utils.slack import send_messages_as_thread
 
 # Local Imports
+from .cache import (
+    get_cache_stats,
+    invalidate_caches,
+)
+from .reports.runner import (
+    format_report_runs_summary,
+    run_reports,
+)
 from .reports.utils import (
     get_report_config,
     get_report_names,
@@ -13,6 +23,9 @@ from .reports.utils import (
 )
 from .utils import (
     adhoc,
+    get_conduit_stats,
+    sync_differential_revisions,
+    sync_maniphest_tasks,
     whoami,
 )
 
@@ -25,6 +38,11 @@ class PhablyticsCLI:
     def execute(self):
         self.parse_args()
 
+        num_failed_reports = 0
+
+        if self.clear_cache:
+            invalidate_caches()
+
         if self.test:
             pass
         elif self.adhoc:
@@ -33,11 +51,17 @@ class PhablyticsCLI:
         elif self.whoami:
             user = whoami()
             pprint.pprint(user.raw_data)
+        elif self.sync:
+            sync_runs = {
+                'maniphest': sync_maniphest_tasks(),
+                'differential': sync_differential_revisions(),
+            }
+            pprint.pprint(sync_runs)
         elif self.report_name:
             report_config = get_report_config(self.report_name, self)
             report_class = self.report_types.get(report_config.report_type)
             if report_class:
-                report = report_class(report_config).generate_report(save_last_run=True)
+                report = report_class(report_config).generate_report(save_last_run=True, save_output=True)
                 if report_config.slack:
                     slack_channel = report_config.slack_channel
                     send_messages_as_thread(report, channel=slack_channel)
@@ -45,6 +69,44 @@ class PhablyticsCLI:
                     print(report)
             else:
                 raise Exception(f'Invalid report type: {report_config.report_type}')
+        elif self.all or self.reports:
+            num_failed_reports = self.run_reports()
+
+        if self.conduit_stats:
+            pprint.pprint(get_conduit_stats())
+
+        if self.cache_stats:
+            pprint.pprint(get_cache_stats())
+
+        if num_failed_reports > 0:
+            sys.exit(1)
+
+    def run_reports(self):
+        """Runs several reports concurrently, then prints a timing and failure summary
+
+        Returns the number of failed reports.
+        """
+        if self.all:
+            report_names = self.report_names
+        else:
+            report_names = [report_name.strip() for report_name in self.reports.split(',') if report_name.strip()]
+            invalid_report_names = sorted(set(report_names) - set(self.report_names))
+            if invalid_report_names:
+                self.arg_parser.error(f"invalid report names: {', '.join(invalid_report_names)}")
+
+        start = time.perf_counter()
+        runs, prefetch = run_reports(report_names, overrides=self, max_workers=self.workers)
+        total_seconds = time.perf_counter() - start
+
+        for run in runs:
+            if run.is_success and not run.sent_to_slack:
+                print(run.report)
+                print()
+
+        print(format_report_runs_summary(runs, prefetch=prefetch, total_seconds=total_seconds))
+
+        num_failed = len([run for run in runs if not run.is_success])
+        return num_failed
 
     def parse_args(self):
         arg_parser = argparse.ArgumentParser(description='Phablytics report generator.')
@@ -55,6 +117,23 @@ class PhablyticsCLI:
             choices=report_name_choices,
             required=False
         )
+        arg_parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Runs all configured reports concurrently.',
+            required=False
+        )
+        arg_parser.add_argument(
+            '--reports',
+            help='Runs a comma-separated list of reports concurrently, e.g. `--reports a,b,c`.',
+            required=False
+        )
+        arg_parser.add_argument(
+            '--workers',
+            type=int,
+            help='Max number of reports generated concurrently, used with --all or --reports.',
+            required=False
+        )
         arg_parser.add_argument(
             '--slack',
             action='store_true',
@@ -88,6 +167,30 @@ class PhablyticsCLI:
             help='Runs whoami.',
             required=False
         )
+        arg_parser.add_argument(
+            '--sync',
+            action='store_true',
+            help='Incrementally syncs the local Maniphest and Differential mirrors.',
+            required=False
+        )
+        arg_parser.add_argument(
+            '--conduit-stats',
+            action='store_true',
+            help='Prints Conduit connection reuse counters after running.',
+            required=False
+        )
+        arg_parser.add_argument(
+            '--clear-cache',
+            action='store_true',
+            help='Clears cached Conduit results (projects, customers, PHIDs, ...) before running.',
+            required=False
+        )
+        arg_parser.add_argument(
+            '--cache-stats',
+            action='store_true',
+            help='Prints cache hit/miss statistics after running.',
+            required=False
+        )
 
         cli_args = arg_parser.parse_args(namespace=self)
         self.arg_parser = arg_parser
@@ -14,6 +14,9 @@ MANIPHEST_STATUSES_CLOSED = [
     'wontfix',
 ]
 
+# `assigned` constraint token for tasks without an owner
+MANIPHEST_ASSIGNED_NONE = 'none()'
+
 MANIPHEST_SUBTYPES = [
     'bug',
     'default',
@@ -14,3 +14,25 @@ INTERVAL_DAYS_MAP = {
     'quarter': 90,
 }
 DEFAULT_INTERVAL_DAYS = INTERVAL_DAYS_MAP[DEFAULT_INTERVAL_OPTION]
+
+# `maniphest.search` subtypes for each of `phablytics.metrics.metrics.Metrics`
+METRIC_TASK_SUBTYPES = {
+    'alltasks': [
+        'bug',
+        'default',
+        'feature',
+        'story',
+    ],
+    'bugs': [
+        'bug',
+    ],
+    'features': [
+        'feature',
+    ],
+    'stories': [
+        'story',
+    ],
+    'tasks': [
+        'default',
+    ],
+}
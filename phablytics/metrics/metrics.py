@@ -1,7 +1,11 @@
 # Python Standard Library Imports
 import datetime
 import pprint
-from dataclasses import dataclass
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
 
 # Third Party (PyPI) Imports
 import numpy
@@ -11,18 +15,29 @@ from phablytics.constants import (
     MANIPHEST_STATUSES_CLOSED,
     MANIPHEST_STATUSES_OPEN,
 )
+from phablytics.metrics.columns import TaskColumns
 from phablytics.metrics.constants import (
     DATE_FORMAT_MDY_SHORT,
-    DEFAULT_INTERVAL_DAYS,
-    INTERVAL_DAYS_MAP,
+    METRIC_TASK_SUBTYPES,
 )
 from phablytics.metrics.stats import TaskMetricsStats
+from phablytics.metrics.utils import make_intervals
+from phablytics.repos import (
+    maniphest_task_repo,
+    metric_result_repo,
+)
+from phablytics.settings import (
+    MANIPHEST_MIRROR_ENABLED,
+    METRICS_BUCKET_INTERVALS_LOCALLY,
+    METRICS_RESULTS_CACHE_ENABLED,
+    METRICS_RESULTS_TTL,
+)
 from phablytics.utils import (
+    ensure_maniphest_mirror_is_fresh,
     get_bulk_projects_by_name,
     get_customer_project,
     get_project_by_name,
-    get_tasks_closed_over_period,
-    get_tasks_created_over_period,
+    get_tasks_created_and_closed_over_periods,
     get_user_by_username,
     pluralize,
 )
@@ -55,9 +70,18 @@ class TaskMetric(
     period_end: datetime.datetime
     tasks_created: list
     tasks_closed: list
+    # columnar views of `tasks_created` and `tasks_closed`; built from them if not provided
+    created_columns: TaskColumns = field(default=None, repr=False)
+    closed_columns: TaskColumns = field(default=None, repr=False)
 
     """Tracks tasks opened vs closed over time.
     """
+    def __post_init__(self):
+        if self.created_columns is None:
+            self.created_columns = TaskColumns.from_tasks(self.tasks_created)
+        if self.closed_columns is None:
+            self.closed_columns = TaskColumns.from_tasks(self.tasks_closed)
+
     def as_dict(self):
         data = {
             'period_name': self.period_name,
@@ -77,22 +101,22 @@ class TaskMetric(
 
     @property
     def num_created(self) -> int:
-        num_created = len(self.tasks_created)
+        num_created = len(self.created_columns)
         return num_created
 
     @property
     def num_closed(self) -> int:
-        num_closed = len(self.tasks_closed)
+        num_closed = len(self.closed_columns)
         return num_closed
 
     @property
     def points_added(self) -> int:
-        points = sum([task.points for task in self.tasks_created])
+        points = self.created_columns.points.sum().item() if self.num_created else 0
         return points
 
     @property
     def points_completed(self) -> int:
-        points = sum([task.points for task in self.tasks_closed])
+        points = self.closed_columns.points.sum().item() if self.num_closed else 0
         return points
 
     ##
@@ -113,8 +137,8 @@ class TaskMetric(
 
     @property
     def mean_days_to_resolution(self) -> float:
-        values = [task.days_to_resolution for task in self.tasks_closed]
-        mean_days = numpy.mean(values) if values else 0
+        values = self.closed_columns.days_to_resolution
+        mean_days = numpy.mean(values) if len(values) else 0
         return mean_days
 
     ##
@@ -122,7 +146,7 @@ class TaskMetric(
 
     @property
     def days_to_resolution_per_point(self) -> float:
-        days = sum([task.days_to_resolution for task in self.tasks_closed])
+        days = self.closed_columns.days_to_resolution.sum().item()
         days_per_story_point = 1.0 * days / max(self.points_completed, 1)
         return days_per_story_point
 
@@ -195,7 +219,61 @@ class Metrics:
         if period_start >= period_end:
             raise Exception('period_start must be before period_end')
 
-        interval_days = INTERVAL_DAYS_MAP.get(interval, DEFAULT_INTERVAL_DAYS)
+        results_key = {
+            'subtypes': ','.join(sorted(task_subtypes)),
+            'team': team or '',
+            'customer': customer or '',
+            'projects': projects or '',
+            'username': username or '',
+        }
+
+        team_member_phids, project_phids = self._resolve_filters(
+            team=team,
+            customer=customer,
+            projects=projects,
+            username=username
+        )
+
+        intervals = make_intervals(period_start, period_end, interval)
+
+        tasks_by_interval = self._retrieve_materialized_tasks_by_interval(
+            results_key,
+            intervals,
+            task_subtypes,
+            user_phids=team_member_phids,
+            project_phids=project_phids
+        )
+
+        for (start, end), (created_columns, closed_columns) in zip(intervals, tasks_by_interval):
+            period_name = '{} to {}'.format(
+                start.strftime(DATE_FORMAT_MDY_SHORT),
+                end.strftime(DATE_FORMAT_MDY_SHORT)
+            )
+
+            task_metric = TaskMetric(
+                period_name=period_name,
+                period_start=start,
+                period_end=end,
+                tasks_created=created_columns.tasks,
+                tasks_closed=closed_columns.tasks,
+                created_columns=created_columns,
+                closed_columns=closed_columns
+            )
+            task_metrics.append(task_metric)
+
+        stats = TaskMetricsStats(task_metrics)
+
+        return stats
+
+    def _resolve_filters(
+        self,
+        team: str=None,
+        customer: str=None,
+        projects: str=None,
+        username: str=None
+    ):
+        """Resolves filter params into `(user_phids, project_phids)`
+        """
         if team:
             project = get_project_by_name(team, include_members=True)
             team_member_phids = project.member_phids
@@ -216,167 +294,137 @@ class Metrics:
             projects = get_bulk_projects_by_name(project_names)
             project_phids.extend([project.phid for project in projects])
 
-        end = period_end
-
         if username:
             user = get_user_by_username(username)
             team_member_phids = [user.phid]
 
-        # TODO: implement make_intervals(period_start, period_end, interval)
-        while end > period_start:
-            start = end - datetime.timedelta(days=interval_days)
-            period_name = '{} to {}'.format(
-                start.strftime(DATE_FORMAT_MDY_SHORT),
-                end.strftime(DATE_FORMAT_MDY_SHORT)
-            )
+        return team_member_phids, project_phids
 
-            tasks_created = get_tasks_created_over_period(
-                start,
-                end,
-                subtypes=task_subtypes,
-                author_phids=team_member_phids,
-                project_phids=project_phids
-            )
-            tasks_closed = get_tasks_closed_over_period(
-                start,
-                end,
-                subtypes=task_subtypes,
-                closer_phids=team_member_phids,
-                project_phids=project_phids
-            )
-
-            task_metric = TaskMetric(
-                period_name=period_name,
-                period_start=start,
-                period_end=end,
-                tasks_created=tasks_created,
-                tasks_closed=tasks_closed
-            )
-            task_metrics.append(task_metric)
+    def _retrieve_tasks_by_interval(
+        self,
+        intervals: list,
+        task_subtypes: list[str],
+        user_phids: list=None,
+        project_phids: list=None
+    ):
+        """Retrieves `(created_columns, closed_columns)` for each `(start, end)` in `intervals`
 
-            end = start
+        Each is a `TaskColumns`.
 
-        stats = TaskMetricsStats(task_metrics)
+        With `METRICS_BUCKET_INTERVALS_LOCALLY`, only one created and one closed query
+        are made for the entire period, and tasks are then bucketed into intervals locally.
 
-        return stats
+        Otherwise, the created/closed queries are made for every interval (concurrently).
 
-    def alltasks(
-        self,
-        interval: str,
-        period_start: datetime.datetime,
-        period_end: datetime.datetime,
-        *args,
-        **kwargs
-    ):
-        """Returns the rate of tasks opened/closed over a period
+        Tasks are retrieved without their Conduit payloads, see `Maniphest`.
         """
-        task_subtypes = [
-            'bug',
-            'default',
-            'feature',
-            'story',
-        ]
-        stats = self._retrieve_task_metrics(
-            interval,
-            period_start,
-            period_end,
-            task_subtypes,
-            *args,
-            **kwargs
-        )
-        return stats
+        if METRICS_BUCKET_INTERVALS_LOCALLY:
+            # intervals are ordered most recent first
+            entire_period = (intervals[-1][0], intervals[0][1], )
 
-    def bugs(
-        self,
-        interval: str,
-        period_start: datetime.datetime,
-        period_end: datetime.datetime,
-        *args,
-        **kwargs
-    ):
-        """Returns the rate of bugs opened/closed over a period
-        """
-        task_subtypes = [
-            'bug',
-        ]
-        stats = self._retrieve_task_metrics(
-            interval,
-            period_start,
-            period_end,
-            task_subtypes,
-            *args,
-            **kwargs
-        )
-        return stats
+            (tasks_created, tasks_closed), = get_tasks_created_and_closed_over_periods(
+                [entire_period],
+                subtypes=task_subtypes,
+                user_phids=user_phids,
+                project_phids=project_phids,
+                keep_raw_data=False
+            )
 
-    def features(
-        self,
-        interval,
-        period_start,
-        period_end,
-        *args,
-        **kwargs
-    ):
-        """Returns the rate of features opened/closed over a period
-        """
-        task_subtypes = [
-            'feature',
-        ]
-
-        stats = self._retrieve_task_metrics(
-            interval,
-            period_start,
-            period_end,
-            task_subtypes,
-            *args,
-            **kwargs
-        )
-        return stats
+            created_columns = TaskColumns.from_tasks(tasks_created)
+            closed_columns = TaskColumns.from_tasks(tasks_closed)
 
-    def stories(
+            tasks_by_interval = list(zip(
+                created_columns.bucket_by_intervals(intervals, created_columns.created_ts),
+                closed_columns.bucket_by_intervals(intervals, closed_columns.closed_ts)
+            ))
+        else:
+            tasks_by_interval = [
+                (TaskColumns.from_tasks(tasks_created), TaskColumns.from_tasks(tasks_closed), )
+                for tasks_created, tasks_closed
+                in get_tasks_created_and_closed_over_periods(
+                    intervals,
+                    subtypes=task_subtypes,
+                    user_phids=user_phids,
+                    project_phids=project_phids,
+                    keep_raw_data=False
+                )
+            ]
+
+        return tasks_by_interval
+
+    def _retrieve_materialized_tasks_by_interval(
         self,
-        interval: str,
-        period_start: datetime.datetime,
-        period_end: datetime.datetime,
-        *args,
-        **kwargs
+        results_key: dict,
+        intervals: list,
+        task_subtypes: list[str],
+        user_phids: list=None,
+        project_phids: list=None
     ):
-        """Returns the rate of stories opened/closed over a period
-        """
-        task_subtypes = [
-            'story',
-        ]
-
-        stats = self._retrieve_task_metrics(
-            interval,
-            period_start,
-            period_end,
-            task_subtypes,
-            *args,
-            **kwargs
-        )
-        return stats
+        """Same as `_retrieve_tasks_by_interval()`, but reuses stored results for intervals which have already ended
 
-    def tasks(
-        self,
-        interval: str,
-        period_start: datetime.datetime,
-        period_end: datetime.datetime,
-        *args,
-        **kwargs
-    ):
-        """Returns the rate of tasks opened/closed over a period
+        Intervals which have ended are stored after being computed, keyed by `results_key`
+        and the interval. Only missing, invalidated or still-open intervals are retrieved.
         """
-        task_subtypes = [
-            'default',
-        ]
-
-        stats = self._retrieve_task_metrics(
-            interval,
-            period_start,
-            period_end,
-            task_subtypes,
-            *args,
-            **kwargs
-        )
-        return stats
+        if not METRICS_RESULTS_CACHE_ENABLED:
+            tasks_by_interval = self._retrieve_tasks_by_interval(
+                intervals,
+                task_subtypes,
+                user_phids=user_phids,
+                project_phids=project_phids
+            )
+            return tasks_by_interval
+
+        if MANIPHEST_MIRROR_ENABLED and maniphest_task_repo.is_synced:
+            ensure_maniphest_mirror_is_fresh()
+            mirror_version = maniphest_task_repo.version
+        else:
+            mirror_version = None
+
+        now = time.time()
+
+        def _has_ended(end):
+            return end.timestamp() < now
+
+        def _is_valid(entry, start_ts, end_ts):
+            if entry['mirror_version'] is not None and mirror_version is not None:
+                is_valid = not maniphest_task_repo.has_changes_since(entry['mirror_version'], start_ts, end_ts)
+            else:
+                is_valid = now - entry['computed_at'] < METRICS_RESULTS_TTL
+            return is_valid
+
+        tasks_by_interval = [None] * len(intervals)
+
+        for i, (start, end) in enumerate(intervals):
+            if _has_ended(end):
+                start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+                entry = metric_result_repo.get(results_key, start_ts, end_ts)
+                if entry and _is_valid(entry, start_ts, end_ts):
+                    tasks_by_interval[i] = (
+                        TaskColumns.from_tasks(entry['tasks_created']),
+                        TaskColumns.from_tasks(entry['tasks_closed']),
+                    )
+
+        missing = [i for i, tasks in enumerate(tasks_by_interval) if tasks is None]
+        if missing:
+            retrieved_tasks_by_interval = self._retrieve_tasks_by_interval(
+                [intervals[i] for i in missing],
+                task_subtypes,
+                user_phids=user_phids,
+                project_phids=project_phids
+            )
+
+            for i, (created_columns, closed_columns) in zip(missing, retrieved_tasks_by_interval):
+                tasks_by_interval[i] = (created_columns, closed_columns, )
+
+                start, end = intervals[i]
+                if _has_ended(end):
+                    metric_result_repo.save(
+                        results_key,
+                        int(start.timestamp()),
+                        int(end.timestamp()),
+                        created_columns.tasks,
+                        closed_columns.tasks,
+                        mirror_version=mirror_version
+                    )
+
+        return tasks_by_interval
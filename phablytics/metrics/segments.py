@@ -0,0 +1,92 @@
+# Python Standard Library Imports
+from dataclasses import dataclass
+
+
+# isort: off
+
+
+@dataclass
+class SegmentGroup:
+    """Accumulated closed-task metrics for one group of a segment
+    """
+    name: str
+    num_closed: int = 0
+    points_completed: float = 0
+    days_to_resolution: int = 0
+    # tasks created are not segmented
+    num_created: int = 0
+    points_added: float = 0
+
+    @property
+    def period_name(self):
+        # segment groups are displayed like `TaskMetric`s, where the name is the period name
+        return self.name
+
+    @property
+    def mean_days_to_resolution(self) -> float:
+        mean_days = self.days_to_resolution / self.num_closed if self.num_closed else 0
+        return mean_days
+
+    def add(self, points, days_to_resolution):
+        self.num_closed += 1
+        self.points_completed += points
+        self.days_to_resolution += days_to_resolution
+
+    def merge(self, other):
+        self.num_closed += other.num_closed
+        self.points_completed += other.points_completed
+        self.days_to_resolution += other.days_to_resolution
+
+
+def group_tasks(columns, dimensions):
+    """Groups the tasks of `columns` (a `TaskColumns`) by each of `dimensions`, in a single pass
+
+    `dimensions` is a dict of dimension name to key function. A key function
+    takes a task and returns its group key (return a tuple to group by
+    several attributes at once), or None to leave the task out.
+
+    Returns a dict of dimension name to dict of group key to `SegmentGroup`.
+    """
+    groups_by_dimension = {name: {} for name in dimensions}
+    points = columns.points.tolist()
+    days_to_resolution = columns.days_to_resolution.tolist()
+
+    for i, task in enumerate(columns.tasks):
+        for name, get_key in dimensions.items():
+            key = get_key(task)
+            if key is None:
+                continue
+
+            groups = groups_by_dimension[name]
+            group = groups.get(key)
+            if group is None:
+                group = SegmentGroup(name=key)
+                groups[key] = group
+
+            group.add(points[i], days_to_resolution[i])
+
+    return groups_by_dimension
+
+
+def top_groups(groups, max_groups=None, other_name='Other'):
+    """Returns `groups` (a dict of group key to `SegmentGroup`) as a list sorted by key
+
+    If there are more than `max_groups`, only the `max_groups - 1` with the most
+    closed tasks are kept, and the rest are merged into one last group named `other_name`.
+    """
+    if max_groups is None or len(groups) <= max_groups:
+        top_keys = set(groups.keys())
+    else:
+        ranked_keys = sorted(groups.keys(), key=lambda key: (-groups[key].num_closed, key))
+        top_keys = set(ranked_keys[:max_groups - 1])
+
+    top = [groups[key] for key in sorted(top_keys)]
+
+    if len(top_keys) < len(groups):
+        other = SegmentGroup(name=other_name)
+        for key, group in groups.items():
+            if key not in top_keys:
+                other.merge(group)
+        top.append(other)
+
+    return top
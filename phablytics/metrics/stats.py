@@ -1,6 +1,5 @@
 # Python Standard Library Imports
 import datetime
-import itertools
 import json
 import random
 
@@ -9,12 +8,42 @@ import numpy
 
 # Phablytics Imports
 from phablytics.constants import COLORS
+from phablytics.metrics.columns import TaskColumns
+from phablytics.metrics.segments import (
+    group_tasks,
+    top_groups,
+)
+from phablytics.settings import METRICS_SEGMENT_MAX_GROUPS
 from phablytics.utils import get_users_by_phid
 
 
 # isort: off
 
 
+def _get_usernames_by_phid(user_phids):
+    users_lookup = get_users_by_phid(user_phids)
+    usernames = {
+        user_phid: users_lookup.get(user_phid).username
+        for user_phid
+        in user_phids
+    }
+    return usernames
+
+
+def _to_python(value):
+    """Converts numpy scalars in `value` (possibly nested dicts and lists) to Python numbers, e.g. for JSON
+    """
+    if isinstance(value, dict):
+        converted = {key: _to_python(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple, )):
+        converted = [_to_python(item) for item in value]
+    elif isinstance(value, numpy.generic):
+        converted = value.item()
+    else:
+        converted = value
+    return converted
+
+
 class TaskMetricsStats:
     def __init__(self, metrics):
         self.metrics = metrics
@@ -33,6 +62,14 @@ class TaskMetricsStats:
         ]
         return metrics_json
 
+    def as_dict(self):
+        data = {
+            'metrics': self.metrics_json,
+            'stats': _to_python(self.stats),
+            'aggregated_stats': self.aggregated_stats.as_dict(),
+        }
+        return data
+
     @property
     def all_tasks_created(self):
         tasks = [
@@ -89,37 +126,80 @@ class TaskMetricsStats:
         metric_cls = self.metrics[0].__class__
         period_start = self.metrics[-1].period_start
         period_end = self.metrics[0].period_end
-        tasks_created = self.all_tasks_created
-        tasks_closed = self.all_tasks_closed
+        created_columns = TaskColumns.concatenate([metric.created_columns for metric in reversed(self.metrics)])
+        closed_columns = TaskColumns.concatenate([metric.closed_columns for metric in reversed(self.metrics)])
 
         aggregated_stats = AggregatedTaskMetricsStats(
             metric_cls,
             period_start,
             period_end,
-            tasks_created,
-            tasks_closed
+            created_columns.tasks,
+            closed_columns.tasks,
+            created_columns=created_columns,
+            closed_columns=closed_columns
         )
 
         return aggregated_stats
 
 
 class AggregatedTaskMetricsStats:
+    # (key, name, group key function, group labels function, ) of each segment, computed over tasks closed
+    SEGMENTS = [
+        (
+            'tasks_by_customer',
+            'Tasks by Customer',
+            lambda task: task.customer_name or 'General',
+            None,
+        ),
+        (
+            'tasks_by_owner_author',
+            'Tasks by Owner/Author',
+            lambda task: task.owner_phid or task.author_phid,
+            _get_usernames_by_phid,
+        ),
+        (
+            'tasks_by_service',
+            'Tasks by Service',
+            lambda task: task.service_name or 'General',
+            None,
+        ),
+    ]
+
     def __init__(
         self,
         metric_cls,
         period_start: datetime.datetime,
         period_end: datetime.datetime,
         tasks_created: list,
-        tasks_closed: list
+        tasks_closed: list,
+        created_columns: TaskColumns=None,
+        closed_columns: TaskColumns=None
     ):
         self.metric_cls = metric_cls
         self.period_start = period_start
         self.period_end = period_end
         self.tasks_created = tasks_created
         self.tasks_closed = tasks_closed
+        self.created_columns = created_columns
+        self.closed_columns = closed_columns
 
         self._build_metrics()
 
+    def as_dict(self):
+        data = {
+            'stats': _to_python(self.stats),
+            'segments': [
+                {
+                    'key': segment['key'],
+                    'name': segment['name'],
+                    'chart_config': json.loads(segment['chart_config_json']),
+                }
+                for segment
+                in self.segments
+            ],
+        }
+        return data
+
     def _build_metrics(self):
         self.stats = {}
 
@@ -128,7 +208,9 @@ class AggregatedTaskMetricsStats:
             self.period_start,
             self.period_end,
             self.tasks_created,
-            self.tasks_closed
+            self.tasks_closed,
+            created_columns=self.created_columns,
+            closed_columns=self.closed_columns
         )
 
         self._compute_aggregated_stats()
@@ -141,14 +223,18 @@ class AggregatedTaskMetricsStats:
         period_start: datetime.datetime,
         period_end: datetime.datetime,
         tasks_created: list,
-        tasks_closed: list
+        tasks_closed: list,
+        created_columns: TaskColumns=None,
+        closed_columns: TaskColumns=None
     ):
         metric = self.metric_cls(
             period_name=name,
             period_start=period_start,
             period_end=period_end,
             tasks_created=tasks_created,
-            tasks_closed=tasks_closed
+            tasks_closed=tasks_closed,
+            created_columns=created_columns,
+            closed_columns=closed_columns
         )
         return metric
 
@@ -184,105 +270,44 @@ class AggregatedTaskMetricsStats:
     def _build_segments(self):
         # X-axis (customer, service, engineer(owner), team)
         # Y-axis (whatever metric)
-        self.segments = [
-            self._build_customer_segment(),
-            self._build_user_segment(),
-            self._build_service_segment(),
-        ]
-
-    def _build_customer_segment(self):
-        # By Customer
-        segment = {
-            'key': 'tasks_by_customer',
-            'name': 'Tasks by Customer',
-        }
-
-        _grouping_key = lambda task: task.customer_name or 'General'
-        tasks_closed_sorted_by_customer = sorted(self.tasks_closed, key=_grouping_key)
-        tasks_by_customers = {
-            customer: list(tasks)
-            for customer, tasks
-            in itertools.groupby(tasks_closed_sorted_by_customer, _grouping_key)
-        }
+        closed_columns = self.metric.closed_columns
+
+        groups_by_segment = group_tasks(
+            closed_columns,
+            {
+                segment_key: get_group_key
+                for segment_key, segment_name, get_group_key, get_labels
+                in self.SEGMENTS
+            }
+        )
 
-        metrics = [
-            self._build_metric(
-                customer,
-                self.period_start,
-                self.period_end,
-                [],
-                list(tasks)
+        self.segments = [
+            self._build_segment(
+                segment_key,
+                segment_name,
+                groups_by_segment[segment_key],
+                get_labels=get_labels
             )
-            for customer, tasks
-            in tasks_by_customers.items()
+            for segment_key, segment_name, get_group_key, get_labels
+            in self.SEGMENTS
         ]
 
-        colors = [
-            random.choice(COLORS)
-            for x
-            in range(len(metrics))
-        ]
-
-        chart_config_json = {
-            'type': 'doughnut',
-            'data': {
-                'datasets': [
-                    {
-                        'label': 'Points Completed',
-                        'name': 'Points Completed',
-                        'data': [
-                            metric.points_completed for metric in metrics
-                        ],
-                        'backgroundColor': colors,
-                    },
-                    {
-                        'label': 'Tasks Closed',
-                        'data': [
-                            metric.num_closed for metric in metrics
-                        ],
-                        'backgroundColor': colors,
-                    },
-                ],
-                'labels': [metric.period_name for metric in metrics],
-            },
-            'options': {
-            },
-        }
-
-        segment['metrics'] = metrics
-        segment['chart_config_json'] = json.dumps(chart_config_json, indent=4)
+    def _build_segment(self, key, name, groups, get_labels=None):
+        """Builds a segment from `groups` (a dict of group key to `SegmentGroup`)
 
-        return segment
-
-    def _build_user_segment(self):
-        # By Author/Owner
+        `get_labels`, if given, maps a list of group keys to a dict of display names.
+        """
         segment = {
-            'key': 'tasks_by_owner_author',
-            'name': 'Tasks by Owner/Author',
+            'key': key,
+            'name': name,
         }
 
-        _grouping_key = lambda task: task.owner_phid or task.author_phid
-        tasks_closed_sorted_by_owners = sorted(self.tasks_closed, key=_grouping_key)
-        tasks_closed_by_owners = {
-            user_phid: list(tasks)
-            for user_phid, tasks
-            in itertools.groupby(tasks_closed_sorted_by_owners, _grouping_key)
-            if user_phid
-        }
+        if get_labels:
+            labels = get_labels(list(groups.keys()))
+            for group_key, group in groups.items():
+                group.name = labels[group_key]
 
-        users_lookup = get_users_by_phid(list(tasks_closed_by_owners.keys()))
-
-        metrics = [
-            self._build_metric(
-                users_lookup.get(user_phid).username,
-                self.period_start,
-                self.period_end,
-                [],
-                tasks,
-            )
-            for user_phid, tasks
-            in tasks_closed_by_owners.items()
-        ]
+        metrics = top_groups(groups, max_groups=METRICS_SEGMENT_MAX_GROUPS)
 
         colors = [
             random.choice(COLORS)
@@ -319,74 +344,7 @@ class AggregatedTaskMetricsStats:
         }
 
         segment['metrics'] = metrics
-        segment['chart_config_json'] = json.dumps(chart_config_json, indent=4)
+        segment['chart_config_json'] = json.dumps(chart_config_json)
 
         return segment
 
-    def _build_service_segment(self):
-        # By Project/Service
-        segment = {
-            'key': 'tasks_by_service',
-            'name': 'Tasks by Service',
-        }
-
-        _grouping_key = lambda task: task.service_name or 'General'
-
-        tasks_closed_sorted_by_services = sorted(self.tasks_closed, key=_grouping_key)
-        tasks_by_services = {
-            service: list(tasks)
-            for service, tasks
-            in itertools.groupby(tasks_closed_sorted_by_services, _grouping_key)
-        }
-
-        metrics = [
-            self._build_metric(
-                service,
-                self.period_start,
-                self.period_end,
-                [],
-                list(tasks)
-            )
-            for service, tasks
-            in tasks_by_services.items()
-        ]
-
-        colors = [
-            random.choice(COLORS)
-            for x
-            in range(len(metrics))
-        ]
-
-        chart_config_json = {
-            'type': 'doughnut',
-            'data': {
-                'datasets': [
-                    {
-                        'label': 'Points Completed',
-                        'name': 'Points Completed',
-                        'data': [
-                            # TODO: fix this
-                            # random.randint(1, 100) for metric in metrics
-                            metric.points_completed for metric in metrics
-                        ],
-                        'backgroundColor': colors,
-                    },
-                    {
-                        'label': 'Tasks Closed',
-                        'name': 'Tasks Closed',
-                        'data': [
-                            metric.num_closed for metric in metrics
-                        ],
-                        'backgroundColor': colors,
-                    },
-                ],
-                'labels': [metric.period_name for metric in metrics],
-            },
-            'options': {
-            },
-        }
-
-        segment['metrics'] = metrics
-        segment['chart_config_json'] = json.dumps(chart_config_json, indent=4)
-
-        return segment
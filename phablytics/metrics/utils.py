@@ -0,0 +1,28 @@
+# Python Standard Library Imports
+import datetime
+
+# Phablytics Imports
+from phablytics.metrics.constants import (
+    DEFAULT_INTERVAL_DAYS,
+    INTERVAL_DAYS_MAP,
+)
+
+
+def make_intervals(period_start, period_end, interval):
+    """Splits `period_start` to `period_end` into intervals, most recent first
+
+    Returns a list of `(start, end)` tuples. Intervals are counted backwards
+    from `period_end`, so the last (oldest) interval may begin before `period_start`.
+    """
+    interval_days = INTERVAL_DAYS_MAP.get(interval, DEFAULT_INTERVAL_DAYS)
+
+    intervals = []
+
+    end = period_end
+    while end > period_start:
+        start = end - datetime.timedelta(days=interval_days)
+        intervals.append((start, end, ))
+        end = start
+
+    return intervals
+
@@ -1,5 +1,6 @@
 # Python Standard Library Imports
 import typing as T
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 
 # Third Party (PyPI) Imports
@@ -7,7 +8,11 @@ import markdown
 from htk.utils.slack import SlackMessage
 
 # Phablytics Imports
-from phablytics.repos import report_last_run_repo
+from phablytics.repos import (
+    report_last_run_repo,
+    report_output_repo,
+)
+from phablytics.settings import CONDUIT_MAX_CONCURRENCY
 from phablytics.utils import hours_ago
 
 
@@ -19,10 +24,73 @@ class PhablyticsReport:
     """
     def __init__(self, report_config, *args, **kwargs):
         self.report_config = report_config
+        # data fetched on behalf of this report, see `phablytics.reports.planner`
+        self.prefetched_data = {}
+        self._data_requirements = None
 
         for key, value in asdict(report_config).items():
             setattr(self, key, value)
 
+    def data_requirements(self):
+        """Declares the queries this report needs, as a dict of name to `DataRequirement`
+
+        When reports are run together, their requirements are merged and fetched
+        once by `phablytics.reports.planner.prefetch_report_data()`.
+
+        Subclasses MAY override this method, and retrieve the data with `self.get_data(name)` or `self.iter_data(name)`
+        """
+        return {}
+
+    def _get_data_requirements(self):
+        if self._data_requirements is None:
+            self._data_requirements = self.data_requirements()
+        return self._data_requirements
+
+    def get_data(self, name):
+        """Returns the data for requirement `name`, prefetched if available, else fetched now
+        """
+        if name in self.prefetched_data:
+            data = self.prefetched_data[name]
+        else:
+            data = self._get_data_requirements()[name].fetch()
+        return data
+
+    def iter_data(self, name):
+        """Like `get_data()`, but if not prefetched, yields the data as it is fetched
+
+        Use when the data is only iterated over once, to avoid holding all of it at once.
+        """
+        if name in self.prefetched_data:
+            yield from self.prefetched_data[name]
+        else:
+            yield from self._get_data_requirements()[name].iter_data()
+
+    def get_all_data(self, names):
+        """Returns a list of the data for each of requirements `names`
+
+        Prefetched data is returned as is; the rest is fetched concurrently.
+        """
+        missing_names = list(dict.fromkeys(name for name in names if name not in self.prefetched_data))
+
+        if missing_names:
+            # declare requirements once, before fetching on several threads
+            requirements = self._get_data_requirements()
+
+            with ThreadPoolExecutor(max_workers=min(len(missing_names), CONDUIT_MAX_CONCURRENCY)) as executor:
+                fetched_data = dict(zip(
+                    missing_names,
+                    executor.map(lambda name: requirements[name].fetch(), missing_names)
+                ))
+        else:
+            fetched_data = {}
+
+        data = [
+            self.prefetched_data[name] if name in self.prefetched_data else fetched_data[name]
+            for name
+            in names
+        ]
+        return data
+
     def _prepare_report(self):
         """Any prep logic for generating a report
 
@@ -58,20 +126,47 @@ class PhablyticsReport:
         """
         self._prepare_report()
 
-        if self.slack:
-            report = self.generate_slack_report()
-        elif self.html:
-            report = self.generate_html_report()
-        else:
-            report = self.generate_text_report()
+        report = self.render_report(self.output_format)
 
         save_last_run = kwargs.pop('save_last_run', False)
         if save_last_run:
             report_last_run_repo.save_last_run(self.report_config.name)
             # print(f'Last run at: {self.last_run_timestamp} / {self.last_run_hours_ago} hours ago')
 
+        save_output = kwargs.pop('save_output', False)
+        if save_output:
+            # rendered from the same prepared report, without fetching again
+            html_report = report if self.output_format == 'html' else self.render_report('html')
+            self.save_output(html_report)
+
+        return report
+
+    @property
+    def output_format(self):
+        if self.slack:
+            output_format = 'slack'
+        elif self.html:
+            output_format = 'html'
+        else:
+            output_format = 'text'
+        return output_format
+
+    def render_report(self, output_format):
+        """Renders the prepared report as `output_format`: one of 'slack', 'html' or 'text'
+        """
+        renderers = {
+            'slack': self.generate_slack_report,
+            'html': self.generate_html_report,
+            'text': self.generate_text_report,
+        }
+        report = renderers[output_format]()
         return report
 
+    def save_output(self, html_report):
+        """Stores the rendered `html_report`, served by the web UI, see `phablytics.repos.report_output_repo`
+        """
+        report_output_repo.save(self.report_config.name, html_report)
+
     def generate_slack_report(self) -> T.List[SlackMessage]:
         """Generates a Slack report
 
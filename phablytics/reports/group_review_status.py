@@ -1,5 +1,5 @@
 # Python Standard Library Imports
-import datetime
+import functools
 import random
 
 # Third Party (PyPI) Imports
@@ -12,6 +12,7 @@ from phablytics.reports.constants import (
     DIFF_PRESENT_MESSAGES,
     HTML_ICON_SEPARATOR,
 )
+from phablytics.reports.planner import DifferentialRevisionsRequirement
 from phablytics.reports.revision_status import RevisionStatusReport
 from phablytics.reports.utils import (
     pluralize_noun,
@@ -19,7 +20,6 @@ from phablytics.reports.utils import (
 )
 from phablytics.settings import REVISION_ACCEPTANCE_THRESHOLD
 from phablytics.utils import (
-    fetch_differential_revisions,
     get_projects_by_name,
     get_repos_by_phid,
     get_users_by_phid,
@@ -40,34 +40,49 @@ class GroupReviewStatusReport(RevisionStatusReport):
     def __init__(self, *args, **kwargs):
         super(GroupReviewStatusReport, self).__init__(*args, **kwargs)
 
-    def _prepare_report(self):
-        """Prepares the Revision Status Report
+    @functools.cached_property
+    def reviewer_phids(self):
+        """Returns `(reviewer_phids, group_reviewer_phids)`
+
+        - `reviewer_phids`: PHIDs of the reviewers and reviewer groups to search revisions by
+        - `group_reviewer_phids`: PHIDs of members of the reviewer groups
         """
-        # get revisions
         reviewer_users = get_users_by_username(self.reviewers)
         projects = get_projects_by_name(self.group_reviewers, include_members=True)
-        group_reviewer_phids = [
+        group_reviewer_phids = frozenset(
             member_phid
             for project in projects
             for member_phid in project.member_phids
-        ]
+        )
         reviewer_phids = list(map(lambda x: x.phid, reviewer_users + projects))
+        return reviewer_phids, group_reviewer_phids
+
+    def data_requirements(self):
+        reviewer_phids, _ = self.reviewer_phids
+        requirements = {
+            'revisions': DifferentialRevisionsRequirement(
+                reviewer_phids=reviewer_phids,
+                modified_after_dt=self.modified_after_dt
+            ),
+        }
+        return requirements
+
+    def _prepare_report(self):
+        """Prepares the Revision Status Report
+        """
+        # get revisions
+        _, group_reviewer_phids = self.reviewer_phids
 
         non_group_reviewer_acceptance_threshold = self.non_group_reviewer_acceptance_threshold
 
-        date_created = (datetime.datetime.now() - datetime.timedelta(days=self.threshold_days)).replace(hour=0, minute=0, second=0)
-        active_revisions = fetch_differential_revisions(
-            reviewer_phids=reviewer_phids,
-            modified_after_dt=date_created
-        )
-        revisions_ready_for_group_review = list(
-            filter(
-                lambda revision: revision.has_sufficient_non_group_reviewer_acceptances(
-                    group_reviewer_phids,
-                    non_group_reviewer_acceptance_threshold
-                ),
-                active_revisions
-            )
+        # bucketed as they arrive
+        active_revisions = self.iter_data('revisions')
+        revisions_ready_for_group_review = filter(
+            lambda revision: revision.has_sufficient_non_group_reviewer_acceptances(
+                group_reviewer_phids,
+                non_group_reviewer_acceptance_threshold
+            ),
+            active_revisions
         )
 
         # place revisions into buckets
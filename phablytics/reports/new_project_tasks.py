@@ -7,11 +7,13 @@ from collections import namedtuple
 from htk.utils.slack import SlackMessage
 
 # Phablytics Imports
+from phablytics.constants import MANIPHEST_ASSIGNED_NONE
 from phablytics.reports.base import PhablyticsReport
+from phablytics.reports.planner import ManiphestTasksRequirement
 from phablytics.reports.utils import pluralize_noun
 from phablytics.utils import (
-    get_maniphest_tasks_by_project_name,
-    get_maniphest_tasks_by_project_names,
+    get_project_tasks_constraints,
+    merge_maniphest_tasks,
 )
 
 
@@ -40,47 +42,67 @@ class NewProjectTasksReport(PhablyticsReport):
             lower_hours = self.threshold_lower_hours
         return lower_hours
 
+    @functools.cached_property
+    def created_start(self):
+        """Timestamp from which tasks should be included
+        """
+        created_start = int((datetime.datetime.now() - datetime.timedelta(hours=self.lower_hours)).timestamp())
+        return created_start
+
     @property
     def timeline(self):
         timeline = f'Created in the last {self.lower_hours} hours'
         return timeline
 
+    def _get_tasks_constraints(self, project_names):
+        """Constraints for new, unassigned open tasks in all of `project_names`
+        """
+        constraints = get_project_tasks_constraints(project_names)
+        constraints['createdStart'] = self.created_start
+        # exclude assigned tasks
+        constraints['assigned'] = [MANIPHEST_ASSIGNED_NONE]
+        return constraints
+
     class _ReportSection(namedtuple('ReportSection', 'column_phid,column,tasks')):
         pass
 
-    def _prepare_report(self):
+    def data_requirements(self):
+        """In 'and' mode, tasks in all of `self.project_names` are needed;
+        in 'or' mode, tasks in each of `self.project_names`, named by project name
+        """
+        if self.projects_and_vs_or == 'and':
+            requirements = {
+                'tasks': ManiphestTasksRequirement(
+                    self._get_tasks_constraints(self.project_names),
+                    order=self.order
+                ),
+            }
+        elif self.projects_and_vs_or == 'or':
+            requirements = {
+                project_name: ManiphestTasksRequirement(
+                    self._get_tasks_constraints([project_name]),
+                    order=self.order
+                )
+                for project_name
+                in self.project_names
+            }
+        else:
+            raise Exception(f'Invalid value for `projects_and_vs_or`: {self.projects_and_vs_or}')
 
-        def _should_include(task):
-            should_include = (
-                # exclude assigned tasks
-                task.owner_phid is None
-                # exclude tasks created prior to `self.lower_hours`
-                and task.created_at > (datetime.datetime.now() - datetime.timedelta(hours=self.lower_hours))
-            )
-            return should_include
+        return requirements
 
+    def _prepare_report(self):
+        # new and unassigned tasks are filtered by Conduit, see `self._get_tasks_constraints()`
         report_sections = []
-        all_maniphest_tasks = []
 
         if self.projects_and_vs_or == 'and':
-            all_maniphest_tasks = get_maniphest_tasks_by_project_names(
-                self.project_names,
-                column_phids=None,
-                order=self.order,
-            )
+            tasks = self.get_data('tasks')
         elif self.projects_and_vs_or == 'or':
-            for project_name in self.project_names:
-                maniphest_tasks = get_maniphest_tasks_by_project_name(
-                    project_name,
-                    column_phids=None,
-                    order=self.order,
-                )
-                all_maniphest_tasks.extend(maniphest_tasks)
+            # a task in several of the projects is listed once
+            tasks = merge_maniphest_tasks(self.get_all_data(self.project_names), order=self.order)
         else:
             raise Exception(f'Invalid value for `projects_and_vs_or`: {self.projects_and_vs_or}')
 
-        tasks = filter(_should_include, all_maniphest_tasks)
-
         report_sections.append(self._ReportSection(
             # column_phid=None,
             # column=None,
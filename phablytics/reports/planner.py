@@ -0,0 +1,211 @@
+"""Plans and prefetches the data needed by several reports run together
+
+Reports declare their queries with `PhablyticsReport.data_requirements()`.
+Requirements of all reports which can be answered by the same query are
+merged, each merged query is fetched once, and every report is handed
+its slice, see `PhablyticsReport.get_data()`.
+"""
+# Python Standard Library Imports
+import sys
+import traceback
+from collections import defaultdict
+
+# Phablytics Imports
+from phablytics.utils import (
+    fetch_differential_revisions,
+    get_maniphest_tasks,
+    iter_differential_revisions,
+)
+
+
+# isort: off
+
+
+def _freeze(value):
+    """Converts `value` (possibly nested dicts and lists) into a hashable equivalent
+    """
+    if isinstance(value, dict):
+        frozen = tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    elif isinstance(value, (list, tuple, )):
+        frozen = tuple(_freeze(item) for item in value)
+    else:
+        frozen = value
+    return frozen
+
+
+class DataRequirement:
+    """This is the base class for queries declared by reports
+
+    Requirements with equal `merge_key`s are fetched as one query.
+    """
+    @property
+    def merge_key(self):
+        raise Exception('Not implemented')
+
+    @classmethod
+    def merge(cls, requirements):
+        """Returns a single requirement whose data covers every one of `requirements`
+
+        Subclasses MAY override this method; by default, requirements with equal
+        `merge_key`s are assumed to be identical
+        """
+        requirement = requirements[0]
+        return requirement
+
+    def fetch(self):
+        raise Exception('Not implemented')
+
+    def iter_data(self):
+        """Yields the data item by item, as it is fetched
+
+        Subclasses MAY override this method to stream the data, rather than fetching it all at once
+        """
+        yield from self.fetch()
+
+    def take(self, data):
+        """Returns the slice of `data`, fetched for a merged requirement, that this requirement needs
+
+        Subclasses MAY override this method
+        """
+        data = list(data)
+        return data
+
+
+class ManiphestTasksRequirement(DataRequirement):
+    """Tasks matching `constraints`, see `get_maniphest_tasks()`
+    """
+    def __init__(self, constraints, order=None, with_columns=False):
+        self.constraints = constraints
+        self.order = order
+        self.with_columns = with_columns
+
+    @property
+    def merge_key(self):
+        key = ('maniphest_tasks', _freeze(self.constraints), _freeze(self.order), self.with_columns, )
+        return key
+
+    def fetch(self):
+        tasks = get_maniphest_tasks(self.constraints, order=self.order, with_columns=self.with_columns)
+        return tasks
+
+
+class DifferentialRevisionsRequirement(DataRequirement):
+    """Active revisions, see `fetch_differential_revisions()`
+
+    Requirements which only differ by `modified_after_dt` are merged into one
+    query from the earliest of them, then sliced by modification date.
+    """
+    def __init__(self, query_key=None, reviewer_phids=None, modified_after_dt=None):
+        self.query_key = query_key
+        self.reviewer_phids = reviewer_phids
+        self.modified_after_dt = modified_after_dt
+
+    @property
+    def merge_key(self):
+        key = ('differential_revisions', self.query_key, tuple(sorted(self.reviewer_phids or [])), )
+        return key
+
+    @classmethod
+    def merge(cls, requirements):
+        modified_after_dts = [requirement.modified_after_dt for requirement in requirements]
+        modified_after_dt = None if None in modified_after_dts else min(modified_after_dts)
+
+        requirement = cls(
+            query_key=requirements[0].query_key,
+            reviewer_phids=requirements[0].reviewer_phids,
+            modified_after_dt=modified_after_dt
+        )
+        return requirement
+
+    def fetch(self):
+        revisions = fetch_differential_revisions(
+            self.query_key,
+            reviewer_phids=self.reviewer_phids,
+            modified_after_dt=self.modified_after_dt
+        )
+        return revisions
+
+    def iter_data(self):
+        yield from iter_differential_revisions(
+            self.query_key,
+            reviewer_phids=self.reviewer_phids,
+            modified_after_dt=self.modified_after_dt
+        )
+
+    def take(self, data):
+        if self.modified_after_dt is None:
+            revisions = list(data)
+        else:
+            modified_start = int(self.modified_after_dt.timestamp())
+            revisions = [revision for revision in data if revision.modified_ts >= modified_start]
+        return revisions
+
+
+def plan_report_data(reports):
+    """Merges the data requirements of `reports`
+
+    Returns a list of `(merged_requirement, slices)`, where `slices` is
+    a list of `(report, name, requirement)` to hand the fetched data to.
+    """
+    slices_by_key = defaultdict(list)
+
+    for report in reports:
+        try:
+            requirements = report._get_data_requirements()
+        except Exception:
+            # the report will fail on its own, when generated
+            print(
+                f'Failed to plan the data of report {report.report_config.name}:\n{traceback.format_exc()}',
+                file=sys.stderr
+            )
+            requirements = {}
+
+        for name, requirement in requirements.items():
+            slices_by_key[requirement.merge_key].append((report, name, requirement, ))
+
+    plan = [
+        (
+            type(slices[0][2]).merge([requirement for _, _, requirement in slices]),
+            slices,
+        )
+        for slices
+        in slices_by_key.values()
+    ]
+    return plan
+
+
+def prefetch_report_data(reports, executor=None):
+    """Fetches the data required by `reports`, fetching each merged query once,
+    and hands every report its slice
+
+    Queries are fetched concurrently if an `executor` is given. A query which
+    fails is left for the affected reports to fetch (and fail) on their own.
+
+    Returns the number of queries fetched.
+    """
+    plan = plan_report_data(reports)
+
+    def _fetch(plan_item):
+        requirement, slices = plan_item
+        try:
+            data = requirement.fetch()
+        except Exception:
+            report_names = ', '.join(sorted({report.report_config.name for report, _, _ in slices}))
+            print(
+                f'Failed to prefetch data for reports {report_names}:\n{traceback.format_exc()}',
+                file=sys.stderr
+            )
+            data = None
+        return data
+
+    if executor is None:
+        results = [_fetch(plan_item) for plan_item in plan]
+    else:
+        results = list(executor.map(_fetch, plan))
+
+    for (_, slices), data in zip(plan, results):
+        if data is not None:
+            for report, name, requirement in slices:
+                report.prefetched_data[name] = requirement.take(data)
+
+    return len(plan)
@@ -4,8 +4,8 @@ from htk.utils.slack import SlackMessage
 # Phablytics Imports
 from phablytics.reports.base import PhablyticsReport
 from phablytics.utils import (
-    get_maniphest_tasks_by_owners,
     get_users_by_username,
+    iter_maniphest_tasks_by_owners,
 )
 
 
@@ -13,7 +13,7 @@ class RecentTasksReport(PhablyticsReport):
     def __init__(self, *args, **kwargs):
         super(RecentTasksReport, self).__init__(*args, **kwargs)
 
-    def generate_text_report(self):
+    def _prepare_report(self):
         usernames = self.report_config.usernames
         users = get_users_by_username(usernames)
         users_lookup = {
@@ -23,7 +23,9 @@ class RecentTasksReport(PhablyticsReport):
         }
         user_phids = list(users_lookup.keys())
 
-        maniphest_tasks = get_maniphest_tasks_by_owners(user_phids)
+        # tasks are formatted as they arrive, rather than all being held at once,
+        # and once for every rendered format
+        maniphest_tasks = iter_maniphest_tasks_by_owners(user_phids)
 
         report = []
 
@@ -54,7 +56,10 @@ class RecentTasksReport(PhablyticsReport):
 
             report.append(fmt % tuple(cells))
 
-        report_string = '\n'.join(report)
+        self.report_rows = report
+
+    def generate_text_report(self):
+        report_string = '\n'.join(self.report_rows)
 
         return report_string
 
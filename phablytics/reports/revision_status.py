@@ -1,5 +1,6 @@
 # Python Standard Library Imports
 import datetime
+import functools
 import random
 import typing as T
 from dataclasses import dataclass
@@ -15,13 +16,13 @@ from phablytics.reports.constants import (
     DIFF_PRESENT_MESSAGES,
     HTML_ICON_SEPARATOR,
 )
+from phablytics.reports.planner import DifferentialRevisionsRequirement
 from phablytics.reports.utils import (
     pluralize_noun,
     pluralize_verb,
 )
 from phablytics.settings import REVISION_ACCEPTANCE_THRESHOLD
 from phablytics.utils import (
-    fetch_differential_revisions,
     get_repos_by_phid,
     get_users_by_phid,
 )
@@ -79,15 +80,27 @@ class RevisionStatusReport(PhablyticsReport):
         self.users_lookup = get_users_by_phid(self.user_phids)
         self.repos_lookup = get_repos_by_phid(self.repo_phids)
 
+    @functools.cached_property
+    def modified_after_dt(self):
+        """Only revisions modified since the start of the day `self.threshold_days` ago are included
+        """
+        date_created = (datetime.datetime.now() - datetime.timedelta(days=self.threshold_days)).replace(hour=0, minute=0, second=0)
+        return date_created
+
+    def data_requirements(self):
+        requirements = {
+            'revisions': DifferentialRevisionsRequirement(
+                query_key=self.query_key,
+                modified_after_dt=self.modified_after_dt
+            ),
+        }
+        return requirements
+
     def _prepare_report(self):
         """Prepares the Revision Status Report
         """
-        # get revisions
-        date_created = (datetime.datetime.now() - datetime.timedelta(days=self.threshold_days)).replace(hour=0, minute=0, second=0)
-        active_revisions = fetch_differential_revisions(
-            self.query_key,
-            modified_after_dt=date_created
-        )
+        # get revisions, bucketed as they arrive
+        active_revisions = self.iter_data('revisions')
 
         # place revisions into buckets
         revisions_wip = []
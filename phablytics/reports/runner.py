@@ -0,0 +1,168 @@
+# Python Standard Library Imports
+import sys
+import time
+import traceback
+import typing as T
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# Third Party (PyPI) Imports
+from htk.utils.slack import send_messages_as_thread
+
+# Phablytics Imports
+from phablytics.reports.planner import prefetch_report_data
+from phablytics.reports.utils import (
+    get_report_config,
+    get_report_types,
+)
+from phablytics.settings import REPORTS_MAX_WORKERS
+from phablytics.utils import (
+    get_all_projects,
+    get_customers,
+    shared_phid_lookups,
+)
+
+
+# isort: off
+
+
+@dataclass
+class ReportRun:
+    """The outcome of running one report with `run_reports()`
+    """
+    name: str
+    report: T.Any = None
+    sent_to_slack: bool = False
+    generate_seconds: float = 0
+    send_seconds: float = 0
+    error: str = None
+
+    @property
+    def is_success(self):
+        return self.error is None
+
+    @property
+    def total_seconds(self):
+        return self.generate_seconds + self.send_seconds
+
+
+def build_report(report_name, overrides=None):
+    """Instantiates the report `report_name`, with its config updated from `overrides`
+    """
+    report_config = get_report_config(report_name, overrides)
+    report_class = get_report_types().get(report_config.report_type)
+    if report_class is None:
+        raise Exception(f'Invalid report type: {report_config.report_type}')
+
+    report = report_class(report_config)
+    return report
+
+
+def run_report(run, report):
+    """Generates and stores `report`, and sends it to Slack if so configured, recording the outcome on `run`
+
+    Exceptions are caught and recorded on `run`, so that one failing
+    report doesn't affect others run alongside it.
+    """
+    try:
+        start = time.perf_counter()
+        run.report = report.generate_report(save_last_run=True, save_output=True)
+        run.generate_seconds = time.perf_counter() - start
+
+        if report.report_config.slack:
+            start = time.perf_counter()
+            send_messages_as_thread(run.report, channel=report.report_config.slack_channel)
+            run.send_seconds = time.perf_counter() - start
+            run.sent_to_slack = True
+    except Exception:
+        run.error = traceback.format_exc()
+
+    return run
+
+
+def run_reports(report_names, overrides=None, max_workers=None):
+    """Runs the reports `report_names` concurrently on a pool of `max_workers` threads
+
+    Reports are mostly waiting on Conduit (and Slack), so they overlap well on threads.
+    Lookups shared by reports (projects, customers, users and repos by PHID) are
+    only fetched once for the whole run, and so are the queries declared by the
+    reports' `data_requirements()`, see `phablytics.reports.planner`.
+
+    Returns `(runs, prefetch)`:
+    - `runs`: a list of `ReportRun`, in the same order as `report_names`
+    - `prefetch`: a dict with the number of merged queries prefetched, and the time taken
+    """
+    max_workers = max_workers or REPORTS_MAX_WORKERS
+
+    runs = []
+    reports = []
+    for report_name in report_names:
+        run = ReportRun(name=report_name)
+        try:
+            report = build_report(report_name, overrides)
+        except Exception:
+            run.error = traceback.format_exc()
+            report = None
+
+        runs.append(run)
+        reports.append(report)
+
+    with shared_phid_lookups():
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            start = time.perf_counter()
+            try:
+                # warm the project caches once, rather than having every report miss them concurrently
+                get_all_projects()
+                get_customers()
+            except Exception:
+                # each report fetches what it needs (and fails on its own)
+                print(
+                    f'Failed to warm the project caches, reports will fetch them on demand:\n{traceback.format_exc()}',
+                    file=sys.stderr
+                )
+            num_queries = prefetch_report_data([report for report in reports if report], executor=executor)
+            prefetch = {
+                'num_queries': num_queries,
+                'seconds': time.perf_counter() - start,
+            }
+
+            list(executor.map(
+                run_report,
+                [run for run, report in zip(runs, reports) if report],
+                [report for report in reports if report]
+            ))
+
+    return runs, prefetch
+
+
+def format_report_runs_summary(runs, prefetch=None, total_seconds=None):
+    """Formats a summary of `runs` (a list of `ReportRun`): per-report timings, followed by failures
+    """
+    name_width = max([len(run.name) for run in runs] + [len('Report')])
+
+    lines = []
+    if prefetch is not None:
+        lines.append(f"Prefetched {prefetch['num_queries']} shared {'query' if prefetch['num_queries'] == 1 else 'queries'} in {prefetch['seconds']:.1f}s")
+
+    lines += [
+        f"{'Report':<{name_width}}  {'Status':<6}  {'Generate':>9}  {'Send':>7}",
+    ]
+    for run in runs:
+        status = 'ok' if run.is_success else 'FAILED'
+        send = f'{run.send_seconds:6.1f}s' if run.sent_to_slack else f"{'-':>7}"
+        lines.append(f'{run.name:<{name_width}}  {status:<6}  {run.generate_seconds:8.1f}s  {send}')
+
+    num_failed = len([run for run in runs if not run.is_success])
+    summary = f'{len(runs) - num_failed} of {len(runs)} reports succeeded'
+    if total_seconds is not None:
+        summary += f' in {total_seconds:.1f}s'
+    lines.append(summary)
+
+    for run in runs:
+        if not run.is_success:
+            lines.append('')
+            lines.append(f'{run.name} failed:')
+            lines.append(run.error.rstrip())
+
+    summary_string = '\n'.join(lines)
+    return summary_string
@@ -1,4 +1,5 @@
 # Python Standard Library Imports
+import functools
 import typing as T
 from collections import namedtuple
 
@@ -6,11 +7,13 @@ from collections import namedtuple
 from htk.utils.slack import SlackMessage
 
 # Phablytics Imports
+from phablytics.constants import MANIPHEST_STATUSES_OPEN
 from phablytics.reports.base import PhablyticsReport
+from phablytics.reports.planner import ManiphestTasksRequirement
 from phablytics.reports.utils import pluralize_noun
 from phablytics.utils import (
-    get_maniphest_tasks_by_project_name,
-    get_project_columns_by_project_name,
+    get_project_by_name,
+    get_project_columns,
 )
 
 
@@ -33,9 +36,15 @@ class UpcomingProjectTasksDueReport(PhablyticsReport):
         timeline = f'within the next {self.threshold_lower_hours} - {self.threshold_upper_hours} hours'
         return timeline
 
-    def _prepare_report(self):
+    @functools.cached_property
+    def project(self):
+        project = get_project_by_name(self.project_name)
+        return project
+
+    @functools.cached_property
+    def column_lookup(self):
         if self.column_names:
-            columns = get_project_columns_by_project_name(self.project_name, self.column_names)
+            columns = get_project_columns(self.project, self.column_names)
             column_lookup = {
                 column.phid: column
                 for column
@@ -44,8 +53,26 @@ class UpcomingProjectTasksDueReport(PhablyticsReport):
         else:
             column_lookup = {}
 
-        self.column_lookup = column_lookup
+        return column_lookup
+
+    def data_requirements(self):
+        """Open tasks in any of the target columns, with columns attached, in a single query
+        """
+        if self.column_lookup:
+            constraints = {
+                'projects': [self.project.phid],
+                'statuses': MANIPHEST_STATUSES_OPEN,
+                'columnPHIDs': list(self.column_lookup.keys()),
+            }
+            requirements = {
+                'tasks': ManiphestTasksRequirement(constraints, order=self.order, with_columns=True),
+            }
+        else:
+            requirements = {}
+
+        return requirements
 
+    def _prepare_report(self):
         def _should_include(task):
             should_include = (
                 task.id_ not in self.excluded_tasks
@@ -57,15 +84,23 @@ class UpcomingProjectTasksDueReport(PhablyticsReport):
             )
             return should_include
 
+        # partition tasks by column, keeping their order within each column
+        tasks_by_column_phid = {
+            column_phid: []
+            for column_phid
+            in self.column_lookup
+        }
+        if self.column_lookup:
+            for task in self.get_data('tasks'):
+                for column_phid in task.column_phids:
+                    if column_phid in tasks_by_column_phid:
+                        tasks_by_column_phid[column_phid].append(task)
+
         report_sections = []
         for column_phid, column in self.column_lookup.items():
-            maniphest_tasks = get_maniphest_tasks_by_project_name(
-                self.project_name,
-                column_phids=[column_phid],
-                order=self.order,
-            )
+            maniphest_tasks = tasks_by_column_phid[column_phid]
 
-            tasks = filter(_should_include, maniphest_tasks)
+            tasks = list(filter(_should_include, maniphest_tasks))
 
             report_sections.append(self._ReportSection(
                 column_phid,
@@ -1,7 +1,15 @@
 # Phablytics Imports
+from phablytics.repos.differential_revisions import differential_revision_repo
+from phablytics.repos.maniphest_tasks import maniphest_task_repo
+from phablytics.repos.metric_results import metric_result_repo
 from phablytics.repos.report_last_run import report_last_run_repo
+from phablytics.repos.report_outputs import report_output_repo
 
 
 __all__ = [
+    'differential_revision_repo',
+    'maniphest_task_repo',
+    'metric_result_repo',
     'report_last_run_repo',
+    'report_output_repo',
 ]
@@ -0,0 +1,261 @@
+# Python Standard Library Imports
+import json
+import math
+import time
+
+# Phablytics Imports
+from phablytics.classes import Revision
+from phablytics.db import sqlite_do
+from phablytics.settings import DIFFERENTIAL_MIRROR_DB_FILE
+
+
+# isort: off
+
+
+class DifferentialRevisionRepo:
+    """Local mirror of Differential revisions and their reviewers, kept current by incremental syncs
+
+    Revisions are synced in scopes: all revisions (`scope=''`), plus one scope
+    per saved query key that reports ask for, since saved queries can only be
+    evaluated by Phabricator. Each scope has its own high-water mark.
+
+    Which revisions match a saved query is replaced by every full sync of its scope,
+    and pruned by incremental syncs, see `save_revisions()`.
+
+    See: `phablytics.utils.phab.sync_differential_revisions()`
+    """
+    DB_FILE = DIFFERENTIAL_MIRROR_DB_FILE
+    REVISIONS_TABLE_NAME = 'differential_revisions'
+    REVIEWERS_TABLE_NAME = 'differential_revision_reviewers'
+    QUERY_KEYS_TABLE_NAME = 'differential_revision_query_keys'
+    SYNC_RUNS_TABLE_NAME = 'differential_sync_runs'
+
+    def __init__(self):
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.REVISIONS_TABLE_NAME}(
+id INTEGER PRIMARY KEY,
+phid VARCHAR UNIQUE,
+author_phid VARCHAR,
+repository_phid VARCHAR,
+status VARCHAR,
+date_created INTEGER,
+date_modified INTEGER,
+data TEXT
+)""")
+            for column in ('author_phid', 'status', 'date_modified', ):
+                cur.execute(
+                    f"""CREATE INDEX IF NOT EXISTS {self.REVISIONS_TABLE_NAME}_{column} ON {self.REVISIONS_TABLE_NAME}({column})"""
+                )
+
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.REVIEWERS_TABLE_NAME}(
+revision_id INTEGER,
+reviewer_phid VARCHAR,
+status VARCHAR,
+is_blocking INTEGER,
+PRIMARY KEY (revision_id, reviewer_phid)
+)""")
+            cur.execute(
+                f"""CREATE INDEX IF NOT EXISTS {self.REVIEWERS_TABLE_NAME}_reviewer_phid ON {self.REVIEWERS_TABLE_NAME}(reviewer_phid)"""
+            )
+
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.QUERY_KEYS_TABLE_NAME}(
+query_key VARCHAR,
+revision_id INTEGER,
+PRIMARY KEY (query_key, revision_id)
+)""")
+
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.SYNC_RUNS_TABLE_NAME}(
+version INTEGER PRIMARY KEY AUTOINCREMENT,
+scope VARCHAR,
+timestamp INTEGER,
+high_water_mark INTEGER,
+num_fetched INTEGER,
+num_updated INTEGER,
+is_full INTEGER DEFAULT 0
+)""")
+
+    ##
+    # Sync
+
+    SYNC_RUN_COLUMNS = (
+        'version',
+        'scope',
+        'timestamp',
+        'high_water_mark',
+        'num_fetched',
+        'num_updated',
+        'is_full',
+    )
+
+    def get_last_sync_run(self, scope='', is_full=None):
+        """Returns the most recent sync run for `scope` as a dict, or None if never synced
+
+        With `is_full=True`, returns the most recent full sync run instead.
+        """
+        where = 'scope = ?' + (' AND is_full = 1' if is_full else '')
+
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT {', '.join(self.SYNC_RUN_COLUMNS)} FROM {self.SYNC_RUNS_TABLE_NAME}
+WHERE {where} ORDER BY version DESC LIMIT 1""",
+                (scope, )
+            )
+            row = res.fetchone()
+
+        if row:
+            sync_run = dict(zip(self.SYNC_RUN_COLUMNS, row))
+            sync_run['is_full'] = bool(sync_run['is_full'])
+        else:
+            sync_run = None
+
+        return sync_run
+
+    def get_high_water_mark(self, scope=''):
+        sync_run = self.get_last_sync_run(scope=scope)
+        hwm = sync_run['high_water_mark'] if sync_run else None
+        return hwm
+
+    def is_synced(self, scope=''):
+        return self.get_last_sync_run(scope=scope) is not None
+
+    def save_revisions(self, revisions, scope='', modified_start=None):
+        """Upserts `revisions` (with their reviewers) and records a sync run for `scope`
+
+        `scope` is either '' (all revisions) or a saved query key, in which case
+        `revisions` are recorded as matching that query key:
+        - A full sync (`modified_start` is None) returns every match, so it replaces
+          the revisions recorded as matching.
+        - An incremental sync returns every match modified since `modified_start`,
+          so previously matching revisions mirrored as modified since then, but not
+          returned, have stopped matching (e.g. their reviewers changed).
+
+        Returns the sync run as a dict.
+        """
+        previous_hwm = self.get_high_water_mark(scope=scope)
+        hwm = max([previous_hwm or 0] + [revision.modified_ts for revision in revisions])
+        is_full = modified_start is None
+        num_updated = 0
+
+        with sqlite_do(self.DB_FILE) as cur:
+            if scope:
+                if is_full:
+                    cur.execute(f"""DELETE FROM {self.QUERY_KEYS_TABLE_NAME} WHERE query_key = ?""", (scope, ))
+                else:
+                    # those still matching are recorded again below
+                    cur.execute(
+                        f"""DELETE FROM {self.QUERY_KEYS_TABLE_NAME} WHERE query_key = ? AND revision_id IN (
+SELECT id FROM {self.REVISIONS_TABLE_NAME} WHERE date_modified >= ?
+)""",
+                        (scope, modified_start, )
+                    )
+
+            for revision in revisions:
+                if scope:
+                    cur.execute(
+                        f"""INSERT OR IGNORE INTO {self.QUERY_KEYS_TABLE_NAME} (query_key, revision_id) VALUES (?, ?)""",
+                        (scope, revision.id_, )
+                    )
+
+                row = cur.execute(
+                    f"""SELECT date_modified FROM {self.REVISIONS_TABLE_NAME} WHERE id = ?""",
+                    (revision.id_, )
+                ).fetchone()
+                if row and row[0] == revision.modified_ts:
+                    # unchanged; `modifiedStart` is inclusive, and scopes overlap
+                    continue
+
+                num_updated += 1
+
+                cur.execute(
+                    f"""INSERT OR REPLACE INTO {self.REVISIONS_TABLE_NAME}
+(id, phid, author_phid, repository_phid, status, date_created, date_modified, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        revision.id_,
+                        revision.phid,
+                        revision.author_phid,
+                        revision.repo_phid,
+                        revision.status_value,
+                        revision.created_ts,
+                        revision.modified_ts,
+                        json.dumps(revision.to_raw_data()),
+                    )
+                )
+                cur.execute(f"""DELETE FROM {self.REVIEWERS_TABLE_NAME} WHERE revision_id = ?""", (revision.id_, ))
+                cur.executemany(
+                    f"""INSERT OR REPLACE INTO {self.REVIEWERS_TABLE_NAME} (revision_id, reviewer_phid, status, is_blocking)
+VALUES (?, ?, ?, ?)""",
+                    [
+                        (revision.id_, reviewer['reviewerPHID'], reviewer.get('status'), int(bool(reviewer.get('isBlocking'))), )
+                        for reviewer
+                        in revision.reviewers
+                    ]
+                )
+
+            cur.execute(
+                f"""INSERT INTO {self.SYNC_RUNS_TABLE_NAME} (scope, timestamp, high_water_mark, num_fetched, num_updated, is_full)
+VALUES (?, ?, ?, ?, ?, ?)""",
+                (scope, math.floor(time.time()), hwm, len(revisions), num_updated, int(is_full), )
+            )
+
+        sync_run = self.get_last_sync_run(scope=scope)
+        return sync_run
+
+    ##
+    # Queries
+
+    def search(
+        self,
+        statuses=None,
+        query_key=None,
+        reviewer_phids=None,
+        modified_start=None,
+        modified_end=None
+    ):
+        """Searches mirrored revisions, newest first
+
+        Like `differential.revision.search`, `reviewer_phids` matches revisions
+        with any of the given reviewers.
+
+        A revision is only considered to match `query_key` if it was returned
+        by the latest syncs of that saved query; its current status, reviewers, etc.
+        are always those from the most recent sync of any scope.
+        """
+        clauses = []
+        params = []
+
+        if statuses:
+            clauses.append(f"""status IN ({', '.join(['?'] * len(statuses))})""")
+            params.extend(statuses)
+
+        if query_key:
+            clauses.append(f"""id IN (SELECT revision_id FROM {self.QUERY_KEYS_TABLE_NAME} WHERE query_key = ?)""")
+            params.append(query_key)
+
+        if reviewer_phids:
+            clauses.append(
+                f"""id IN (SELECT revision_id FROM {self.REVIEWERS_TABLE_NAME} WHERE reviewer_phid IN ({', '.join(['?'] * len(reviewer_phids))}))"""
+            )
+            params.extend(reviewer_phids)
+
+        if modified_start is not None:
+            clauses.append('date_modified >= ?')
+            params.append(modified_start)
+
+        if modified_end is not None:
+            clauses.append('date_modified <= ?')
+            params.append(modified_end)
+
+        where = ' AND '.join(clauses) if clauses else '1'
+
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT data FROM {self.REVISIONS_TABLE_NAME} WHERE {where} ORDER BY id DESC""",
+                params
+            )
+            revisions = [Revision(json.loads(data)) for data, in res.fetchall()]
+
+        return revisions
+
+
+differential_revision_repo = DifferentialRevisionRepo()
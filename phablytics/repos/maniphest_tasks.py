@@ -0,0 +1,326 @@
+# Python Standard Library Imports
+import itertools
+import json
+import math
+import time
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.constants import MANIPHEST_ASSIGNED_NONE
+from phablytics.db import sqlite_do
+from phablytics.settings import MANIPHEST_MIRROR_DB_FILE
+
+
+# isort: off
+
+
+class ManiphestTaskRepo:
+    """Local mirror of Maniphest tasks, kept current by incremental syncs
+
+    See: `phablytics.utils.phab.sync_maniphest_tasks()`
+    """
+    DB_FILE = MANIPHEST_MIRROR_DB_FILE
+    TASKS_TABLE_NAME = 'maniphest_tasks'
+    TASK_PROJECTS_TABLE_NAME = 'maniphest_task_projects'
+    SYNC_RUNS_TABLE_NAME = 'maniphest_sync_runs'
+    TASK_CHANGES_TABLE_NAME = 'maniphest_task_changes'
+
+    # `maniphest.search` constraints which can be answered by `search()`
+    SUPPORTED_CONSTRAINTS = {
+        'ids',
+        'phids',
+        'assigned',
+        'authorPHIDs',
+        'closerPHIDs',
+        'projects',
+        'statuses',
+        'subtypes',
+        'createdStart',
+        'createdEnd',
+        'closedStart',
+        'closedEnd',
+        'modifiedStart',
+        'modifiedEnd',
+    }
+
+    # `maniphest.search` order vectors which can be answered by `search()`
+    SUPPORTED_ORDERS = {
+        ('-id', ): 'id ASC',  # oldest first
+        ('id', ): 'id DESC',  # newest first
+    }
+
+    # tasks written per transaction by `save_tasks()`, i.e. one `maniphest.search` page
+    SAVE_BATCH_SIZE = 100
+
+    def __init__(self):
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.TASKS_TABLE_NAME}(
+id INTEGER PRIMARY KEY,
+phid VARCHAR UNIQUE,
+owner_phid VARCHAR,
+author_phid VARCHAR,
+closer_phid VARCHAR,
+subtype VARCHAR,
+status VARCHAR,
+points REAL,
+date_created INTEGER,
+date_modified INTEGER,
+date_closed INTEGER,
+data TEXT
+)""")
+            for column in ('owner_phid', 'author_phid', 'closer_phid', 'subtype', 'status', 'date_created', 'date_closed', 'date_modified', ):
+                cur.execute(
+                    f"""CREATE INDEX IF NOT EXISTS {self.TASKS_TABLE_NAME}_{column} ON {self.TASKS_TABLE_NAME}({column})"""
+                )
+
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.TASK_PROJECTS_TABLE_NAME}(
+task_id INTEGER,
+project_phid VARCHAR,
+PRIMARY KEY (task_id, project_phid)
+)""")
+            cur.execute(
+                f"""CREATE INDEX IF NOT EXISTS {self.TASK_PROJECTS_TABLE_NAME}_project_phid ON {self.TASK_PROJECTS_TABLE_NAME}(project_phid)"""
+            )
+
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.SYNC_RUNS_TABLE_NAME}(
+version INTEGER PRIMARY KEY AUTOINCREMENT,
+timestamp INTEGER,
+high_water_mark INTEGER,
+num_fetched INTEGER,
+num_updated INTEGER
+)""")
+
+            # timestamps of tasks updated by each sync run, before and after the update,
+            # so that results derived from the mirror can tell if they are affected
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.TASK_CHANGES_TABLE_NAME}(
+version INTEGER,
+task_id INTEGER,
+date_created INTEGER,
+date_closed INTEGER,
+prev_date_closed INTEGER
+)""")
+            cur.execute(
+                f"""CREATE INDEX IF NOT EXISTS {self.TASK_CHANGES_TABLE_NAME}_version ON {self.TASK_CHANGES_TABLE_NAME}(version)"""
+            )
+
+    ##
+    # Sync
+
+    def get_last_sync_run(self):
+        """Returns the most recent sync run as a dict, or None if never synced
+        """
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT version, timestamp, high_water_mark, num_fetched, num_updated FROM {self.SYNC_RUNS_TABLE_NAME} ORDER BY version DESC LIMIT 1"""
+            )
+            row = res.fetchone()
+
+        if row:
+            sync_run = dict(zip(('version', 'timestamp', 'high_water_mark', 'num_fetched', 'num_updated', ), row))
+        else:
+            sync_run = None
+
+        return sync_run
+
+    @property
+    def high_water_mark(self):
+        """The largest `dateModified` of any task mirrored so far
+        """
+        sync_run = self.get_last_sync_run()
+        hwm = sync_run['high_water_mark'] if sync_run else None
+        return hwm
+
+    @property
+    def version(self):
+        sync_run = self.get_last_sync_run()
+        version = sync_run['version'] if sync_run else None
+        return version
+
+    @property
+    def is_synced(self):
+        return self.get_last_sync_run() is not None
+
+    def save_tasks(self, tasks):
+        """Upserts `tasks` and records a sync run
+
+        `tasks` may be any iterable, e.g. streamed from Conduit; they are written
+        `SAVE_BATCH_SIZE` at a time, so only one batch is held in memory.
+        The sync run (and so the new high-water mark) is recorded once all are written.
+
+        Returns the sync run as a dict.
+        """
+        previous_hwm = self.high_water_mark
+        hwm = previous_hwm or 0
+        num_fetched = 0
+        num_updated = 0
+        task_changes = []
+
+        tasks = iter(tasks)
+        while True:
+            batch = list(itertools.islice(tasks, self.SAVE_BATCH_SIZE))
+            if not batch:
+                break
+
+            num_fetched += len(batch)
+            hwm = max([hwm] + [task.modified_ts for task in batch])
+
+            with sqlite_do(self.DB_FILE) as cur:
+                for task in batch:
+                    row = cur.execute(
+                        f"""SELECT date_modified, date_closed FROM {self.TASKS_TABLE_NAME} WHERE id = ?""",
+                        (task.id_, )
+                    ).fetchone()
+                    if row and row[0] == task.modified_ts:
+                        # unchanged; `modifiedStart` is inclusive, so the last task of the previous sync is always re-fetched
+                        continue
+
+                    num_updated += 1
+                    if previous_hwm is not None:
+                        # nothing can have been derived from the mirror before the initial sync
+                        task_changes.append((task.id_, task.created_ts, task.closed_ts, row[1] if row else None, ))
+
+                    cur.execute(
+                        f"""INSERT OR REPLACE INTO {self.TASKS_TABLE_NAME}
+(id, phid, owner_phid, author_phid, closer_phid, subtype, status, points, date_created, date_modified, date_closed, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (
+                            task.id_,
+                            task.phid,
+                            task.owner_phid,
+                            task.author_phid,
+                            task.closer_phid,
+                            task.subtype,
+                            task.status_value,
+                            task.points,
+                            task.created_ts,
+                            task.modified_ts,
+                            task.closed_ts,
+                            json.dumps(task.to_raw_data()),
+                        )
+                    )
+                    cur.execute(f"""DELETE FROM {self.TASK_PROJECTS_TABLE_NAME} WHERE task_id = ?""", (task.id_, ))
+                    cur.executemany(
+                        f"""INSERT INTO {self.TASK_PROJECTS_TABLE_NAME} (task_id, project_phid) VALUES (?, ?)""",
+                        [(task.id_, project_phid, ) for project_phid in set(task.project_phids)]
+                    )
+
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(
+                f"""INSERT INTO {self.SYNC_RUNS_TABLE_NAME} (timestamp, high_water_mark, num_fetched, num_updated)
+VALUES (?, ?, ?, ?)""",
+                (math.floor(time.time()), hwm, num_fetched, num_updated, )
+            )
+            version = cur.lastrowid
+            cur.executemany(
+                f"""INSERT INTO {self.TASK_CHANGES_TABLE_NAME} (version, task_id, date_created, date_closed, prev_date_closed)
+VALUES (?, ?, ?, ?, ?)""",
+                [(version, ) + task_change for task_change in task_changes]
+            )
+
+        sync_run = self.get_last_sync_run()
+        return sync_run
+
+    def has_changes_since(self, version, start_ts, end_ts):
+        """Checks whether any sync after `version` updated a task created or closed between `start_ts` and `end_ts`
+
+        Closed includes the previous close date of reopened tasks.
+        """
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT 1 FROM {self.TASK_CHANGES_TABLE_NAME} WHERE version > ? AND (
+(date_created BETWEEN ? AND ?)
+OR (date_closed BETWEEN ? AND ?)
+OR (prev_date_closed BETWEEN ? AND ?)
+) LIMIT 1""",
+                (version, ) + (start_ts, end_ts, ) * 3
+            )
+            has_changes = res.fetchone() is not None
+
+        return has_changes
+
+    ##
+    # Queries
+
+    def can_search(self, constraints, order=None):
+        """Checks whether `search()` can answer a `maniphest.search` with `constraints` and `order`
+        """
+        order_key = tuple(order) if order else ('-id', )
+        projects = constraints.get('projects', [])
+        can_search = (
+            self.is_synced
+            and set(constraints.keys()) <= self.SUPPORTED_CONSTRAINTS
+            and order_key in self.SUPPORTED_ORDERS
+            # `projects` may also contain slugs, which are not mirrored
+            and all(phid.startswith('PHID-') for phid in projects)
+        )
+        return can_search
+
+    def search(self, constraints, order=None, keep_raw_data=True):
+        """Searches mirrored tasks, with the same `constraints` and `order` as `maniphest.search`
+
+        Check `can_search()` first.
+        """
+        order_key = tuple(order) if order else ('-id', )
+
+        clauses = []
+        params = []
+
+        def _in(column, values):
+            clauses.append(f"""{column} IN ({', '.join(['?'] * len(values))})""")
+            params.extend(values)
+
+        list_constraints = (
+            ('ids', 'id', ),
+            ('phids', 'phid', ),
+            ('authorPHIDs', 'author_phid', ),
+            ('closerPHIDs', 'closer_phid', ),
+            ('statuses', 'status', ),
+            ('subtypes', 'subtype', ),
+        )
+        for key, column in list_constraints:
+            if constraints.get(key):
+                _in(column, constraints[key])
+
+        if constraints.get('assigned'):
+            owner_phids = [phid for phid in constraints['assigned'] if phid != MANIPHEST_ASSIGNED_NONE]
+            owner_clauses = []
+            if owner_phids:
+                owner_clauses.append(f"""owner_phid IN ({', '.join(['?'] * len(owner_phids))})""")
+                params.extend(owner_phids)
+            if MANIPHEST_ASSIGNED_NONE in constraints['assigned']:
+                owner_clauses.append('owner_phid IS NULL')
+            clauses.append(f"""({' OR '.join(owner_clauses)})""")
+
+        range_constraints = (
+            ('createdStart', 'date_created', '>=', ),
+            ('createdEnd', 'date_created', '<=', ),
+            ('closedStart', 'date_closed', '>=', ),
+            ('closedEnd', 'date_closed', '<=', ),
+            ('modifiedStart', 'date_modified', '>=', ),
+            ('modifiedEnd', 'date_modified', '<=', ),
+        )
+        for key, column, operator in range_constraints:
+            if constraints.get(key) is not None:
+                clauses.append(f'{column} {operator} ?')
+                params.append(constraints[key])
+
+        # like `maniphest.search`, `projects` is 'AND'
+        for project_phid in constraints.get('projects', []):
+            clauses.append(
+                f"""id IN (SELECT task_id FROM {self.TASK_PROJECTS_TABLE_NAME} WHERE project_phid = ?)"""
+            )
+            params.append(project_phid)
+
+        where = ' AND '.join(clauses) if clauses else '1'
+
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT data FROM {self.TASKS_TABLE_NAME} WHERE {where} ORDER BY {self.SUPPORTED_ORDERS[order_key]}""",
+                params
+            )
+            tasks = [Maniphest(json.loads(data), keep_raw_data=keep_raw_data) for data, in res.fetchall()]
+
+        return tasks
+
+
+maniphest_task_repo = ManiphestTaskRepo()
@@ -0,0 +1,117 @@
+# Python Standard Library Imports
+import json
+import math
+import time
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.db import sqlite_do
+from phablytics.settings import METRICS_RESULTS_DB_FILE
+
+
+# isort: off
+
+
+class MetricResultRepo:
+    """Materialized tasks created/closed for completed metric intervals
+
+    Entries record the Maniphest mirror version (if any) they were computed from,
+    so that they can be invalidated by later syncs.
+    See: `phablytics.metrics.metrics.Metrics._retrieve_tasks_by_interval()`
+    """
+    DB_FILE = METRICS_RESULTS_DB_FILE
+    TABLE_NAME = 'metric_results'
+
+    # every metrics page stores the same tasks created/closed, so pages differ only by `subtypes`
+    KEY_COLUMNS = (
+        'subtypes',
+        'team',
+        'customer',
+        'projects',
+        'username',
+        'interval_start',
+        'interval_end',
+    )
+
+    def __init__(self):
+        with sqlite_do(self.DB_FILE) as cur:
+            # earlier versions also keyed on a `metric_type`, which was always 'TaskMetric';
+            # results can be recomputed, so the old table is dropped rather than migrated
+            columns = [row[1] for row in cur.execute(f"""PRAGMA table_info({self.TABLE_NAME})""")]
+            if 'metric_type' in columns:
+                cur.execute(f"""DROP TABLE {self.TABLE_NAME}""")
+
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.TABLE_NAME}(
+subtypes VARCHAR,
+team VARCHAR,
+customer VARCHAR,
+projects VARCHAR,
+username VARCHAR,
+interval_start INTEGER,
+interval_end INTEGER,
+mirror_version INTEGER,
+computed_at INTEGER,
+tasks_created TEXT,
+tasks_closed TEXT,
+PRIMARY KEY ({', '.join(self.KEY_COLUMNS)})
+)""")
+
+    def _key_params(self, key, interval_start, interval_end):
+        params = (
+            key['subtypes'],
+            key['team'],
+            key['customer'],
+            key['projects'],
+            key['username'],
+            interval_start,
+            interval_end,
+        )
+        return params
+
+    def get(self, key, interval_start, interval_end):
+        """Returns the entry for `key` and the interval as a dict, or None
+
+        `key` is a dict with all of `KEY_COLUMNS` except the interval.
+        """
+        where = ' AND '.join([f'{column} = ?' for column in self.KEY_COLUMNS])
+
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT mirror_version, computed_at, tasks_created, tasks_closed FROM {self.TABLE_NAME} WHERE {where}""",
+                self._key_params(key, interval_start, interval_end)
+            )
+            row = res.fetchone()
+
+        if row:
+            mirror_version, computed_at, tasks_created, tasks_closed = row
+            entry = {
+                'mirror_version': mirror_version,
+                'computed_at': computed_at,
+                'tasks_created': [Maniphest(data, keep_raw_data=False) for data in json.loads(tasks_created)],
+                'tasks_closed': [Maniphest(data, keep_raw_data=False) for data in json.loads(tasks_closed)],
+            }
+        else:
+            entry = None
+
+        return entry
+
+    def save(self, key, interval_start, interval_end, tasks_created, tasks_closed, mirror_version=None):
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(
+                f"""INSERT OR REPLACE INTO {self.TABLE_NAME}
+({', '.join(self.KEY_COLUMNS)}, mirror_version, computed_at, tasks_created, tasks_closed)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                self._key_params(key, interval_start, interval_end) + (
+                    mirror_version,
+                    math.floor(time.time()),
+                    json.dumps([task.to_raw_data() for task in tasks_created]),
+                    json.dumps([task.to_raw_data() for task in tasks_closed]),
+                )
+            )
+
+    def clear(self):
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(f"""DELETE FROM {self.TABLE_NAME}""")
+
+
+metric_result_repo = MetricResultRepo()
@@ -4,7 +4,7 @@ import sqlite3
 import time
 
 # Phablytics Imports
-from phablytics.utils.db import sqlite_do
+from phablytics.db import sqlite_do
 
 
 class ReportLastRunRepo:
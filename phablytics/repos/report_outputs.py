@@ -0,0 +1,87 @@
+# Python Standard Library Imports
+import time
+
+# Phablytics Imports
+from phablytics.db import sqlite_do
+from phablytics.settings import REPORT_OUTPUTS_DB_FILE
+
+
+# isort: off
+
+
+class ReportOutputRepo:
+    """Rendered HTML report outputs, served by the web UI, by report name, with when they were generated
+
+    See: `phablytics.reports.base.PhablyticsReport.save_output()`
+    """
+    DB_FILE = REPORT_OUTPUTS_DB_FILE
+    TABLE_NAME = 'report_outputs'
+    # the only format stored, since the web UI is the only reader
+    OUTPUT_FORMAT = 'html'
+
+    def __init__(self):
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(f"""CREATE TABLE IF NOT EXISTS {self.TABLE_NAME}(
+report_name VARCHAR,
+output_format VARCHAR,
+generated_at REAL,
+content TEXT,
+PRIMARY KEY (report_name, output_format)
+)""")
+
+    def get(self, report_name):
+        """Returns the stored output as a dict with `report` and `generated_at`, or None
+        """
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT generated_at, content FROM {self.TABLE_NAME} WHERE report_name = ? AND output_format = ?""",
+                (report_name, self.OUTPUT_FORMAT, )
+            )
+            row = res.fetchone()
+
+        if row:
+            generated_at, content = row
+            entry = {
+                'report': content,
+                'generated_at': generated_at,
+            }
+        else:
+            entry = None
+
+        return entry
+
+    def get_generated_at(self, report_name):
+        """Returns when the stored output was generated (a timestamp), without loading it, or None
+        """
+        with sqlite_do(self.DB_FILE) as cur:
+            res = cur.execute(
+                f"""SELECT generated_at FROM {self.TABLE_NAME} WHERE report_name = ? AND output_format = ?""",
+                (report_name, self.OUTPUT_FORMAT, )
+            )
+            row = res.fetchone()
+            generated_at = row[0] if row else None
+
+        return generated_at
+
+    def save(self, report_name, report, generated_at=None):
+        generated_at = time.time() if generated_at is None else generated_at
+
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(
+                f"""INSERT OR REPLACE INTO {self.TABLE_NAME}
+(report_name, output_format, generated_at, content)
+VALUES (?, ?, ?, ?)""",
+                (
+                    report_name,
+                    self.OUTPUT_FORMAT,
+                    generated_at,
+                    report,
+                )
+            )
+
+    def clear(self):
+        with sqlite_do(self.DB_FILE) as cur:
+            cur.execute(f"""DELETE FROM {self.TABLE_NAME}""")
+
+
+report_output_repo = ReportOutputRepo()
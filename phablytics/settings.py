@@ -14,6 +14,15 @@ PHABLYTICS_BASE_URL = 'configure_me'
 PHABRICATOR_INSTANCE_BASE_URL = 'configure_me'
 CONDUIT_API_TOKEN = 'configure_me'
 
+# Conduit HTTP transport
+CONDUIT_POOL_SIZE = 10  # max keep-alive connections to the Phabricator instance
+CONDUIT_TIMEOUT = 5  # seconds
+CONDUIT_METHOD_TIMEOUTS = {
+    # per-method overrides, e.g.
+    # 'maniphest.search': 30,
+}
+CONDUIT_MAX_CONCURRENCY = 8  # max Conduit calls in flight at once across the process, should not exceed `CONDUIT_POOL_SIZE`
+
 ADMIN_USERNAME = 'configure_me'
 
 GROUPS = {
@@ -24,8 +33,77 @@ GROUPS = {
 
 REVISION_ACCEPTANCE_THRESHOLD = 2
 
+# Caching
+
+CACHE_BACKEND = 'lru'  # one of: 'lru' (in-process), 'sqlite', 'redis'
+CACHE_LRU_MAXSIZE = 1024
+CACHE_SQLITE_DB_FILE = 'phablytics.cache.sqlite'
+CACHE_REDIS_URL = 'redis://localhost:6379/0'
+CACHE_KEY_PREFIX = 'phablytics:'
+CACHE_DEFAULT_TTL = 60 * 60  # 1 hour
+CACHE_TTLS = {
+    # per-function overrides, in seconds
+    'get_all_projects': 60 * 60,
+    'get_customers': 60 * 60,
+    'get_customer_project': 60 * 60,
+    'get_projects_by_phid': 60 * 60,
+    'get_customers_by_phid': 60 * 60,
+    'get_active_usernames': 60 * 60,
+}
+
+# Cache `phid.query` results (users, repos, projects, ... by PHID) in-process, so only unknown PHIDs are queried
+PHID_CACHE_ENABLED = True
+PHID_CACHE_MAXSIZE = 10000
+PHID_CACHE_TTL = 60 * 60  # 1 hour
+PHID_QUERY_BATCH_SIZE = 100  # max PHIDs per `phid.query`; more are split into batches, queried concurrently
+
+# Local mirrors
+
+# Answer Maniphest queries from a local SQLite mirror, kept current by incremental syncs
+# The mirror is only used after the initial sync: `phablytics --sync`
+MANIPHEST_MIRROR_ENABLED = False
+MANIPHEST_MIRROR_DB_FILE = 'phablytics.sqlite'
+MANIPHEST_MIRROR_MAX_AGE = 5 * 60  # seconds; sync before answering queries if the last sync is older than this
+
+# Answer Differential revision queries (Revision Status, Group Review Status reports) from a local SQLite mirror
+# The mirror is only used after the initial sync: `phablytics --sync`
+DIFFERENTIAL_MIRROR_ENABLED = False
+DIFFERENTIAL_MIRROR_DB_FILE = 'phablytics.sqlite'
+DIFFERENTIAL_MIRROR_MAX_AGE = 5 * 60  # seconds
+# Saved queries (`query_key`) are fully synced again this often, replacing which revisions match them;
+# in between, incremental syncs only see changes to revisions modified since the previous sync
+DIFFERENTIAL_MIRROR_QUERY_KEY_FULL_SYNC_INTERVAL = 60 * 60  # seconds
+
+# Metrics
+
+# Fetch tasks created/closed once for the entire metrics period, and split them into intervals locally,
+# instead of querying Conduit separately for every interval
+METRICS_BUCKET_INTERVALS_LOCALLY = True
+
+# Store tasks created/closed for metric intervals which have already ended, and reuse them on later requests;
+# only the current interval is recomputed
+METRICS_RESULTS_CACHE_ENABLED = True
+METRICS_RESULTS_DB_FILE = 'phablytics.sqlite'
+# With `MANIPHEST_MIRROR_ENABLED`, stored intervals are invalidated when a sync updates any of their tasks;
+# otherwise late edits cannot be detected, and stored intervals expire after this long
+METRICS_RESULTS_TTL = 24 * 60 * 60  # seconds
+
+# Max number of groups shown per aggregated metrics segment (e.g. Tasks by Owner/Author);
+# the smallest groups are merged into 'Other'. `None` for no limit
+METRICS_SEGMENT_MAX_GROUPS = 20
+
 # Reports
 
+# Max number of reports generated concurrently by `phablytics --all` / `phablytics --reports`
+REPORTS_MAX_WORKERS = 4
+
+# Store rendered report outputs with the time they were generated, so that the web UI serves
+# the output of the last run (e.g. by cron) instead of generating the report on every page view
+REPORT_OUTPUTS_DB_FILE = 'phablytics.sqlite'
+# The web UI generates reports again once their stored output is older than this;
+# override per report with `ReportConfig.web_max_age`
+REPORT_OUTPUTS_MAX_AGE = 60 * 60  # seconds
+
 @dataclass
 class ReportConfig:
     name: str
@@ -62,6 +140,8 @@ class ReportConfig:
     custom_exclusions: list = field(default_factory=list)
     # RecentTasks, RevisionStatus
     usernames: list = field(default_factory=list)
+    # Web UI: seconds a stored output is served for, `None` for `REPORT_OUTPUTS_MAX_AGE`
+    web_max_age: int = None
 
 CUSTOMERS = {
     'id': None,
@@ -131,6 +211,35 @@ CUSTOM_STATIC_DIR = None
 
 CUSTOM_STYLESHEETS = []
 
+# Filter metrics by user with a text input suggesting matching usernames (see `/metrics/autocomplete/<field>.json`),
+# instead of a dropdown listing every active user
+METRICS_FILTER_USERNAME_AUTOCOMPLETE = True
+
+# Metrics pages render right away, and poll for stats computed by background jobs;
+# identical requests share a job, and its result for `METRICS_JOB_RESULT_TTL`
+METRICS_JOB_WORKERS = 4  # max metrics computed concurrently, per web server process
+METRICS_JOB_RESULT_TTL = 5 * 60  # seconds
+METRICS_JOB_MAX_JOBS = 100  # max finished jobs (and their results) kept, per web server process
+
+# `Cache-Control` of pages, by blueprint; pages are tagged with ETags, so browsers can revalidate cheaply
+WEB_CACHE_CONTROL = {
+    'explore_endpoints': 'private, max-age=300',
+    'metrics_endpoints': 'private, no-cache',
+    'reports_endpoints': 'private, no-cache',
+}
+# Compress HTML and JSON responses at least this large (bytes) with gzip
+WEB_COMPRESS_MIN_SIZE = 1024
+WEB_COMPRESS_LEVEL = 6
+
+# Production web server: `phablytics-web --production`
+WEB_WORKERS = 4  # worker processes
+WEB_THREADS = 8  # max concurrent requests per worker process
+WEB_GRACEFUL_TIMEOUT = 30  # seconds given to requests in flight on shutdown, before workers are killed
+# Cache backend used by the worker processes instead of an in-process `CACHE_BACKEND = 'lru'`,
+# e.g. 'sqlite' or 'redis', so that workers share one copy of cached projects, customers, etc.;
+# `None` for a cache per worker
+WEB_SHARED_CACHE_BACKEND = None
+
 ##
 # Import Local Settings if `local_settings.py` exists in CWD
 
@@ -0,0 +1,166 @@
+# Python Standard Library Imports
+import copy
+import threading
+
+# Third Party (PyPI) Imports
+import requests
+from phabricator import (
+    INTERFACES,
+    Phabricator,
+    Resource,
+    parse_interfaces,
+)
+from requests.adapters import (
+    HTTPAdapter,
+    Retry,
+)
+
+
+# isort: off
+
+
+class ConduitTransport:
+    """HTTP transport shared by every Conduit call made through `PooledPhabricator`
+
+    `python-phabricator` creates a brand new `requests.Session` for every
+    resource lookup (e.g. each `PHAB.maniphest.search`), so every call pays
+    for a fresh TCP + TLS handshake.
+
+    This transport holds a single session with a persistent keep-alive
+    connection pool, and is used in place of those per-call sessions.
+
+    Any object implementing `post(url, **kwargs)` and `stats` can be used as
+    a transport instead.
+    """
+    def __init__(self, pool_size=10, timeout=5, method_timeouts=None, max_retries=3, max_concurrency=None):
+        """
+        - `pool_size`: max number of connections to keep alive per host
+        - `timeout`: default timeout (in seconds) for each Conduit call
+        - `method_timeouts`: per-method timeout overrides, e.g. `{'maniphest.search': 30}`
+        - `max_concurrency`: max number of Conduit calls in flight at once, from any thread
+          (default: `pool_size`); other calls wait for one to complete
+        """
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency or pool_size
+        self.timeout = timeout
+        self.method_timeouts = method_timeouts or {}
+
+        self.adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=max_retries,
+                connect=max_retries,
+                allowed_methods=['HEAD', 'GET', 'POST', 'PATCH', 'PUT', 'OPTIONS']
+            )
+        )
+
+        self.session = requests.Session()
+        self.session.headers['Connection'] = 'keep-alive'
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+        self._lock = threading.Lock()
+        self._call_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self.num_calls = 0
+        self.num_calls_by_method = {}
+
+    def get_timeout(self, method_name, default=None):
+        timeout = self.method_timeouts.get(method_name, self.timeout or default)
+        return timeout
+
+    def post(self, url, timeout=None, **kwargs):
+        """Sends a Conduit call through the shared session
+
+        `timeout` passed in by the caller is only used as a fallback when
+        neither a per-method nor a default timeout is configured.
+        """
+        method_name = url.rsplit('/', 1)[-1]
+
+        with self._lock:
+            self.num_calls += 1
+            self.num_calls_by_method[method_name] = self.num_calls_by_method.get(method_name, 0) + 1
+
+        with self._call_slots:
+            response = self.session.post(url, timeout=self.get_timeout(method_name, default=timeout), **kwargs)
+        return response
+
+    @property
+    def stats(self):
+        """Counters showing how well connections are being reused
+
+        `num_requests` counts HTTP requests (including retries), which may
+        differ from `num_calls` (Conduit method invocations).
+        """
+        pools = self.adapter.poolmanager.pools
+        connection_pools = [pools[key] for key in pools.keys()]
+
+        num_requests = sum(pool.num_requests for pool in connection_pools)
+        num_connections = sum(pool.num_connections for pool in connection_pools)
+
+        stats = {
+            'pool_size': self.pool_size,
+            'max_concurrency': self.max_concurrency,
+            'num_calls': self.num_calls,
+            'num_calls_by_method': dict(self.num_calls_by_method),
+            'num_requests': num_requests,
+            'num_connections_opened': num_connections,
+            'num_connections_reused': max(num_requests - num_connections, 0),
+        }
+        return stats
+
+    def close(self):
+        self.session.close()
+
+
+class PooledResource(Resource):
+    """A Conduit `Resource` that sends requests through `api.transport`
+    """
+    def __init__(self, api, interface=None, endpoint=None, method=None, nested=False):
+        # NOTE: intentionally does not call `Resource.__init__()`,
+        # which would create (and throw away) a new `requests.Session`
+        self.api = api
+        self._interface = interface or copy.deepcopy(parse_interfaces(INTERFACES))
+        self.endpoint = endpoint
+        self.method = method
+        self.nested = nested
+
+    @property
+    def session(self):
+        """Overrides the per-resource session of `Resource`
+
+        Looked up on every call, so that the transport of the API object can be swapped at any time.
+        """
+        return self.api.transport
+
+    def __getattr__(self, attr):
+        """Same lookup as `Resource.__getattr__()`, but returns `PooledResource` objects
+        """
+        if attr in getattr(self, '__dict__'):
+            return getattr(self, attr)
+        interface = self._interface
+        if self.nested:
+            attr = '%s.%s' % (self.endpoint, attr)
+        submethod_exists = False
+        submethod_match = attr + '.'
+        for key in interface.keys():
+            if key.startswith(submethod_match):
+                submethod_exists = True
+                break
+        if attr not in interface and submethod_exists:
+            return PooledResource(self.api, interface, attr, self.endpoint, nested=True)
+        elif attr not in interface:
+            interface[attr] = {}
+        if self.nested:
+            return PooledResource(self.api, interface[attr], attr, self.method)
+        return PooledResource(self.api, interface[attr], attr, self.endpoint)
+
+
+class PooledPhabricator(Phabricator, PooledResource):
+    """Conduit API client which shares one pluggable transport across all calls
+    """
+    def __init__(self, transport=None, **kwargs):
+        # set before anything else, since attribute lookups on `Resource` fall through to Conduit methods
+        self.transport = transport or ConduitTransport(timeout=kwargs.get('timeout', 5))
+
+        super(PooledPhabricator, self).__init__(**kwargs)
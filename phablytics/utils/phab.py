@@ -2,14 +2,26 @@
 from __future__ import absolute_import
 
 # Python Standard Library Imports
+import hashlib
+import itertools
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import lru_cache
 
-# Third Party (PyPI) Imports
-from phabricator import Phabricator
-
 # Phablytics Imports
+from phablytics.cache import (
+    cached,
+    invalidate_caches,
+    register_cache_stats,
+)
+from phablytics.cache.backends import (
+    CACHE_MISS,
+    LRUCacheBackend,
+)
 from phablytics.classes import (
     Maniphest,
     PhabricatorEntity,
@@ -26,10 +38,31 @@ from phablytics.constants import (
     REVISION_STATUSES_IN_REVIEW,
     REVISION_STATUSES_WIP,
 )
+from phablytics.repos import (
+    differential_revision_repo,
+    maniphest_task_repo,
+)
 from phablytics.settings import (
     CONDUIT_API_TOKEN,
+    CONDUIT_MAX_CONCURRENCY,
+    CONDUIT_METHOD_TIMEOUTS,
+    CONDUIT_POOL_SIZE,
+    CONDUIT_TIMEOUT,
     CUSTOMERS,
+    DIFFERENTIAL_MIRROR_ENABLED,
+    DIFFERENTIAL_MIRROR_MAX_AGE,
+    DIFFERENTIAL_MIRROR_QUERY_KEY_FULL_SYNC_INTERVAL,
+    MANIPHEST_MIRROR_ENABLED,
+    MANIPHEST_MIRROR_MAX_AGE,
     PHABRICATOR_INSTANCE_BASE_URL,
+    PHID_CACHE_ENABLED,
+    PHID_CACHE_MAXSIZE,
+    PHID_CACHE_TTL,
+    PHID_QUERY_BATCH_SIZE,
+)
+from phablytics.utils.conduit import (
+    ConduitTransport,
+    PooledPhabricator,
 )
 
 
@@ -40,9 +73,16 @@ from phablytics.settings import (
 # Phabricator / Conduit Utils
 
 
-PHAB = Phabricator(
+PHAB = PooledPhabricator(
     host=f'{PHABRICATOR_INSTANCE_BASE_URL}/api/',
-    token=CONDUIT_API_TOKEN
+    token=CONDUIT_API_TOKEN,
+    timeout=CONDUIT_TIMEOUT,
+    transport=ConduitTransport(
+        pool_size=CONDUIT_POOL_SIZE,
+        timeout=CONDUIT_TIMEOUT,
+        method_timeouts=CONDUIT_METHOD_TIMEOUTS,
+        max_concurrency=CONDUIT_MAX_CONCURRENCY
+    )
 )
 
 
@@ -51,18 +91,97 @@ def update_interfaces():
     whoami()
 
 
+def get_conduit_stats():
+    """Returns connection reuse counters for the Conduit transport
+    """
+    stats = PHAB.transport.stats
+    return stats
+
+
+def close_conduit_connections():
+    """Closes the pooled Conduit connections; new ones are opened as needed
+
+    E.g. before forking, so that processes don't share connections.
+    """
+    # custom transports only need to implement `post()` and `stats`
+    close = getattr(PHAB.transport, 'close', None)
+    if close is not None:
+        close()
+
+
 ##
 # PHIDs
 
 
+# `phid.query` results by PHID, see `get_phids()`
+PHID_CACHE = LRUCacheBackend(maxsize=PHID_CACHE_MAXSIZE)
+PHID_CACHE_STATS = register_cache_stats('phid_query', invalidate_all=lambda: invalidate_phid_cache())
+
+# PHID query results shared within `shared_phid_lookups()`, or None outside of it
+SHARED_PHID_RESULTS = None
+SHARED_PHID_RESULTS_LOCK = threading.Lock()
+
+
+@contextmanager
+def shared_phid_lookups():
+    """Within this context, results of `get_phids()` are remembered and shared
+    by every caller (and thread), so that each PHID is only queried once
+
+    E.g. reports run together look up the same users and repos.
+    """
+    global SHARED_PHID_RESULTS
+
+    with SHARED_PHID_RESULTS_LOCK:
+        is_outermost = SHARED_PHID_RESULTS is None
+        if is_outermost:
+            SHARED_PHID_RESULTS = {}
+
+    try:
+        yield
+    finally:
+        if is_outermost:
+            with SHARED_PHID_RESULTS_LOCK:
+                SHARED_PHID_RESULTS = None
+
+
 def get_phids(phids, as_object=PhabricatorEntity):
     """Retrieve objects for arbitrary PHIDs.
 
     https://secure.phabricator.com/conduit/method/phid.query/
+
+    Known PHIDs are served from `PHID_CACHE` (and within `shared_phid_lookups()`,
+    from results shared by other callers); only the others are queried, see `query_phids()`.
     """
     phids = list(set(phids))  # dedup PHIDs
 
-    results = PHAB.phid.query(phids=phids)
+    results = {}
+
+    shared_results = SHARED_PHID_RESULTS
+    if shared_results is not None:
+        with SHARED_PHID_RESULTS_LOCK:
+            results.update({phid: shared_results[phid] for phid in phids if phid in shared_results})
+
+    if PHID_CACHE_ENABLED:
+        for phid in phids:
+            if phid not in results:
+                value = PHID_CACHE.get(phid)
+                if value is not CACHE_MISS:
+                    results[phid] = value
+
+    missing_phids = [phid for phid in phids if phid not in results]
+    PHID_CACHE_STATS.record(hits=len(phids) - len(missing_phids), misses=len(missing_phids))
+
+    if missing_phids:
+        missing_results = query_phids(missing_phids)
+        results.update(missing_results)
+
+        if PHID_CACHE_ENABLED:
+            for phid, value in missing_results.items():
+                PHID_CACHE.set(phid, value, ttl=PHID_CACHE_TTL)
+
+        if shared_results is not None:
+            with SHARED_PHID_RESULTS_LOCK:
+                shared_results.update(missing_results)
 
     phid_objects_lookup = {
         phid: as_object(results[phid])
@@ -73,6 +192,51 @@ def get_phids(phids, as_object=PhabricatorEntity):
     return phid_objects_lookup
 
 
+def query_phids(phids):
+    """Queries `phids` with `phid.query`, bypassing any caches
+
+    Returns a dict of PHID to result, for the PHIDs which were found.
+
+    At most `PHID_QUERY_BATCH_SIZE` PHIDs are queried at a time; more are
+    split into batches, which are queried concurrently.
+    """
+    batches = [
+        phids[i:i + PHID_QUERY_BATCH_SIZE]
+        for i
+        in range(0, len(phids), PHID_QUERY_BATCH_SIZE)
+    ]
+
+    def _query(batch):
+        batch_results = dict(PHAB.phid.query(phids=batch))
+        return batch_results
+
+    if len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(batches), CONDUIT_MAX_CONCURRENCY)) as executor:
+            batches_results = list(executor.map(_query, batches))
+    else:
+        batches_results = [_query(batch) for batch in batches]
+
+    results = {}
+    for batch_results in batches_results:
+        results.update(batch_results)
+
+    return results
+
+
+def invalidate_phid_cache(phids=None, phid_type=None):
+    """Drops `phids`, or all PHIDs of `phid_type` (e.g. 'PROJ'), or all PHIDs, from `PHID_CACHE`
+
+    All PHIDs are also dropped by `invalidate_caches()`, e.g. `phablytics --clear-cache`.
+    """
+    if phids is not None:
+        for phid in phids:
+            PHID_CACHE.delete(phid)
+    elif phid_type is not None:
+        PHID_CACHE.delete_prefix(f'PHID-{phid_type}-')
+    else:
+        PHID_CACHE.delete_prefix('')
+
+
 ##
 # Adhoc
 
@@ -108,49 +272,239 @@ def fetch_differential_revisions(
     query_key=None,
     reviewer_phids=None,
     modified_after_dt=None,
-    modified_before_dt=None
+    modified_before_dt=None,
+    page_size=None,
+    max_count=None
 ):
     """Get revisions for `query_key` between `modified_after_dt` and `modified_before_dt`
 
     https://secure.phabricator.com/conduit/method/differential.revision.search/
+
+    When `DIFFERENTIAL_MIRROR_ENABLED`, revisions are retrieved from the local mirror.
+    See `iter_differential_revisions()` for the other arguments.
+    """
+    revisions = list(
+        iter_differential_revisions(
+            query_key=query_key,
+            reviewer_phids=reviewer_phids,
+            modified_after_dt=modified_after_dt,
+            modified_before_dt=modified_before_dt,
+            page_size=page_size,
+            max_count=max_count
+        )
+    )
+    return revisions
+
+
+def iter_differential_revisions(
+    query_key=None,
+    reviewer_phids=None,
+    modified_after_dt=None,
+    modified_before_dt=None,
+    page_size=None,
+    max_count=None
+):
+    """Like `fetch_differential_revisions()`, but yields revisions as each page arrives
+
+    - `page_size`: number of revisions per Conduit page (Conduit defaults to, and caps at, 100)
+    - `max_count`: stop after this many revisions
     """
+    statuses = (
+        REVISION_STATUSES_WIP
+        + REVISION_STATUSES_IN_REVIEW
+        # + REVISION_STATUSES_COMPLETED
+    )
+    modified_start = int(modified_after_dt.timestamp()) if modified_after_dt else None
+    modified_end = int(modified_before_dt.timestamp()) if modified_before_dt else None
+
+    if DIFFERENTIAL_MIRROR_ENABLED and differential_revision_repo.is_synced():
+        ensure_differential_mirror_is_fresh(query_key=query_key)
+        revisions = differential_revision_repo.search(
+            statuses=statuses,
+            query_key=query_key,
+            reviewer_phids=reviewer_phids,
+            modified_start=modified_start,
+            modified_end=modified_end
+        )
+        yield from itertools.islice(revisions, max_count)
+        return
+
     constraints = {
-        'statuses': (
-            REVISION_STATUSES_WIP
-            + REVISION_STATUSES_IN_REVIEW
-            # + REVISION_STATUSES_COMPLETED
-        ),
+        'statuses': statuses,
     }
 
     if reviewer_phids:
         constraints['reviewerPHIDs'] = reviewer_phids
-    if modified_after_dt:
-        constraints['modifiedStart'] = int(modified_after_dt.timestamp())
-    if modified_before_dt:
-        constraints['modifiedEnd'] = int(modified_before_dt.timestamp())
-
-    results = PHAB.differential.revision.search(
-        queryKey=query_key,
-        constraints=constraints,
-        attachments={'reviewers': True}
+    if modified_start:
+        constraints['modifiedStart'] = modified_start
+    if modified_end:
+        constraints['modifiedEnd'] = modified_end
+
+    yield from _iter_differential_revision_search(
+        constraints,
+        query_key=query_key,
+        page_size=page_size,
+        max_count=max_count
     )
 
-    revisions = [Revision(revision_data) for revision_data in results.data]
 
+def _iter_differential_revision_search(
+    constraints,
+    query_key=None,
+    page_size=None,
+    max_count=None,
+    keep_raw_data=True
+):
+    """Yields revisions matching `constraints`, with reviewers attached, following the pagination cursor
+
+    Only one page of results is held at a time.
+
+    https://secure.phabricator.com/conduit/method/differential.revision.search/
+    """
+    num_revisions = 0
+    has_more_results = max_count is None or max_count > 0
+    after = None
+
+    while has_more_results:
+        page_kwargs = {}
+        if page_size is not None:
+            page_kwargs['limit'] = page_size
+        if max_count is not None:
+            # don't fetch more than needed
+            page_kwargs['limit'] = min(page_size or 100, max_count - num_revisions)
+
+        # handle pagination, since limits are 100 at a time
+        results = PHAB.differential.revision.search(
+            queryKey=query_key,
+            constraints=constraints,
+            attachments={'reviewers': True},
+            after=after,
+            **page_kwargs
+        )
+
+        for revision_data in results.data:
+            yield Revision(revision_data, keep_raw_data=keep_raw_data)
+            num_revisions += 1
+
+        cursor = results.get('cursor', {})
+        after = cursor.get('after', None)
+        has_more_results = after is not None and (max_count is None or num_revisions < max_count)
+
+
+def get_differential_revisions(constraints, query_key=None, keep_raw_data=True):
+    """Get all revisions matching `constraints`, with reviewers attached
+
+    https://secure.phabricator.com/conduit/method/differential.revision.search/
+    """
+    revisions = list(
+        _iter_differential_revision_search(constraints, query_key=query_key, keep_raw_data=keep_raw_data)
+    )
     return revisions
 
 
+DIFFERENTIAL_SYNC_LOCK = threading.Lock()
+
+
+def sync_differential_revisions(query_key=None, full=False):
+    """Incrementally syncs the local Differential revision mirror
+
+    Fetches only revisions modified since the last sync of the same scope (all
+    revisions, or those matching saved query `query_key`), along with their reviewers.
+    The first sync of a scope, or one with `full`, fetches all of its revisions.
+
+    Returns the sync run as a dict, with counts of revisions fetched and updated.
+    """
+    scope = query_key or ''
+
+    with DIFFERENTIAL_SYNC_LOCK:
+        constraints = {}
+        high_water_mark = None if full else differential_revision_repo.get_high_water_mark(scope=scope)
+        if high_water_mark is not None:
+            constraints['modifiedStart'] = high_water_mark
+
+        revisions = get_differential_revisions(constraints, query_key=query_key, keep_raw_data=True)
+        sync_run = differential_revision_repo.save_revisions(revisions, scope=scope, modified_start=high_water_mark)
+
+    return sync_run
+
+
+def ensure_differential_mirror_is_fresh(query_key=None):
+    """Syncs the local Differential revision mirror if the last sync is older than `DIFFERENTIAL_MIRROR_MAX_AGE`
+
+    Both the scope of all revisions and that of saved query `query_key` (if any) are checked.
+    The saved query is fully synced again if its last full sync is older than
+    `DIFFERENTIAL_MIRROR_QUERY_KEY_FULL_SYNC_INTERVAL`.
+    """
+    scopes = [''] + ([query_key] if query_key else [])
+    for scope in scopes:
+        now = time.time()
+        sync_run = differential_revision_repo.get_last_sync_run(scope=scope)
+        full_sync_run = differential_revision_repo.get_last_sync_run(scope=scope, is_full=True) if scope else None
+
+        if scope and (
+            full_sync_run is None
+            or now - full_sync_run['timestamp'] > DIFFERENTIAL_MIRROR_QUERY_KEY_FULL_SYNC_INTERVAL
+        ):
+            sync_differential_revisions(query_key=scope, full=True)
+        elif sync_run is None or now - sync_run['timestamp'] > DIFFERENTIAL_MIRROR_MAX_AGE:
+            sync_differential_revisions(query_key=scope or None)
+
+
 ##
 # Maniphest
 
 
-def get_maniphest_tasks(constraints, order=None):
+def get_maniphest_tasks(constraints, order=None, use_mirror=True, keep_raw_data=True, with_columns=False):
     """Get Maniphest tasks
     https://secure.phabricator.com/conduit/method/maniphest.search/
+
+    Returns a list; see `iter_maniphest_tasks()`
     """
-    tasks = []
-    has_more_results = True
-    after = None
+    tasks = list(iter_maniphest_tasks(
+        constraints,
+        order=order,
+        use_mirror=use_mirror,
+        keep_raw_data=keep_raw_data,
+        with_columns=with_columns
+    ))
+    return tasks
+
+
+def iter_maniphest_tasks(
+    constraints,
+    order=None,
+    use_mirror=True,
+    keep_raw_data=True,
+    with_columns=False,
+    prefetch=False
+):
+    """Yields Maniphest tasks as result pages arrive
+    https://secure.phabricator.com/conduit/method/maniphest.search/
+
+    Only one page of results is held at a time, so consumers which don't keep
+    the tasks iterate over any number of them in bounded memory.
+
+    If `prefetch` is True, the next page is requested on a background thread
+    while the current page is being consumed.
+
+    When `MANIPHEST_MIRROR_ENABLED`, queries are answered from the local mirror
+    whenever the mirror supports `constraints` and `order`, unless `use_mirror` is False.
+
+    Conduit payloads are kept on the tasks (as `raw_data`) unless `keep_raw_data` is False,
+    see `Maniphest`.
+
+    If `with_columns` is True, workboard columns are attached (see `Maniphest.column_phids`);
+    these are not mirrored, so such queries always go to Conduit.
+    """
+    if (
+        use_mirror
+        and MANIPHEST_MIRROR_ENABLED
+        and not with_columns
+        and maniphest_task_repo.can_search(constraints, order=order)
+    ):
+        ensure_maniphest_mirror_is_fresh()
+        yield from maniphest_task_repo.search(constraints, order=order, keep_raw_data=keep_raw_data)
+        return
 
     if order is None:
         order = [
@@ -158,32 +512,92 @@ def get_maniphest_tasks(constraints, order=None):
         ]
 
     attachments = {
-        # 'columns': False,
+        'columns': with_columns,
         # 'subscribers': False,
         'projects': True,
     }
 
-    while has_more_results:
-        # handle pagination, since limits are 100 at a time
+    def _search(after):
         results = PHAB.maniphest.search(
             constraints=constraints,
             order=order,
             after=after,
             attachments=attachments
         )
+        return results
 
-        tasks.extend([
-            Maniphest(task_data)
-            for task_data
-            in results.data
-        ])
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
 
-        cursor = results.get('cursor', {})
-        after = cursor.get('after', None)
-        has_more_results = after is not None
+    try:
+        results = _search(None)
 
+        while results is not None:
+            # handle pagination, since limits are 100 at a time
+            cursor = results.get('cursor', {})
+            after = cursor.get('after', None)
 
-    return tasks
+            if executor is not None and after is not None:
+                next_results = executor.submit(_search, after)
+
+            for task_data in results.data:
+                yield Maniphest(task_data, keep_raw_data=keep_raw_data)
+
+            if after is None:
+                results = None
+            elif executor is not None:
+                results = next_results.result()
+            else:
+                results = _search(after)
+    finally:
+        if executor is not None:
+            # don't wait on a prefetched page nobody will consume, when iteration stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+MANIPHEST_SYNC_LOCK = threading.Lock()
+
+
+def sync_maniphest_tasks(only_if_stale=False):
+    """Incrementally syncs the local Maniphest mirror
+
+    Fetches only tasks modified since the last sync (the high-water mark),
+    along with their project attachments, and writes them to the mirror page by page.
+
+    If `only_if_stale`, the mirror is only synced if it is still stale once the sync lock
+    is held, i.e. unless another thread synced it meanwhile; see `ensure_maniphest_mirror_is_fresh()`.
+
+    Returns the sync run as a dict, with counts of tasks fetched and updated.
+    """
+    with MANIPHEST_SYNC_LOCK:
+        if only_if_stale and is_maniphest_mirror_fresh():
+            return maniphest_task_repo.get_last_sync_run()
+
+        constraints = {}
+        high_water_mark = maniphest_task_repo.high_water_mark
+        if high_water_mark is not None:
+            constraints['modifiedStart'] = high_water_mark
+
+        tasks = iter_maniphest_tasks(constraints, use_mirror=False, keep_raw_data=True, prefetch=True)
+        sync_run = maniphest_task_repo.save_tasks(tasks)
+
+    return sync_run
+
+
+def is_maniphest_mirror_fresh():
+    """Checks whether the last sync of the local Maniphest mirror is at most `MANIPHEST_MIRROR_MAX_AGE` old
+    """
+    sync_run = maniphest_task_repo.get_last_sync_run()
+    is_fresh = sync_run is not None and time.time() - sync_run['timestamp'] <= MANIPHEST_MIRROR_MAX_AGE
+    return is_fresh
+
+
+def ensure_maniphest_mirror_is_fresh():
+    """Syncs the local Maniphest mirror if the last sync is older than `MANIPHEST_MIRROR_MAX_AGE`
+
+    Threads finding it stale at the same time wait for a single sync.
+    """
+    if not is_maniphest_mirror_fresh():
+        sync_maniphest_tasks(only_if_stale=True)
 
 
 def get_maniphest_tasks_by_owners(owner_phids):
@@ -196,6 +610,14 @@ def get_maniphest_tasks_by_owners(owner_phids):
     return tasks
 
 
+def iter_maniphest_tasks_by_owners(owner_phids, prefetch=True):
+    constraints = {
+        'assigned': owner_phids,
+    }
+
+    yield from iter_maniphest_tasks(constraints, prefetch=prefetch)
+
+
 def get_maniphest_tasks_by_project_name(project_name, column_phids=None, order=None):
     """Get Maniphest tasks for a project
     """
@@ -203,12 +625,12 @@ def get_maniphest_tasks_by_project_name(project_name, column_phids=None, order=N
     return tasks
 
 
-def get_maniphest_tasks_by_project_names(project_names, column_phids=None, order=None):
-    """Get Maniphest tasks for a list of projects
+def get_project_tasks_constraints(project_names, column_phids=None):
+    """Get `maniphest.search` constraints for open tasks in a list of projects
 
     The search criteria will be AND for all projects.
     """
-    projects = [get_project_by_name(project_name) for project_name in project_names]
+    projects = get_projects_by_name(project_names)
 
     constraints = {
         'projects': [
@@ -218,6 +640,16 @@ def get_maniphest_tasks_by_project_names(project_names, column_phids=None, order
     }
     if column_phids:
         constraints['columnPHIDs'] = column_phids
+
+    return constraints
+
+
+def get_maniphest_tasks_by_project_names(project_names, column_phids=None, order=None):
+    """Get Maniphest tasks for a list of projects
+
+    The search criteria will be AND for all projects.
+    """
+    constraints = get_project_tasks_constraints(project_names, column_phids=column_phids)
     if order is None:
         order = [
             '-id',  # oldest first
@@ -228,17 +660,90 @@ def get_maniphest_tasks_by_project_names(project_names, column_phids=None, order
     return tasks
 
 
-def get_tasks_created_over_period(
-    period_start,
-    period_end,
-    subtypes=None,
-    author_phids=None,
-    project_phids=None
-):
-    subtypes = subtypes or MANIPHEST_SUBTYPES
+# `maniphest.search` orders which merged lists of tasks can be sorted by: (sort key, reverse, )
+MERGEABLE_MANIPHEST_ORDERS = {
+    # oldest first
+    ('-id', ): (lambda task: task.id_, False, ),
+    ('oldest', ): (lambda task: task.id_, False, ),
+    # newest first
+    ('id', ): (lambda task: task.id_, True, ),
+    ('newest', ): (lambda task: task.id_, True, ),
+    # most recently updated first
+    ('updated', 'id', ): (lambda task: (task.modified_ts, task.id_, ), True, ),
+    ('updated', ): (lambda task: (task.modified_ts, task.id_, ), True, ),
+    # least recently updated first
+    ('-updated', '-id', ): (lambda task: (task.modified_ts, task.id_, ), False, ),
+    ('outdated', ): (lambda task: (task.modified_ts, task.id_, ), False, ),
+}
+
+
+def merge_maniphest_tasks(task_lists, order=None):
+    """Merges lists of tasks (e.g. from separate queries per project) into one, without duplicates
+
+    Tasks are deduplicated by PHID, and the merged list is sorted by `order`,
+    which must be one of `MERGEABLE_MANIPHEST_ORDERS` (default: oldest first).
+    """
+    if isinstance(order, str):
+        order_key = (order, )
+    else:
+        order_key = tuple(order) if order else ('-id', )
 
+    if order_key not in MERGEABLE_MANIPHEST_ORDERS:
+        raise Exception(f'Tasks cannot be merged in order: {order}')
+
+    tasks_by_phid = {}
+    for tasks in task_lists:
+        for task in tasks:
+            tasks_by_phid.setdefault(task.phid, task)
+
+    sort_key, reverse = MERGEABLE_MANIPHEST_ORDERS[order_key]
+    tasks = sorted(tasks_by_phid.values(), key=sort_key, reverse=reverse)
+
+    return tasks
+
+
+def _split_constraints_by_projects(constraints, project_phids=None):
+    """Returns the constraints of a query for each of `project_phids`, or just `constraints` without projects
+
+    The Conduit `projects` constraint is 'AND', so "any of these projects" takes one query per project.
+    """
+    if project_phids:
+        constraints_list = [
+            dict(constraints, projects=[project_phid])
+            for project_phid
+            in project_phids
+        ]
+    else:
+        constraints_list = [constraints]
+    return constraints_list
+
+
+def get_maniphest_tasks_by_projects(constraints, project_phids=None, keep_raw_data=True):
+    """Fetches tasks matching `constraints` for any of `project_phids`
+
+    Each project is queried separately (concurrently), and the results concatenated in order.
+    """
+    constraints_list = _split_constraints_by_projects(constraints, project_phids=project_phids)
+    if len(constraints_list) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(constraints_list), CONDUIT_MAX_CONCURRENCY)) as executor:
+            tasks_by_project = list(executor.map(
+                lambda project_constraints: get_maniphest_tasks(project_constraints, keep_raw_data=keep_raw_data),
+                constraints_list
+            ))
+    else:
+        tasks_by_project = [get_maniphest_tasks(constraints_list[0], keep_raw_data=keep_raw_data)]
+
+    tasks = [
+        task
+        for project_tasks in tasks_by_project
+        for task in project_tasks
+    ]
+    return tasks
+
+
+def _get_tasks_created_constraints(period_start, period_end, subtypes=None, author_phids=None):
     constraints = {
-        'subtypes': subtypes,
+        'subtypes': subtypes or MANIPHEST_SUBTYPES,
         'createdStart': int(period_start.timestamp()),
         'createdEnd': int(period_end.timestamp()),
     }
@@ -246,15 +751,32 @@ def get_tasks_created_over_period(
     if author_phids:
         constraints['authorPHIDs'] = author_phids
 
-    if project_phids:
-        # unlike author_phids, project_phids query is 'AND'
-        tasks = []
-        for project_phid in project_phids:
-            constraints['projects'] = [project_phid]
-            tasks.extend(get_maniphest_tasks(constraints))
-    else:
-        tasks = get_maniphest_tasks(constraints)
+    return constraints
+
+
+def _get_tasks_closed_constraints(period_start, period_end, subtypes=None, closer_phids=None):
+    constraints = {
+        'subtypes': subtypes or MANIPHEST_SUBTYPES,
+        'closedStart': int(period_start.timestamp()),
+        'closedEnd': int(period_end.timestamp()),
+    }
+
+    if closer_phids:
+        constraints['closerPHIDs'] = closer_phids
 
+    return constraints
+
+
+def get_tasks_created_over_period(
+    period_start,
+    period_end,
+    subtypes=None,
+    author_phids=None,
+    project_phids=None,
+    keep_raw_data=True
+):
+    constraints = _get_tasks_created_constraints(period_start, period_end, subtypes=subtypes, author_phids=author_phids)
+    tasks = get_maniphest_tasks_by_projects(constraints, project_phids=project_phids, keep_raw_data=keep_raw_data)
     return tasks
 
 
@@ -263,36 +785,66 @@ def get_tasks_closed_over_period(
     period_end,
     subtypes=None,
     closer_phids=None,
-    project_phids=None
+    project_phids=None,
+    keep_raw_data=True
 ):
-    subtypes = subtypes or MANIPHEST_SUBTYPES
+    constraints = _get_tasks_closed_constraints(period_start, period_end, subtypes=subtypes, closer_phids=closer_phids)
+    tasks = get_maniphest_tasks_by_projects(constraints, project_phids=project_phids, keep_raw_data=keep_raw_data)
+    return tasks
 
-    constraints = {
-        'subtypes': subtypes,
-        'closedStart': int(period_start.timestamp()),
-        'closedEnd': int(period_end.timestamp()),
-    }
 
-    if closer_phids:
-        constraints['closerPHIDs'] = closer_phids
+def get_tasks_created_and_closed_over_periods(
+    periods,
+    subtypes=None,
+    user_phids=None,
+    project_phids=None,
+    keep_raw_data=True
+):
+    """Fetches tasks created and tasks closed for each `(period_start, period_end)` in `periods`, concurrently
 
-    if project_phids:
-        # unlike closer_phids, project_phids query is 'AND'
-        tasks = []
-        for project_phid in project_phids:
-            constraints['projects'] = [project_phid]
-            tasks.extend(get_maniphest_tasks(constraints))
-    else:
-        tasks = get_maniphest_tasks(constraints)
+    Every query (per period, created or closed, and project) runs on one thread pool.
 
-    return tasks
+    Returns a list of `(tasks_created, tasks_closed)`, in the same order as `periods`
+    """
+    # [created in period 1, closed in period 1, created in period 2, ...], each a list of queries by project
+    constraints_lists = [
+        _split_constraints_by_projects(constraints, project_phids=project_phids)
+        for period_start, period_end in periods
+        for constraints in (
+            _get_tasks_created_constraints(period_start, period_end, subtypes=subtypes, author_phids=user_phids),
+            _get_tasks_closed_constraints(period_start, period_end, subtypes=subtypes, closer_phids=user_phids),
+        )
+    ]
+    all_constraints = [
+        constraints
+        for constraints_list in constraints_lists
+        for constraints in constraints_list
+    ]
+
+    with ThreadPoolExecutor(max_workers=max(min(len(all_constraints), CONDUIT_MAX_CONCURRENCY), 1)) as executor:
+        task_lists = iter(list(executor.map(
+            lambda constraints: get_maniphest_tasks(constraints, keep_raw_data=keep_raw_data),
+            all_constraints
+        )))
+
+    tasks = [
+        [
+            task
+            for _ in constraints_list
+            for task in next(task_lists)
+        ]
+        for constraints_list in constraints_lists
+    ]
+    results = list(zip(tasks[0::2], tasks[1::2]))
+
+    return results
 
 
 ##
 # Projects
 
 
-@lru_cache  # TODO: implement DB-backed or Redis cache with TTL
+@cached()
 def get_all_projects():
     projects = []
     has_more_results = True
@@ -314,24 +866,34 @@ def get_all_projects():
     return projects
 
 
-PROJECTS_BY_PHID = None
+@cached(local=True)
+def get_projects_by_phid():
+    all_projects = get_all_projects()
+    projects_by_phid = {
+        project.phid: project
+        for project
+        in all_projects
+    }
+    return projects_by_phid
+
+
+@cached(local=True)
+def get_projects_version():
+    """Returns a hash which changes whenever any project is added, removed or modified, e.g. for HTTP ETags
+    """
+    digest = hashlib.sha1()
+    for project in get_all_projects():
+        digest.update(f'{project.phid}:{project.modified_ts}\n'.encode('utf-8'))
+    version = digest.hexdigest()
+    return version
 
 
 def lookup_project_by_phid(phid):
-    global PROJECTS_BY_PHID
-    if not PROJECTS_BY_PHID:
-        all_projects = get_all_projects()
-        PROJECTS_BY_PHID = {
-            project.phid: project
-            for project
-            in all_projects
-        }
-
-    project = PROJECTS_BY_PHID.get(phid)
+    project = get_projects_by_phid().get(phid)
     return project
 
 
-@lru_cache  # TODO: implement DB-backed or Redis cache with TTL
+@cached()
 def get_customers():
     projects = get_all_projects()
 
@@ -345,25 +907,24 @@ def get_customers():
     return customer_projects
 
 
-CUSTOMERS_LOOKUP = None
+@cached(local=True)
+def get_customers_by_phid():
+    all_customers = get_customers()
+    customers_by_phid = {
+        customer.phid: customer
+        for customer
+        in all_customers
+        if customer is not None
+    }
+    return customers_by_phid
 
 
 def is_customer(project):
-    global CUSTOMERS_LOOKUP
-    if not CUSTOMERS_LOOKUP:
-        all_customers = get_customers()
-        CUSTOMERS_LOOKUP = {
-            customer.phid: customer
-            for customer
-            in all_customers
-            if customer is not None
-        }
-
-    customer = None if project is None else CUSTOMERS_LOOKUP.get(project.phid)
+    customer = None if project is None else get_customers_by_phid().get(project.phid)
     return customer is not None
 
 
-@lru_cache  # TODO: implement DB-backed or Redis cache with TTL
+@cached()
 def get_customer_project(customer_name):
     customer_projects = get_customers()
     projects = list(filter(lambda project: project.name == customer_name, customer_projects))
@@ -374,6 +935,21 @@ def get_customer_project(customer_name):
     return customer_project
 
 
+def refresh_projects():
+    """Drops all cached projects and customers, so that they are re-fetched on next use
+    """
+    invalidate_phid_cache(phid_type='PROJ')
+    invalidate_caches([
+        'get_all_projects',
+        'get_projects_by_phid',
+        'get_projects_by_name_index',
+        'get_projects_version',
+        'get_customers',
+        'get_customers_by_phid',
+        'get_customer_project',
+    ])
+
+
 # TODO: refactor something because there's also get_projects_by_name()
 def get_bulk_projects_by_name(project_names):
     all_projects = get_all_projects()
@@ -386,48 +962,117 @@ def get_project_by_name(project_name, include_members=False):
 
     https://secure.phabricator.com/conduit/method/project.search/
     """
-    project_name = project_name.strip()
+    projects = get_projects_by_name([project_name], include_members=include_members)
+    project = projects[0]
+    return project
+
+
+def get_projects_by_name(project_names, include_members=False):
+    """Get projects by name, in the order of `project_names`
+
+    Raises if any of `project_names` is not found; see `resolve_projects_by_name()`
+    """
+    projects, unknown_names = resolve_projects_by_name(project_names, include_members=include_members)
+    if unknown_names:
+        raise Exception('No project named `{}` found.'.format('`, `'.join(unknown_names)))
+
+    return projects
+
+
+def resolve_projects_by_name(project_names, include_members=False):
+    """Resolves many project names at once
+
+    Names are looked up in an index of all projects (see `get_projects_by_name_index()`),
+    rather than with a `project.search` per name, so new projects are found once
+    the projects cache expires, or after `refresh_projects()`.
+
+    If `include_members` is True, members of all of the projects are attached
+    by a single `project.search` (per page of results).
+
+    Returns `(projects, unknown_names)`:
+    - `projects`: the projects found, in the order of `project_names`
+    - `unknown_names`: the names which matched no project
+    """
+    projects_by_name = get_projects_by_name_index()
+
+    projects = []
+    unknown_names = []
+    for project_name in project_names:
+        project_name = project_name.strip()
+        project = projects_by_name.get(project_name)
+        if project is None:
+            unknown_names.append(project_name)
+        else:
+            projects.append(project)
+
+    if include_members and projects:
+        projects_by_phid = fetch_projects_by_phid(
+            list(dict.fromkeys(project.phid for project in projects)),
+            include_members=True
+        )
+        projects = [projects_by_phid.get(project.phid, project) for project in projects]
+
+    return projects, unknown_names
+
+
+@cached(local=True)
+def get_projects_by_name_index():
+    """Returns a lookup of all projects by exact name
+    """
+    all_projects = get_all_projects()
+    projects_by_name = {}
+    for project in all_projects:
+        projects_by_name.setdefault(project.name, project)
+    return projects_by_name
+
+
+def fetch_projects_by_phid(phids, include_members=False):
+    """Fetches the projects `phids`, as a dict of PHID to project
+
+    https://secure.phabricator.com/conduit/method/project.search/
+    """
+    projects_by_phid = {}
+    has_more_results = True
+    after = None
+
     constraints = {
-        'query': project_name,
+        'phids': phids,
     }
     attachments = {}
     if include_members:
         attachments['members'] = True
-    results = PHAB.project.search(constraints=constraints, attachments=attachments)
-
-    projects = [
-        Project(project_data)
-        for project_data
-        in results.data
-        if project_data.get('fields', {}).get('name', '') == project_name  # look for exact match
-    ]
 
-    if len(projects) > 0:
-        project = projects[0]
-    else:
-        raise Exception('No project named `{}` found.'.format(project_name))
+    while has_more_results:
+        # handle pagination, since limits are 100 at a time
+        results = PHAB.project.search(constraints=constraints, attachments=attachments, after=after)
 
-    return project
+        for project_data in results.data:
+            project = Project(project_data)
+            projects_by_phid[project.phid] = project
 
+        cursor = results.get('cursor', {})
+        after = cursor.get('after', None)
+        has_more_results = after is not None
 
-def get_projects_by_name(project_names, include_members=False):
-    projects = list(
-        map(
-            lambda x: get_project_by_name(x, include_members=include_members),
-            project_names
-        )
-    )
-    return projects
+    return projects_by_phid
 
 
 def get_project_columns_by_project_name(project_name, column_names=None):
-    """Get information about workboard columns by project
+    """Get information about workboard columns by project name
 
     https://secure.phabricator.com/conduit/method/project.column.search/
     """
-    update_interfaces()
-
     project = get_project_by_name(project_name)
+    project_columns = get_project_columns(project, column_names=column_names)
+    return project_columns
+
+
+def get_project_columns(project, column_names=None):
+    """Get information about workboard columns of `project`
+
+    https://secure.phabricator.com/conduit/method/project.column.search/
+    """
+    update_interfaces()
 
     constraints = {
         'projects': [
@@ -506,7 +1151,7 @@ def fetch_users(usernames=None):
     return users
 
 
-@lru_cache
+@cached()
 def get_active_usernames():
     """Retrieves a list of all active usernames
     """
@@ -12,6 +12,10 @@ from werkzeug.routing import BaseConverter
 
 # Phablytics Imports
 from phablytics.settings import CUSTOM_STATIC_DIR
+from phablytics.web.caching import (
+    add_cache_control,
+    compress_response,
+)
 from phablytics.web.explore import explore_endpoints
 from phablytics.web.help import help_endpoints
 from phablytics.web.home import home_endpoints
@@ -58,10 +62,13 @@ application.register_blueprint(metrics_endpoints, url_prefix='/metrics')
 application.register_blueprint(reports_endpoints, url_prefix='/reports')
 application.register_blueprint(users_endpoints, url_prefix='/users')
 
+application.after_request(add_cache_control)
+application.after_request(compress_response)
+
 
 @application.errorhandler(404)
 def page_not_found(e):
-    return _r('404.html')
+    return _r('404.html'), 404
 
 
 @application.route('/custom_static/<path:filename>')
@@ -0,0 +1,110 @@
+"""HTTP caching for the web UI: ETags, conditional requests, Cache-Control and compression
+"""
+# Python Standard Library Imports
+import functools
+import gzip
+import hashlib
+
+# Third Party (PyPI) Imports
+from flask import (
+    make_response,
+    request,
+)
+
+# Phablytics Imports
+import phablytics
+from phablytics.settings import (
+    WEB_CACHE_CONTROL,
+    WEB_COMPRESS_LEVEL,
+    WEB_COMPRESS_MIN_SIZE,
+)
+
+
+# isort: off
+
+
+COMPRESSIBLE_MIMETYPES = (
+    'application/javascript',
+    'application/json',
+    'text/css',
+    'text/html',
+    'text/plain',
+)
+
+
+def _make_etag(version):
+    """Returns an ETag for the response to this request, given the `version` of the data it shows
+    """
+    value = f'{phablytics.__version__}:{request.full_path}:{version}'
+    etag = hashlib.sha1(value.encode('utf-8')).hexdigest()
+    return etag
+
+
+def conditional_response(get_version=None):
+    """Decorator for views which answer conditional (`If-None-Match`) requests with `304 Not Modified`
+
+    - `get_version`: called with the view's arguments, returns a version of the data
+      shown by the page (e.g. a sync version, or when a cached result was computed),
+      or None if unknown. When known, the ETag is derived from it, and matching
+      requests are answered without running the view at all.
+
+    Otherwise, the ETag is a hash of the response, which saves sending it, but not generating it.
+
+    ETags are weak, since responses may be compressed, see `compress_response()`.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            version = get_version(*args, **kwargs) if get_version else None
+            etag = None if version is None else _make_etag(version)
+
+            if etag is not None and request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+                response.set_etag(etag, weak=True)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200:
+                    if etag is None:
+                        etag = hashlib.sha1(response.get_data()).hexdigest()
+                    response.set_etag(etag, weak=True)
+                    response.make_conditional(request)
+
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def add_cache_control(response):
+    """Sets `Cache-Control` on successful responses, according to `WEB_CACHE_CONTROL` for the blueprint
+    """
+    cache_control = WEB_CACHE_CONTROL.get(request.blueprint)
+    if (
+        cache_control
+        and response.status_code in (200, 304, )
+        and 'Cache-Control' not in response.headers
+    ):
+        response.headers['Cache-Control'] = cache_control
+
+    return response
+
+
+def compress_response(response):
+    """Compresses large text responses with gzip, for clients which accept it
+    """
+    response.vary.add('Accept-Encoding')
+
+    if (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and response.mimetype in COMPRESSIBLE_MIMETYPES
+        and 'Content-Encoding' not in response.headers
+        and request.accept_encodings['gzip'] > 0
+    ):
+        data = response.get_data()
+        if len(data) >= WEB_COMPRESS_MIN_SIZE:
+            response.set_data(gzip.compress(data, compresslevel=WEB_COMPRESS_LEVEL))
+            response.headers['Content-Encoding'] = 'gzip'
+
+    return response
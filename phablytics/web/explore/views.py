@@ -3,6 +3,8 @@ from flask import Blueprint
 
 # Phablytics Imports
 from phablytics.segments.utils import build_project_segments
+from phablytics.utils import get_projects_version
+from phablytics.web.caching import conditional_response
 from phablytics.web.utils import custom_render_template as _r
 
 
@@ -14,6 +16,7 @@ explore_endpoints = Blueprint(
 
 
 @explore_endpoints.route('')
+@conditional_response(get_version=lambda: get_projects_version())
 def index():
     segments = build_project_segments()
     context_data = {
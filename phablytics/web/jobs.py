@@ -0,0 +1,125 @@
+# Python Standard Library Imports
+import collections
+import threading
+import time
+import traceback
+import typing as T
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+
+# isort: off
+
+
+@dataclass
+class Job:
+    """A computation run in the background by `JobRunner`
+    """
+    key: str
+    status: str = 'pending'  # one of: 'pending', 'running', 'done', 'failed'
+    result: T.Any = None
+    error: str = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: float = None
+
+    @property
+    def is_finished(self):
+        return self.status in ('done', 'failed', )
+
+
+class JobRunner:
+    """Runs jobs on a pool of background threads, keyed so that identical work is only done once
+
+    A job submitted while another with the same key is pending, running, or
+    finished less than `result_ttl` seconds ago, joins that job instead.
+    Failed jobs are kept for `error_ttl` seconds, so that pollers see the
+    failure, then run again on the next submission.
+
+    At most `max_jobs` finished jobs (and their results) are kept; beyond that,
+    the least recently submitted or polled are dropped. Unfinished jobs are never
+    dropped, so that pollers never submit work which is still underway again.
+    """
+    def __init__(
+        self,
+        max_workers=4,
+        result_ttl=5 * 60,
+        error_ttl=10,
+        max_jobs=100,
+        thread_name_prefix='phablytics-job'
+    ):
+        self.result_ttl = result_ttl
+        self.error_ttl = error_ttl
+        self.max_jobs = max_jobs
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        # least recently used first
+        self.jobs = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, key, f, *args, **kwargs):
+        """Returns the job for `key`, running `f(*args, **kwargs)` in the background unless already done or underway
+        """
+        with self._lock:
+            self._expire_jobs()
+
+            job = self.jobs.get(key)
+            if job is None:
+                job = Job(key=key)
+                self.jobs[key] = job
+                self._evict_jobs()
+                self.executor.submit(self._run, job, f, args, kwargs)
+            else:
+                self.jobs.move_to_end(key)
+
+        return job
+
+    def get(self, key):
+        with self._lock:
+            self._expire_jobs()
+            job = self.jobs.get(key)
+            if job is not None:
+                self.jobs.move_to_end(key)
+        return job
+
+    def _run(self, job, f, args, kwargs):
+        job.status = 'running'
+        try:
+            job.result = f(*args, **kwargs)
+            status = 'done'
+        except Exception:
+            job.error = traceback.format_exc()
+            status = 'failed'
+
+        # set last, since other threads read `finished_at` of finished jobs
+        job.finished_at = time.time()
+        job.status = status
+
+        # so that expired and excess results are released even if no more jobs are submitted or polled
+        with self._lock:
+            self._expire_jobs()
+            self._evict_jobs()
+
+    def _expire_jobs(self):
+        now = time.time()
+        expired_keys = [
+            key
+            for key, job
+            in self.jobs.items()
+            if job.is_finished and now - job.finished_at > (self.result_ttl if job.status == 'done' else self.error_ttl)
+        ]
+        for key in expired_keys:
+            del self.jobs[key]
+
+    def _evict_jobs(self):
+        """Drops the least recently used finished jobs beyond `max_jobs`
+
+        Unfinished jobs are kept, even beyond `max_jobs`; the excess is dropped as they finish.
+        """
+        num_excess = len(self.jobs) - self.max_jobs
+        if num_excess > 0:
+            finished_keys = [key for key, job in self.jobs.items() if job.is_finished]
+            for key in finished_keys[:num_excess]:
+                del self.jobs[key]
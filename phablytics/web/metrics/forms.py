@@ -17,7 +17,10 @@ from phablytics.metrics.constants import (
     DEFAULT_INTERVAL_OPTION,
     INTERVAL_OPTIONS,
 )
-from phablytics.settings import PROJECT_TEAM_NAMES
+from phablytics.settings import (
+    METRICS_FILTER_USERNAME_AUTOCOMPLETE,
+    PROJECT_TEAM_NAMES,
+)
 from phablytics.utils import (
     end_of_month,
     end_of_quarter,
@@ -88,6 +91,28 @@ def get_filter_params():
     return filter_params
 
 
+def get_filter_params_key(filter_params):
+    """Returns a string identifying `filter_params`, equal for params which select the same metrics
+    """
+    projects = sorted(set([
+        project_name.strip()
+        for project_name
+        in filter_params['projects'].split(',')
+        if project_name.strip()
+    ]))
+
+    key = '|'.join([
+        filter_params['interval'],
+        filter_params['period_start'].strftime(DATE_FORMAT_YMD),
+        filter_params['period_end'].strftime(DATE_FORMAT_YMD),
+        filter_params['team'].strip(),
+        filter_params['customer'].strip(),
+        ','.join(projects),
+        filter_params['username'].strip(),
+    ])
+    return key
+
+
 class MetricsFilterForm(FlaskForm):
     interval = SelectField(
         label='Interval',
@@ -120,21 +145,61 @@ class MetricsFilterForm(FlaskForm):
         )
     )
     customer = SelectField(
-        label='Customer',
-        choices=format_choices(
-            sorted([
-                customer.name
-                for customer
-                in get_customers()
-            ]),
-            include_blank=True
-        )
+        label='Customer'
     )
     projects = StringField()
-    username = SelectField(
-        label='User',
-        choices=format_choices(
-            get_active_usernames(),
-            include_blank=True
-        ),
-    )
+    if METRICS_FILTER_USERNAME_AUTOCOMPLETE:
+        username = StringField(
+            label='User',
+            render_kw={
+                'autocomplete': 'off',
+                'data-autocomplete': 'username',
+            }
+        )
+    else:
+        username = SelectField(
+            label='User'
+        )
+
+    def __init__(self, *args, **kwargs):
+        super(MetricsFilterForm, self).__init__(*args, **kwargs)
+        # choices are looked up (from cache) when a form is made, rather than when this module is imported
+        self.customer.choices = format_choices(get_customer_names(), include_blank=True)
+        if isinstance(self.username, SelectField):
+            self.username.choices = format_choices(get_active_usernames(), include_blank=True)
+
+
+def get_customer_names():
+    customer_names = sorted([
+        customer.name
+        for customer
+        in get_customers()
+    ])
+    return customer_names
+
+
+# fields which can be autocompleted, and their options
+AUTOCOMPLETE_OPTIONS = {
+    'customer': get_customer_names,
+    'username': get_active_usernames,
+}
+
+
+def get_autocomplete_suggestions(field_name, query, limit=20):
+    """Returns up to `limit` options of `field_name` containing `query` (case-insensitive),
+    options starting with `query` first
+    """
+    query = query.strip().lower()
+    options = AUTOCOMPLETE_OPTIONS[field_name]()
+
+    prefix_matches = []
+    other_matches = []
+    for option in options:
+        index = option.lower().find(query)
+        if index == 0:
+            prefix_matches.append(option)
+        elif index > 0:
+            other_matches.append(option)
+
+    suggestions = (prefix_matches + other_matches)[:limit]
+    return suggestions
@@ -2,16 +2,33 @@
 import json
 
 # Third Party (PyPI) Imports
-from flask import Blueprint
+from flask import (
+    Blueprint,
+    abort,
+    jsonify,
+    request,
+    url_for,
+)
 
 # Phablytics Imports
+from phablytics.metrics.constants import METRIC_TASK_SUBTYPES
 from phablytics.metrics.metrics import (
     METRICS,
     Metrics,
 )
+from phablytics.settings import (
+    METRICS_JOB_MAX_JOBS,
+    METRICS_JOB_RESULT_TTL,
+    METRICS_JOB_WORKERS,
+)
+from phablytics.web.caching import conditional_response
+from phablytics.web.jobs import JobRunner
 from phablytics.web.metrics.forms import (
+    AUTOCOMPLETE_OPTIONS,
     MetricsFilterForm,
+    get_autocomplete_suggestions,
     get_filter_params,
+    get_filter_params_key,
 )
 from phablytics.web.utils import custom_render_template as _r
 
@@ -32,20 +49,125 @@ def index(page):
     return _r('metrics/%s.html' % page, context_data=context_data)
 
 
-@metrics_endpoints.route('/<page>')
-def show_metric(page):
-    filter_params = get_filter_params()
-    filter_form = MetricsFilterForm(**filter_params)
+@metrics_endpoints.route('/autocomplete/<field_name>.json')
+def autocomplete(field_name):
+    """Suggestions for the metrics filter field `field_name`, matching `?q=`
+    """
+    if field_name not in AUTOCOMPLETE_OPTIONS:
+        abort(404)
+
+    suggestions = get_autocomplete_suggestions(field_name, request.args.get('q', ''))
+    return jsonify({
+        'suggestions': suggestions,
+    })
+
+
+METRIC_JOBS = JobRunner(
+    max_workers=METRICS_JOB_WORKERS,
+    result_ttl=METRICS_JOB_RESULT_TTL,
+    max_jobs=METRICS_JOB_MAX_JOBS,
+    thread_name_prefix='phablytics-metrics'
+)
+
+
+def _get_metric_job_key(page, filter_params):
+    key = f'{page}|{get_filter_params_key(filter_params)}'
+    return key
+
+
+def submit_metric_job(page, filter_params):
+    """Computes the stats for metric `page` in the background, see `METRIC_JOBS`
 
-    stats = getattr(Metrics(), page)(**filter_params)
+    Returns the `Job`, shared by all requests for the same metric and filters.
+    """
+    key = _get_metric_job_key(page, filter_params)
+    job = METRIC_JOBS.submit(key, getattr(Metrics(), page), **filter_params)
+    return job
 
+
+def get_metric_version(page):
+    """Returns when the stats for metric `page` (with the request's filters) were computed,
+    if they still are, else None
+    """
+    if page in METRIC_TASK_SUBTYPES:
+        job = METRIC_JOBS.get(_get_metric_job_key(page, get_filter_params()))
+        version = job.finished_at if job is not None and job.status == 'done' else None
+    else:
+        version = None
+    return version
+
+
+def _get_metric_context_data(stats, filter_params):
     context_data = {
         'metrics': stats.metrics,
         'stats': stats.stats,
         'metrics_json': json.dumps(stats.metrics_json),
         'aggregated_stats': stats.aggregated_stats,
         'filter_params': filter_params,
-        'filter_form': filter_form,
     }
+    return context_data
+
+
+@metrics_endpoints.route('/<page>')
+@conditional_response(get_version=get_metric_version)
+def show_metric(page):
+    """Renders the page right away; unless already computed, the stats are then polled for from `show_metric_json()`
+    """
+    if page not in METRIC_TASK_SUBTYPES:
+        abort(404)
+
+    filter_params = get_filter_params()
+    filter_form = MetricsFilterForm(**filter_params)
+
+    job = submit_metric_job(page, filter_params)
+
+    if job.status == 'done':
+        context_data = _get_metric_context_data(job.result, filter_params)
+    else:
+        context_data = {
+            'filter_params': filter_params,
+            'results_url': url_for(
+                'metrics_endpoints.show_metric_json',
+                page=page,
+                html=1,
+                **request.args.to_dict()
+            ),
+        }
+    context_data['filter_form'] = filter_form
 
     return _r('metrics/%s.html' % page, context_data=context_data)
+
+
+@metrics_endpoints.route('/<page>.json')
+@conditional_response(get_version=get_metric_version)
+def show_metric_json(page):
+    """JSON counterpart of `show_metric()`, with the same filter params
+
+    Responds `202 Accepted` while the stats are being computed; poll until `status` is 'done' (or 'failed').
+
+    With `?html=1`, the results section of the page is included as `html`.
+    """
+    if page not in METRIC_TASK_SUBTYPES:
+        abort(404)
+
+    filter_params = get_filter_params()
+    job = submit_metric_job(page, filter_params)
+
+    data = {
+        'status': job.status,
+    }
+
+    if job.status == 'done':
+        data.update(job.result.as_dict())
+        if request.args.get('html'):
+            context_data = _get_metric_context_data(job.result, filter_params)
+            context_data['results_only'] = True
+            data['html'] = _r('metrics/%s.html' % page, context_data=context_data)
+        status_code = 200
+    elif job.status == 'failed':
+        data['error'] = job.error.strip().split('\n')[-1]
+        status_code = 500
+    else:
+        status_code = 202
+
+    return jsonify(data), status_code
@@ -0,0 +1,196 @@
+"""Pre-forking, multi-threaded WSGI server for running the web UI in production
+
+The master process binds the listening socket, runs `on_starting` (e.g. to
+warm caches, which forked workers then inherit), and forks worker processes.
+Each worker accepts connections on the shared socket, and handles up to
+`threads` requests at once. Workers which die are replaced.
+
+On SIGTERM or SIGINT, workers stop accepting connections and finish their
+in-flight requests; workers still busy after `graceful_timeout` are killed.
+"""
+# Python Standard Library Imports
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+
+# Third Party (PyPI) Imports
+from werkzeug.serving import ThreadedWSGIServer
+
+
+# isort: off
+
+
+class BoundedThreadedWSGIServer(ThreadedWSGIServer):
+    """Handles each request on its own thread, with at most `max_threads` at once
+
+    When closed, waits for requests in flight to complete.
+    """
+    daemon_threads = False
+
+    def __init__(self, *args, max_threads=8, **kwargs):
+        super(BoundedThreadedWSGIServer, self).__init__(*args, **kwargs)
+        self._request_slots = threading.BoundedSemaphore(max_threads)
+
+    def process_request(self, request, client_address):
+        self._request_slots.acquire()
+        try:
+            super(BoundedThreadedWSGIServer, self).process_request(request, client_address)
+        except Exception:
+            self._request_slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super(BoundedThreadedWSGIServer, self).process_request_thread(request, client_address)
+        finally:
+            self._request_slots.release()
+
+
+class PreforkWSGIServer:
+    def __init__(
+        self,
+        application,
+        host,
+        port,
+        workers=4,
+        threads=8,
+        graceful_timeout=30,
+        on_starting=None
+    ):
+        """
+        - `workers`: number of worker processes
+        - `threads`: max number of requests handled concurrently by each worker
+        - `graceful_timeout`: seconds given to workers to finish in-flight requests on shutdown
+        - `on_starting`: called in the master process before forking workers
+        """
+        self.application = application
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.threads = threads
+        self.graceful_timeout = graceful_timeout
+        self.on_starting = on_starting
+
+        self.socket = None
+        self.worker_pids = set()
+        self.is_stopping = False
+
+    def _log(self, message):
+        print(f'[{os.getpid()}] {message}', file=sys.stderr, flush=True)
+
+    def _bind(self):
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        sock = socket.create_server((self.host, self.port, ), family=family, backlog=128)
+        sock.set_inheritable(True)
+        return sock
+
+    ##
+    # Master
+
+    def run(self):
+        self.socket = self._bind()
+        self._log(f'Listening on {self.host}:{self.port} with {self.workers} workers x {self.threads} threads')
+
+        if self.on_starting is not None:
+            self.on_starting()
+
+        def _stop(signum, frame):
+            self.is_stopping = True
+
+        signal.signal(signal.SIGTERM, _stop)
+        signal.signal(signal.SIGINT, _stop)
+
+        for i in range(self.workers):
+            self._spawn_worker()
+
+        try:
+            while not self.is_stopping:
+                self._reap_workers(respawn=True)
+                time.sleep(0.5)
+        finally:
+            self._stop_workers()
+            self.socket.close()
+
+    def _spawn_worker(self):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                self._run_worker()
+            except BaseException:
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                # never return into the master's code
+                os._exit(exit_code)
+        else:
+            self.worker_pids.add(pid)
+
+    def _reap_workers(self, respawn=False):
+        while self.worker_pids:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.worker_pids.clear()
+                break
+
+            if pid == 0:
+                break
+
+            self.worker_pids.discard(pid)
+            if respawn and not self.is_stopping:
+                self._log(f'Worker {pid} exited with status {status}, starting a new worker')
+                self._spawn_worker()
+
+    def _stop_workers(self):
+        self._log(f'Shutting down, waiting up to {self.graceful_timeout}s for requests in flight')
+        for pid in self.worker_pids:
+            self._signal_worker(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.worker_pids and time.monotonic() < deadline:
+            self._reap_workers()
+            time.sleep(0.1)
+
+        for pid in self.worker_pids:
+            self._log(f'Killing worker {pid}')
+            self._signal_worker(pid, signal.SIGKILL)
+
+        for pid in list(self.worker_pids):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.worker_pids.clear()
+
+    def _signal_worker(self, pid, signum):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    ##
+    # Worker
+
+    def _run_worker(self):
+        server = BoundedThreadedWSGIServer(
+            self.host,
+            self.port,
+            self.application,
+            fd=self.socket.fileno(),
+            max_threads=self.threads
+        )
+
+        def _shutdown(signum, frame):
+            # `shutdown()` blocks until `serve_forever()` returns, so it can't be called from the serving thread
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, _shutdown)
+        signal.signal(signal.SIGINT, _shutdown)
+
+        # closes the server when done, waiting for requests in flight
+        server.serve_forever()
@@ -1,8 +1,28 @@
+# Python Standard Library Imports
+import collections
+import threading
+import time
+
 # Third Party (PyPI) Imports
 from flask import url_for
 
 # Phablytics Imports
-from phablytics.settings import PHABLYTICS_BASE_URL
+from phablytics.repos import report_output_repo
+from phablytics.reports.utils import (
+    get_report_config,
+    get_report_types,
+)
+from phablytics.settings import (
+    PHABLYTICS_BASE_URL,
+    REPORT_OUTPUTS_MAX_AGE,
+)
+
+
+# isort: off
+
+
+# one generation of a report at a time per process; concurrent requests wait for it, then serve its output
+_GENERATE_LOCKS = collections.defaultdict(threading.Lock)
 
 
 def get_report_url(report_name):
@@ -20,3 +40,62 @@ def get_report_url(report_name):
     else:
         url = None
     return url
+
+
+def get_report_max_age(report_name):
+    """Returns the number of seconds the stored output of report `report_name` is served for
+    """
+    report_config = get_report_config(report_name)
+    max_age = REPORT_OUTPUTS_MAX_AGE if report_config.web_max_age is None else report_config.web_max_age
+    return max_age
+
+
+def is_report_output_fresh(report_name, generated_at):
+    is_fresh = generated_at is not None and time.time() - generated_at <= get_report_max_age(report_name)
+    return is_fresh
+
+
+def get_report_output_generated_at(report_name):
+    """Returns when the stored HTML output of report `report_name` was generated, if fresher than its max age, else None
+    """
+    generated_at = report_output_repo.get_generated_at(report_name)
+    if not is_report_output_fresh(report_name, generated_at):
+        generated_at = None
+
+    return generated_at
+
+
+def get_report_output(report_name, refresh=False):
+    """Returns the HTML output of report `report_name`, as a dict with `report` and `generated_at`
+
+    The stored output is returned if fresher than the report's max age (and not `refresh`);
+    otherwise the report is generated, and its output stored.
+    """
+    output = None if refresh else _get_fresh_report_output(report_name)
+
+    if output is None:
+        with _GENERATE_LOCKS[report_name]:
+            # another request may have generated it while waiting
+            if not refresh:
+                output = _get_fresh_report_output(report_name)
+
+            if output is None:
+                report_config = get_report_config(report_name)
+                report_config.slack = False
+                report_config.html = True
+                report_types = get_report_types()
+                report_class = report_types.get(report_config.report_type)
+                report = report_class(report_config)
+                report.generate_report(save_output=True)
+
+                output = report_output_repo.get(report_name)
+
+    return output
+
+
+def _get_fresh_report_output(report_name):
+    output = report_output_repo.get(report_name)
+    if output is not None and not is_report_output_fresh(report_name, output['generated_at']):
+        output = None
+
+    return output
@@ -1,19 +1,22 @@
 # Python Standard Library Imports
 import copy
+import datetime
 
 # Third Party (PyPI) Imports
 from flask import (
     Blueprint,
+    redirect,
     url_for,
 )
 
 # Phablytics Imports
-from phablytics.reports.utils import (
-    get_report_config,
-    get_report_names,
-    get_report_types,
-)
+from phablytics.reports.utils import get_report_names
 from phablytics.settings import REPORTS
+from phablytics.web.caching import conditional_response
+from phablytics.web.reports.utils import (
+    get_report_output,
+    get_report_output_generated_at,
+)
 from phablytics.web.utils import custom_render_template as _r
 
 
@@ -34,17 +37,22 @@ def index(page):
 
 
 @reports_endpoints.route('/<report_name>')
+@conditional_response(get_version=get_report_output_generated_at)
 def show(report_name):
-    report_config = get_report_config(report_name)
-    report_config.slack = False
-    report_config.html = True
-    report_types = get_report_types()
-    report_class = report_types.get(report_config.report_type)
-    report = report_class(report_config)
-    report_content = report.generate_report()
+    output = get_report_output(report_name)
 
     context_data = {
         'report_name': report_name,
-        'report_content': report_content,
+        'report_content': output['report'],
+        'generated_at': datetime.datetime.fromtimestamp(output['generated_at']),
+        'refresh_url': url_for('.refresh', report_name=report_name),
     }
     return _r('reports/view.html', context_data=context_data)
+
+
+@reports_endpoints.route('/<report_name>/refresh', methods=['POST'])
+def refresh(report_name):
+    """Generates report `report_name` again, regardless of the age of its stored output
+    """
+    get_report_output(report_name, refresh=True)
+    return redirect(url_for('.show', report_name=report_name))
@@ -1,28 +1,125 @@
 # Python Standard Library Imports
+import argparse
 import os
+import sys
 
 # Phablytics Imports
+from phablytics.cache import set_cache_backend
+from phablytics.settings import (
+    CACHE_BACKEND,
+    WEB_GRACEFUL_TIMEOUT,
+    WEB_SHARED_CACHE_BACKEND,
+    WEB_THREADS,
+    WEB_WORKERS,
+)
+from phablytics.utils import (
+    close_conduit_connections,
+    get_active_usernames,
+    get_all_projects,
+    get_customers,
+)
 from phablytics.web import application
+from phablytics.web.prefork import PreforkWSGIServer
 
 
 class PhablyticsWebServer:
     """Phablytics web application server
+
+    By default, runs Flask's development server. With `production`, runs
+    `workers` processes handling up to `threads` requests each, see `PreforkWSGIServer`.
     """
-    def __init__(self):
-        pass
+    def __init__(self, production=False, host=None, port=None, workers=None, threads=None):
+        self.production = production
+        self.host = host or os.environ.get('LISTEN_HOST', '::')
+        self.port = port or int(os.environ.get('PORT', '9001'))
+        self.workers = workers or WEB_WORKERS
+        self.threads = threads or WEB_THREADS
 
     def run(self):
-        application.run(
-            host=os.environ.get('LISTEN_HOST', '::'),
-            port=int(os.environ.get('PORT', '9001')),
-            debug=True,
-            use_reloader=False,
-            threaded=False
+        if self.production:
+            self.run_production()
+        else:
+            application.run(
+                host=self.host,
+                port=self.port,
+                debug=True,
+                use_reloader=False,
+                threaded=False
+            )
+
+    def run_production(self):
+        if not hasattr(os, 'fork'):
+            raise Exception('Production mode requires `os.fork()`, which is not available on this platform')
+
+        if CACHE_BACKEND == 'lru' and WEB_SHARED_CACHE_BACKEND:
+            set_cache_backend(WEB_SHARED_CACHE_BACKEND)
+
+        server = PreforkWSGIServer(
+            application,
+            self.host,
+            self.port,
+            workers=self.workers,
+            threads=self.threads,
+            graceful_timeout=WEB_GRACEFUL_TIMEOUT,
+            on_starting=self.warm_caches
         )
+        server.run()
+
+    def warm_caches(self):
+        """Fetches the lookups needed by most pages once, before workers are forked,
+        so that workers start with them (and shared cache backends are filled)
+        """
+        try:
+            get_all_projects()
+            get_customers()
+            get_active_usernames()
+        except Exception as e:
+            print(f'Failed to warm caches, workers will fill them on demand: {e}', file=sys.stderr)
+
+        # workers open their own connections
+        close_conduit_connections()
 
 
 def main():
-    PhablyticsWebServer().run()
+    arg_parser = argparse.ArgumentParser(description='Phablytics web server.')
+    arg_parser.add_argument(
+        '--production',
+        action='store_true',
+        help='Runs several worker processes and threads, instead of the single-threaded development server.',
+        required=False
+    )
+    arg_parser.add_argument(
+        '--host',
+        help='Host to listen on. Default: $LISTEN_HOST, or `::`',
+        required=False
+    )
+    arg_parser.add_argument(
+        '--port',
+        type=int,
+        help='Port to listen on. Default: $PORT, or 9001',
+        required=False
+    )
+    arg_parser.add_argument(
+        '--workers',
+        type=int,
+        help=f'Number of worker processes, with --production. Default: {WEB_WORKERS}',
+        required=False
+    )
+    arg_parser.add_argument(
+        '--threads',
+        type=int,
+        help=f'Max concurrent requests per worker process, with --production. Default: {WEB_THREADS}',
+        required=False
+    )
+    args = arg_parser.parse_args()
+
+    PhablyticsWebServer(
+        production=args.production,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        threads=args.threads
+    ).run()
 
 
 if __name__ == '__main__':
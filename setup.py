@@ -110,7 +110,7 @@ setuptools.setup(
     # $ pip install -e .[dev,test]
     extras_require={
         'dev': [],#['check-manifest'],
-        'test': [],#['coverage'],
+        'test': ['pytest'],#['coverage'],
         'web': WEB_REQUIREMENTS,
     },
 
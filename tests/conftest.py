@@ -0,0 +1,14 @@
+# Python Standard Library Imports
+import os
+import sys
+import tempfile
+
+
+# isort: off
+
+
+# Phablytics keeps its SQLite databases (mirrors, stored results, ...) in the current directory,
+# and creates them on import, so run the tests from a scratch directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(tempfile.mkdtemp(prefix='phablytics-tests-'))
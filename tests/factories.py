@@ -0,0 +1,119 @@
+"""Builders for Conduit payloads, for tests
+"""
+
+
+# isort: off
+
+
+class ConduitResults(dict):
+    """Stands in for the result of a Conduit call: a dict, with the results as `data`
+    """
+    def __init__(self, data, after=None):
+        super(ConduitResults, self).__init__(cursor={'after': after})
+        self.data = data
+
+
+def make_task_data(
+    id_,
+    created_ts,
+    closed_ts=None,
+    subtype='default',
+    points=None,
+    owner_phid=None,
+    author_phid='PHID-USER-1',
+    project_phids=None,
+    status=None,
+    **extra_fields
+):
+    """Returns a `maniphest.search` result item
+    """
+    status = status or ('resolved' if closed_ts else 'open')
+
+    task_data = {
+        'id': id_,
+        'phid': f'PHID-TASK-{id_}',
+        'type': 'TASK',
+        'fields': dict({
+            'name': f'Task {id_}',
+            'status': {
+                'value': status,
+                'name': status.title(),
+            },
+            'subtype': subtype,
+            'points': points,
+            'dateCreated': created_ts,
+            'dateModified': closed_ts or created_ts,
+            'dateClosed': closed_ts,
+            'authorPHID': author_phid,
+            'ownerPHID': owner_phid,
+            'closerPHID': owner_phid if closed_ts else None,
+        }, **extra_fields),
+        'attachments': {
+            'projects': {
+                'projectPHIDs': list(project_phids or []),
+            },
+        },
+    }
+    return task_data
+
+
+def make_revision_data(
+    id_,
+    modified_ts,
+    reviewer_phids=None,
+    status='needs-review',
+    author_phid='PHID-USER-9',
+    title=None
+):
+    """Returns a `differential.revision.search` result item, with reviewers attached
+    """
+    revision_data = {
+        'id': id_,
+        'phid': f'PHID-DREV-{id_}',
+        'type': 'DREV',
+        'fields': {
+            'title': title or f'Revision {id_}',
+            'status': {
+                'value': status,
+                'name': status.title(),
+            },
+            'dateCreated': modified_ts,
+            'dateModified': modified_ts,
+            'authorPHID': author_phid,
+            'repositoryPHID': None,
+        },
+        'attachments': {
+            'reviewers': {
+                'reviewers': [
+                    {
+                        'reviewerPHID': reviewer_phid,
+                        'status': 'added',
+                        'isBlocking': False,
+                    }
+                    for reviewer_phid
+                    in (reviewer_phids or [])
+                ],
+            },
+        },
+    }
+    return revision_data
+
+
+def make_project_data(id_, name, member_phids=None):
+    """Returns a `project.search` result item, with members attached if `member_phids` is given
+    """
+    project_data = {
+        'id': id_,
+        'phid': f'PHID-PROJ-{id_}',
+        'type': 'PROJ',
+        'fields': {
+            'name': name,
+            'parent': None,
+        },
+        'attachments': {},
+    }
+    if member_phids is not None:
+        project_data['attachments']['members'] = {
+            'members': [{'phid': member_phid} for member_phid in member_phids],
+        }
+    return project_data
@@ -0,0 +1,320 @@
+# Python Standard Library Imports
+import os
+import re
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+import phablytics
+from phablytics.cache import (
+    cached,
+    get_cache_stats,
+)
+from phablytics.cache import utils as cache_utils
+from phablytics.cache.backends import (
+    CACHE_MISS,
+    LRUCacheBackend,
+    RedisCacheBackend,
+    RedisError,
+    SQLiteCacheBackend,
+)
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise TypeError('not picklable')
+
+
+##
+# Fixtures
+
+
+def _redis_glob_match(pattern, key):
+    """Matches `key` against a Redis glob `pattern`: `*`, `?`, `[...]`, with `\\` escapes
+    """
+    regex = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\' and i + 1 < len(pattern):
+            i += 1
+            regex.append(re.escape(pattern[i]))
+        elif c == '*':
+            regex.append('.*')
+        elif c == '?':
+            regex.append('.')
+        elif c == '[':
+            end = pattern.index(']', i + 1)
+            chars = pattern[i + 1:end]
+            regex.append('[^' + re.escape(chars[1:]) + ']' if chars.startswith('^') else '[' + re.escape(chars) + ']')
+            i = end
+        else:
+            regex.append(re.escape(c))
+        i += 1
+
+    is_match = re.fullmatch(''.join(regex), key, flags=re.DOTALL) is not None
+    return is_match
+
+
+class RESPHandler(socketserver.StreamRequestHandler):
+    """Just enough of the Redis protocol for `RedisCacheBackend`: GET, SET [EX], DEL, SCAN
+    """
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+
+        args = []
+        for i in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _bulk(self, value):
+        reply = b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value), value, )
+        return reply
+
+    def handle(self):
+        store = self.server.store
+        while True:
+            args = self._read_command()
+            if args is None:
+                break
+
+            command = args[0].upper()
+            if command == b'GET':
+                value, expires_at = store.get(args[1], (None, None, ))
+                if expires_at is not None and expires_at <= time.time():
+                    value = None
+                reply = self._bulk(value)
+            elif command == b'SET':
+                expires_at = time.time() + int(args[4]) if len(args) > 4 else None
+                store[args[1]] = (args[2], expires_at, )
+                reply = b'+OK\r\n'
+            elif command == b'DEL':
+                num_deleted = len([key for key in args[1:] if store.pop(key, None) is not None])
+                reply = b':%d\r\n' % num_deleted
+            elif command == b'SCAN':
+                pattern = args[3].decode('utf-8')
+                keys = [key for key in store if _redis_glob_match(pattern, key.decode('utf-8'))]
+                reply = b'*2\r\n' + self._bulk(b'0') + b'*%d\r\n' % len(keys) + b''.join(self._bulk(key) for key in keys)
+            else:
+                reply = b'-ERR unknown command\r\n'
+
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def resp_server():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), RESPHandler)
+    server.daemon_threads = True
+    server.store = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=['lru', 'sqlite', 'redis'])
+def backend(request, tmp_path):
+    if request.param == 'lru':
+        backend = LRUCacheBackend(maxsize=100)
+    elif request.param == 'sqlite':
+        backend = SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'))
+    else:
+        server = request.getfixturevalue('resp_server')
+        host, port = server.server_address
+        backend = RedisCacheBackend(f'redis://{host}:{port}/0')
+    return backend
+
+
+##
+# Backends
+
+
+def test_get_set_delete(backend):
+    assert backend.get('a') is CACHE_MISS
+
+    backend.set('a', {'value': [1, 2, 3]})
+    backend.set('b', None)
+    assert backend.get('a') == {'value': [1, 2, 3]}
+    # `None` is a legitimate value, distinct from a miss
+    assert backend.get('b') is None
+
+    backend.delete('a')
+    assert backend.get('a') is CACHE_MISS
+
+
+def test_ttl(backend):
+    backend.set('a', 1, ttl=1)
+    assert backend.get('a') == 1
+    time.sleep(1.1)
+    assert backend.get('a') is CACHE_MISS
+
+
+def test_delete_prefix(backend):
+    backend.set('phablytics:f:1', 1)
+    backend.set('phablytics:f:2', 2)
+    backend.set('phablytics:g:1', 3)
+
+    backend.delete_prefix('phablytics:f:')
+
+    assert backend.get('phablytics:f:1') is CACHE_MISS
+    assert backend.get('phablytics:f:2') is CACHE_MISS
+    assert backend.get('phablytics:g:1') == 3
+
+
+def test_delete_prefix_matches_glob_characters_literally(backend):
+    backend.set('phablytics:f:[1]*', 1)
+    backend.set('phablytics:f:1', 2)
+    backend.set('phablytics:f:?', 3)
+    backend.set('phablytics:f:a', 4)
+
+    backend.delete_prefix('phablytics:f:[1]*')
+    backend.delete_prefix('phablytics:f:?')
+
+    assert backend.get('phablytics:f:[1]*') is CACHE_MISS
+    assert backend.get('phablytics:f:?') is CACHE_MISS
+    assert (backend.get('phablytics:f:1'), backend.get('phablytics:f:a'), ) == (2, 4, )
+
+
+def test_lru_evicts_least_recently_used():
+    backend = LRUCacheBackend(maxsize=2)
+    backend.set('a', 1)
+    backend.set('b', 2)
+    backend.get('a')
+    backend.set('c', 3)
+
+    assert backend.get('a') == 1
+    assert backend.get('b') is CACHE_MISS
+    assert backend.get('c') == 3
+
+
+def test_sqlite_corrupt_entry_is_a_miss_and_deleted(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'))
+    backend.set('a', 1)
+    with backend._connect() as conn, conn:
+        conn.execute(f"""UPDATE {backend.TABLE_NAME} SET value = ? WHERE key = ?""", (b'not a pickle', 'a', ))
+
+    assert backend.get('a') is CACHE_MISS
+    assert backend.num_errors == 1
+    with backend._connect() as conn:
+        row = conn.execute(f"""SELECT COUNT(*) FROM {backend.TABLE_NAME} WHERE key = ?""", ('a', )).fetchone()
+    assert row[0] == 0
+
+
+def test_redis_corrupt_entry_is_a_miss_and_deleted(resp_server):
+    host, port = resp_server.server_address
+    backend = RedisCacheBackend(f'redis://{host}:{port}/0')
+    resp_server.store[b'a'] = (b'not a pickle', None, )
+
+    assert backend.get('a') is CACHE_MISS
+    assert backend.num_errors == 1
+    assert b'a' not in resp_server.store
+
+
+@pytest.mark.parametrize('backend_class', [SQLiteCacheBackend, RedisCacheBackend])
+def test_unpicklable_value_is_not_stored(backend_class, tmp_path, resp_server):
+    if backend_class is SQLiteCacheBackend:
+        backend = SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'))
+    else:
+        host, port = resp_server.server_address
+        backend = RedisCacheBackend(f'redis://{host}:{port}/0')
+
+    backend.set('a', Unpicklable())
+
+    assert backend.get('a') is CACHE_MISS
+    assert backend.num_errors == 1
+
+
+def test_redis_error_reply_raises(resp_server):
+    host, port = resp_server.server_address
+    backend = RedisCacheBackend(f'redis://{host}:{port}/0')
+
+    with pytest.raises(RedisError):
+        backend.execute('FLUSHALL')
+
+    # the connection is still usable after an error reply
+    backend.set('a', 1)
+    assert backend.get('a') == 1
+
+
+def test_redis_unreachable_server_is_a_miss():
+    backend = RedisCacheBackend('redis://127.0.0.1:1/0', socket_timeout=0.2)
+
+    backend.set('a', 1)
+    assert backend.get('a') is CACHE_MISS
+    assert backend.num_errors == 2
+
+
+def test_redis_reconnects_after_fork(resp_server, monkeypatch):
+    host, port = resp_server.server_address
+    backend = RedisCacheBackend(f'redis://{host}:{port}/0')
+    backend.set('a', 1)
+    parent_sock = backend._sock
+
+    # as seen from a forked child
+    monkeypatch.setattr(os, 'getpid', lambda: backend._pid + 1)
+
+    assert backend.get('a') == 1
+    assert backend._sock is not parent_sock
+
+
+##
+# `cached()`
+
+
+def test_cached_keys_are_versioned(monkeypatch):
+    backend = LRUCacheBackend()
+    monkeypatch.setattr(cache_utils, 'get_cache_backend', lambda local=False: backend)
+
+    @cached(name='test_cached_keys_are_versioned')
+    def f(x):
+        return x * 2
+
+    assert f(2) == 4
+    keys = list(backend._entries.keys())
+    assert keys == [f"phablytics:{phablytics.__version__}:test_cached_keys_are_versioned:(2,):[]"]
+
+
+def test_cached_stats_are_thread_safe(monkeypatch):
+    backend = LRUCacheBackend()
+    monkeypatch.setattr(cache_utils, 'get_cache_backend', lambda local=False: backend)
+
+    @cached(name='test_cached_stats_are_thread_safe')
+    def f(x):
+        return x
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: f(i % 10), range(4000)))
+
+    stats = get_cache_stats()['test_cached_stats_are_thread_safe']
+    assert stats['hits'] + stats['misses'] == 4000
+    assert stats['misses'] >= 10
+
+
+def test_cached_corrupt_entry_is_recomputed(monkeypatch, tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'))
+    monkeypatch.setattr(cache_utils, 'get_cache_backend', lambda local=False: backend)
+    calls = []
+
+    @cached(name='test_cached_corrupt_entry_is_recomputed')
+    def f(x):
+        calls.append(x)
+        return x
+
+    assert f(1) == 1
+    with backend._connect() as conn, conn:
+        conn.execute(f"""UPDATE {backend.TABLE_NAME} SET value = ?""", (b'not a pickle', ))
+
+    assert f(1) == 1
+    assert f(1) == 1
+    assert calls == [1, 1]
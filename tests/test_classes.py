@@ -0,0 +1,57 @@
+# Phablytics Imports
+from phablytics.classes import (
+    Maniphest,
+    Revision,
+)
+
+# Local Imports
+from .factories import (
+    make_revision_data,
+    make_task_data,
+)
+
+
+def _make_task_data():
+    task_data = make_task_data(
+        1,
+        100,
+        closed_ts=200,
+        points='3',
+        owner_phid='PHID-USER-2',
+        project_phids=['PHID-PROJ-1'],
+        priority={'value': 80, 'name': 'High'},
+        description={'raw': 'Fix it'},
+        **{'custom.deadline': 300}
+    )
+    return task_data
+
+
+def test_task_keeps_payload_by_default():
+    task = Maniphest(_make_task_data())
+
+    assert task.fields['priority'] == {'value': 80, 'name': 'High'}
+    assert task.fields['description'] == {'raw': 'Fix it'}
+    assert task.fields['custom.deadline'] == 300
+    assert task.attachments['projects'] == {'projectPHIDs': ['PHID-PROJ-1']}
+
+
+def test_compact_task_has_parsed_attributes_only():
+    task = Maniphest(_make_task_data(), keep_raw_data=False)
+
+    assert task.raw_data is None
+    assert 'priority' not in task.fields
+    assert (task.points, task.owner_phid, task.project_phids, ) == (3.0, 'PHID-USER-2', ('PHID-PROJ-1', ), )
+
+    # the rebuilt payload parses back into the same attributes
+    reparsed = Maniphest(task.to_raw_data(), keep_raw_data=False)
+    assert [getattr(reparsed, attr) for attr in Maniphest.__slots__ if not attr.startswith('_')] == [
+        getattr(task, attr) for attr in Maniphest.__slots__ if not attr.startswith('_')
+    ]
+
+
+def test_revision_keeps_payload_by_default():
+    revision_data = make_revision_data(1, 100, reviewer_phids=['PHID-USER-1'])
+    revision_data['fields']['summary'] = 'Summary'
+
+    assert Revision(revision_data).fields['summary'] == 'Summary'
+    assert Revision(revision_data, keep_raw_data=False).raw_data is None
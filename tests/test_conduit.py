@@ -0,0 +1,237 @@
+# Python Standard Library Imports
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+# Phablytics Imports
+from phablytics.utils import phab
+from phablytics.utils.conduit import ConduitTransport
+
+# Local Imports
+from .factories import (
+    ConduitResults,
+    make_revision_data,
+    make_task_data,
+)
+
+
+class SlowSession:
+    """Stands in for `requests.Session`, recording how many posts are in flight at once
+    """
+    def __init__(self, seconds=0.02):
+        self.seconds = seconds
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.in_flight -= 1
+        return url
+
+
+class FakeSearch:
+    """Stands in for a `*.search` Conduit method, serving `items_data` a page at a time
+    """
+    def __init__(self, items_data, page_size=2):
+        self.items_data = items_data
+        self.page_size = page_size
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, after=None, limit=None, **kwargs):
+        with self._lock:
+            self.calls.append(dict(kwargs, after=after, limit=limit))
+
+        start = int(after or 0)
+        end = start + (limit or self.page_size)
+        results = ConduitResults(self.items_data[start:end], str(end) if end < len(self.items_data) else None)
+        return results
+
+
+def test_transport_bounds_concurrency_across_threads():
+    transport = ConduitTransport(pool_size=10, max_concurrency=3)
+    transport.session = SlowSession()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(
+            lambda i: transport.post('https://phabricator.example.com/api/maniphest.search'),
+            range(16)
+        ))
+
+    assert transport.session.max_in_flight == 3
+    assert transport.stats['num_calls_by_method'] == {'maniphest.search': 16}
+
+
+def test_transport_max_concurrency_defaults_to_pool_size():
+    transport = ConduitTransport(pool_size=5)
+    assert transport.max_concurrency == 5
+
+
+def test_tasks_over_period_query_each_project(monkeypatch):
+    queried_constraints = []
+
+    def _get_maniphest_tasks(constraints, order=None, keep_raw_data=True):
+        queried_constraints.append(constraints)
+        tasks = [f"{project_phid}-task" for project_phid in constraints.get('projects', ['all'])]
+        return tasks
+
+    monkeypatch.setattr(phab, 'get_maniphest_tasks', _get_maniphest_tasks)
+
+    period_start = datetime.datetime(2026, 1, 1)
+    period_end = datetime.datetime(2026, 2, 1)
+    tasks = phab.get_tasks_created_over_period(
+        period_start,
+        period_end,
+        author_phids=['PHID-USER-1'],
+        project_phids=['PHID-PROJ-1', 'PHID-PROJ-2']
+    )
+
+    # results concatenated in the order of the projects
+    assert tasks == ['PHID-PROJ-1-task', 'PHID-PROJ-2-task']
+    assert sorted(constraints['projects'] for constraints in queried_constraints) == [['PHID-PROJ-1'], ['PHID-PROJ-2']]
+    assert all(constraints['authorPHIDs'] == ['PHID-USER-1'] for constraints in queried_constraints)
+    assert all(constraints['createdStart'] == int(period_start.timestamp()) for constraints in queried_constraints)
+
+
+def test_tasks_created_and_closed_over_periods_keeps_order(monkeypatch):
+    def _get_maniphest_tasks(constraints, order=None, keep_raw_data=True):
+        kind = 'created' if 'createdStart' in constraints else 'closed'
+        start = constraints.get('createdStart', constraints.get('closedStart'))
+        tasks = [(kind, start)]
+        return tasks
+
+    monkeypatch.setattr(phab, 'get_maniphest_tasks', _get_maniphest_tasks)
+
+    periods = [
+        (datetime.datetime(2026, 1, day), datetime.datetime(2026, 1, day + 1))
+        for day
+        in range(1, 8)
+    ]
+    results = phab.get_tasks_created_and_closed_over_periods(periods)
+
+    assert results == [
+        (
+            [('created', int(period_start.timestamp()))],
+            [('closed', int(period_start.timestamp()))],
+        )
+        for period_start, period_end
+        in periods
+    ]
+
+
+def test_tasks_created_and_closed_over_periods_for_projects_use_one_thread_pool(monkeypatch):
+    def _get_maniphest_tasks(constraints, order=None, keep_raw_data=True):
+        kind = 'created' if 'createdStart' in constraints else 'closed'
+        tasks = [(kind, constraints['projects'][0])]
+        return tasks
+
+    def _get_maniphest_tasks_by_projects(*args, **kwargs):
+        raise AssertionError('Starts a nested thread pool')
+
+    monkeypatch.setattr(phab, 'get_maniphest_tasks', _get_maniphest_tasks)
+    monkeypatch.setattr(phab, 'get_maniphest_tasks_by_projects', _get_maniphest_tasks_by_projects)
+
+    periods = [
+        (datetime.datetime(2026, 1, day), datetime.datetime(2026, 1, day + 1))
+        for day
+        in range(1, 4)
+    ]
+    results = phab.get_tasks_created_and_closed_over_periods(periods, project_phids=['PHID-PROJ-1', 'PHID-PROJ-2'])
+
+    # results concatenated in the order of the projects
+    assert results == [
+        (
+            [('created', 'PHID-PROJ-1'), ('created', 'PHID-PROJ-2')],
+            [('closed', 'PHID-PROJ-1'), ('closed', 'PHID-PROJ-2')],
+        )
+    ] * 3
+
+
+def _fake_differential_search(monkeypatch):
+    search = FakeSearch([make_revision_data(id_, 100) for id_ in range(1, 6)])
+    monkeypatch.setattr(phab, 'DIFFERENTIAL_MIRROR_ENABLED', False)
+    monkeypatch.setattr(
+        phab,
+        'PHAB',
+        SimpleNamespace(differential=SimpleNamespace(revision=SimpleNamespace(search=search)))
+    )
+    return search
+
+
+def test_differential_revisions_are_fetched_page_by_page(monkeypatch):
+    search = _fake_differential_search(monkeypatch)
+
+    revisions = phab.iter_differential_revisions(query_key='active')
+
+    # nothing is fetched before the first revision is asked for, then one page at a time
+    assert search.calls == []
+    assert next(revisions).id_ == 1
+    assert len(search.calls) == 1
+    assert [revision.id_ for revision in revisions] == [2, 3, 4, 5]
+    assert [call['after'] for call in search.calls] == [None, '2', '4']
+    assert all(call['queryKey'] == 'active' for call in search.calls)
+
+
+def test_differential_revisions_stop_at_max_count(monkeypatch):
+    search = _fake_differential_search(monkeypatch)
+
+    revisions = list(phab.iter_differential_revisions(page_size=2, max_count=3))
+
+    # the last page only asks for what is missing
+    assert [revision.id_ for revision in revisions] == [1, 2, 3]
+    assert [(call['after'], call['limit'], ) for call in search.calls] == [(None, 2), ('2', 1)]
+
+
+def _fake_maniphest_search(monkeypatch):
+    search = FakeSearch([make_task_data(id_, 100) for id_ in range(1, 6)])
+    monkeypatch.setattr(phab, 'PHAB', SimpleNamespace(maniphest=SimpleNamespace(search=search)))
+    return search
+
+
+def test_maniphest_tasks_are_fetched_page_by_page(monkeypatch):
+    search = _fake_maniphest_search(monkeypatch)
+
+    tasks = phab.iter_maniphest_tasks({'statuses': ['open']}, use_mirror=False)
+
+    assert next(tasks).id_ == 1
+    assert next(tasks).id_ == 2
+    # the next page is only fetched once this one is consumed
+    assert len(search.calls) == 1
+    assert [task.id_ for task in tasks] == [3, 4, 5]
+    assert [call['after'] for call in search.calls] == [None, '2', '4']
+    assert all(call['constraints'] == {'statuses': ['open']} for call in search.calls)
+
+
+def test_maniphest_tasks_next_page_is_prefetched(monkeypatch):
+    search = _fake_maniphest_search(monkeypatch)
+
+    tasks = phab.iter_maniphest_tasks({}, use_mirror=False, prefetch=True)
+
+    # the next page is fetched while this one is being consumed
+    assert next(tasks).id_ == 1
+    deadline = time.monotonic() + 5
+    while len(search.calls) < 2:
+        assert time.monotonic() < deadline, 'Timed out'
+        time.sleep(0.01)
+
+    assert [task.id_ for task in tasks] == [2, 3, 4, 5]
+    assert [call['after'] for call in search.calls] == [None, '2', '4']
+
+
+def test_maniphest_tasks_stop_prefetching_when_iteration_stops(monkeypatch):
+    search = _fake_maniphest_search(monkeypatch)
+
+    tasks = phab.iter_maniphest_tasks({}, use_mirror=False, prefetch=True)
+    assert next(tasks).id_ == 1
+    tasks.close()
+
+    # at most the page after the one being consumed was requested
+    time.sleep(0.05)
+    assert len(search.calls) <= 2
@@ -0,0 +1,151 @@
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.classes import Revision
+from phablytics.repos.differential_revisions import DifferentialRevisionRepo
+from phablytics.utils import phab
+
+# Local Imports
+from .factories import make_revision_data
+
+
+QUERY_KEY = 'reviewed-by-me'
+REVIEWER_PHID = 'PHID-USER-1'
+
+
+class FakeDifferential:
+    """Stands in for `differential.revision.search`
+
+    The saved query `QUERY_KEY` matches revisions with `REVIEWER_PHID` as a reviewer.
+    """
+    def __init__(self):
+        self.revisions_data = {}
+        self.queries = []
+
+    def upsert(self, id_, modified_ts, reviewer_phids):
+        self.revisions_data[id_] = make_revision_data(id_, modified_ts, reviewer_phids=reviewer_phids)
+
+    def get_differential_revisions(self, constraints, query_key=None, keep_raw_data=False):
+        self.queries.append((query_key, dict(constraints), ))
+
+        revisions = []
+        for revision_data in sorted(self.revisions_data.values(), key=lambda data: -data['id']):
+            fields = revision_data['fields']
+            reviewer_phids = [reviewer['reviewerPHID'] for reviewer in revision_data['attachments']['reviewers']['reviewers']]
+            if 'modifiedStart' in constraints and fields['dateModified'] < constraints['modifiedStart']:
+                continue
+            if query_key == QUERY_KEY and REVIEWER_PHID not in reviewer_phids:
+                continue
+            revisions.append(Revision(revision_data, keep_raw_data=keep_raw_data))
+
+        return revisions
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(DifferentialRevisionRepo, 'DB_FILE', str(tmp_path / 'mirror.sqlite'))
+    repo = DifferentialRevisionRepo()
+    monkeypatch.setattr(phab, 'differential_revision_repo', repo)
+    return repo
+
+
+@pytest.fixture
+def differential(monkeypatch):
+    differential = FakeDifferential()
+    monkeypatch.setattr(phab, 'get_differential_revisions', differential.get_differential_revisions)
+    return differential
+
+
+def _matching_ids(repo):
+    ids = [revision.id_ for revision in repo.search(query_key=QUERY_KEY)]
+    return ids
+
+
+def _sync(query_key=None, full=False):
+    phab.sync_differential_revisions(full=full)
+    sync_run = phab.sync_differential_revisions(query_key=query_key, full=full)
+    return sync_run
+
+
+def test_incremental_sync_fetches_only_modified_revisions(repo, differential):
+    differential.upsert(1, 100, [REVIEWER_PHID])
+    differential.upsert(2, 200, ['PHID-USER-2'])
+    first_run = phab.sync_differential_revisions()
+
+    differential.upsert(2, 300, ['PHID-USER-2'])
+    second_run = phab.sync_differential_revisions()
+
+    assert first_run['is_full'] is True
+    assert (first_run['num_fetched'], first_run['num_updated'], ) == (2, 2, )
+    assert second_run['is_full'] is False
+    assert differential.queries[-1] == (None, {'modifiedStart': 200}, )
+    # revision 2 only; `modifiedStart` is inclusive, and revision 1 was modified before it
+    assert (second_run['num_fetched'], second_run['num_updated'], ) == (1, 1, )
+    assert second_run['high_water_mark'] == 300
+
+
+def test_incremental_sync_drops_revisions_which_stopped_matching(repo, differential):
+    differential.upsert(1, 100, [REVIEWER_PHID])
+    differential.upsert(2, 100, [REVIEWER_PHID])
+    differential.upsert(3, 100, ['PHID-USER-2'])
+    _sync(query_key=QUERY_KEY)
+    assert _matching_ids(repo) == [2, 1]
+
+    # reviewer removed from 1, added to 3
+    differential.upsert(1, 200, ['PHID-USER-2'])
+    differential.upsert(3, 200, [REVIEWER_PHID])
+    sync_run = _sync(query_key=QUERY_KEY)
+
+    assert sync_run['is_full'] is False
+    assert _matching_ids(repo) == [3, 2]
+
+
+def test_full_sync_replaces_matching_revisions(repo, differential):
+    differential.upsert(1, 100, [REVIEWER_PHID])
+    differential.upsert(2, 150, [REVIEWER_PHID])
+    _sync(query_key=QUERY_KEY)
+
+    # stops matching, but the mirror of all revisions hasn't seen the change (it was last
+    # mirrored as modified before the saved query's high-water mark), so an incremental sync can't tell
+    differential.upsert(1, 200, ['PHID-USER-2'])
+    phab.sync_differential_revisions(query_key=QUERY_KEY)
+    assert _matching_ids(repo) == [2, 1]
+
+    sync_run = phab.sync_differential_revisions(query_key=QUERY_KEY, full=True)
+
+    assert sync_run['is_full'] is True
+    assert _matching_ids(repo) == [2]
+
+
+def test_ensure_fresh_fully_syncs_saved_queries_periodically(repo, differential, monkeypatch):
+    differential.upsert(1, 100, [REVIEWER_PHID])
+    phab.ensure_differential_mirror_is_fresh(query_key=QUERY_KEY)
+    assert differential.queries == [(None, {}, ), (QUERY_KEY, {}, )]
+
+    # fresh: no syncs
+    phab.ensure_differential_mirror_is_fresh(query_key=QUERY_KEY)
+    assert len(differential.queries) == 2
+
+    # stale: incremental syncs
+    monkeypatch.setattr(phab, 'DIFFERENTIAL_MIRROR_MAX_AGE', -1)
+    phab.ensure_differential_mirror_is_fresh(query_key=QUERY_KEY)
+    assert differential.queries[2:] == [(None, {'modifiedStart': 100}, ), (QUERY_KEY, {'modifiedStart': 100}, )]
+
+    # full sync of the saved query due
+    monkeypatch.setattr(phab, 'DIFFERENTIAL_MIRROR_QUERY_KEY_FULL_SYNC_INTERVAL', -1)
+    phab.ensure_differential_mirror_is_fresh(query_key=QUERY_KEY)
+    assert differential.queries[4:] == [(None, {'modifiedStart': 100}, ), (QUERY_KEY, {}, )]
+
+
+def test_search_filters(repo, differential):
+    differential.upsert(1, 100, [REVIEWER_PHID])
+    differential.upsert(2, 200, ['PHID-USER-2'])
+    differential.upsert(3, 300, ['PHID-USER-3', REVIEWER_PHID])
+    phab.sync_differential_revisions()
+
+    assert [revision.id_ for revision in repo.search(reviewer_phids=[REVIEWER_PHID])] == [3, 1]
+    assert [revision.id_ for revision in repo.search(modified_start=150, modified_end=250)] == [2]
+    assert [revision.id_ for revision in repo.search(statuses=['accepted'])] == []
+    # reviewers are stored with the revision
+    assert repo.search(modified_start=300)[0].reviewer_phids == ('PHID-USER-3', REVIEWER_PHID, )
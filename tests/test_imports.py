@@ -0,0 +1,33 @@
+# Python Standard Library Imports
+import os
+import subprocess
+import sys
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Local Imports
+from .conftest import ROOT_DIR
+
+
+@pytest.mark.parametrize(
+    'module_name',
+    [
+        'phablytics.cli',
+        'phablytics.repos',
+        'phablytics.reports.runner',
+        'phablytics.utils',
+        'phablytics.web.server',
+    ]
+)
+def test_import(module_name):
+    """Each entry point imports cleanly in a fresh interpreter, i.e. when imported first
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    result = subprocess.run(
+        [sys.executable, '-c', f'import {module_name}'],
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,156 @@
+# Python Standard Library Imports
+import threading
+import time
+
+# Phablytics Imports
+from phablytics.web.jobs import JobRunner
+
+
+def _wait_until_finished(*jobs):
+    deadline = time.monotonic() + 5
+    while not all(job.is_finished for job in jobs):
+        assert time.monotonic() < deadline, 'Timed out'
+        time.sleep(0.01)
+
+
+def test_identical_jobs_are_joined():
+    runner = JobRunner(max_workers=2)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def _compute(x):
+        calls.append(x)
+        started.set()
+        release.wait(timeout=5)
+        return x * 2
+
+    job = runner.submit('a', _compute, 1)
+    started.wait(timeout=5)
+    assert job.status == 'running'
+
+    assert runner.submit('a', _compute, 1) is job
+    assert runner.get('a') is job
+
+    release.set()
+    _wait_until_finished(job)
+
+    # finished, but not expired
+    assert runner.submit('a', _compute, 1) is job
+    assert (job.status, job.result, calls, ) == ('done', 2, [1], )
+
+
+def test_finished_jobs_expire():
+    runner = JobRunner(result_ttl=0.1)
+
+    job = runner.submit('a', lambda: 1)
+    _wait_until_finished(job)
+    time.sleep(0.2)
+
+    assert runner.get('a') is None
+    new_job = runner.submit('a', lambda: 2)
+    assert new_job is not job
+    _wait_until_finished(new_job)
+    assert new_job.result == 2
+
+
+def test_expired_jobs_are_pruned_when_jobs_finish():
+    runner = JobRunner(result_ttl=0.1)
+
+    job_a = runner.submit('a', lambda: 1)
+    _wait_until_finished(job_a)
+    time.sleep(0.2)
+
+    job_b = runner.submit('b', lambda: 2)
+    _wait_until_finished(job_b)
+
+    # without polling `a`
+    deadline = time.monotonic() + 5
+    while 'a' in runner.jobs:
+        assert time.monotonic() < deadline, 'Timed out'
+        time.sleep(0.01)
+
+
+def test_failed_jobs_are_retried_after_error_ttl():
+    runner = JobRunner(error_ttl=0.1)
+    attempts = []
+
+    def _compute():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise Exception('Conduit error')
+        return 'ok'
+
+    job = runner.submit('a', _compute)
+    _wait_until_finished(job)
+    assert job.status == 'failed'
+    assert 'Conduit error' in job.error
+
+    # pollers see the failure for a while
+    assert runner.submit('a', _compute) is job
+
+    time.sleep(0.2)
+    retried_job = runner.submit('a', _compute)
+    _wait_until_finished(retried_job)
+
+    assert (retried_job.status, retried_job.result, attempts, ) == ('done', 'ok', [0, 1], )
+
+
+def test_least_recently_used_jobs_are_dropped():
+    runner = JobRunner(max_jobs=2)
+
+    job_a = runner.submit('a', lambda: 1)
+    job_b = runner.submit('b', lambda: 2)
+    _wait_until_finished(job_a, job_b)
+    runner.get('a')
+
+    runner.submit('c', lambda: 3)
+
+    assert list(runner.jobs.keys()) == ['a', 'c']
+
+
+def test_finished_jobs_are_dropped_before_unfinished_ones():
+    runner = JobRunner(max_workers=2, max_jobs=2)
+    release = threading.Event()
+
+    job_a = runner.submit('a', release.wait, 5)
+    job_b = runner.submit('b', lambda: 2)
+    _wait_until_finished(job_b)
+
+    runner.submit('c', lambda: 3)
+
+    assert list(runner.jobs.keys()) == ['a', 'c']
+    release.set()
+    _wait_until_finished(job_a)
+
+
+def test_unfinished_jobs_are_never_dropped():
+    runner = JobRunner(max_workers=3, max_jobs=1)
+    releases = {1: threading.Event(), 2: threading.Event()}
+    calls = []
+
+    def _compute(x):
+        calls.append(x)
+        releases[x].wait(timeout=5)
+        return x
+
+    job_a = runner.submit('a', _compute, 1)
+    job_b = runner.submit('b', _compute, 2)
+
+    # both are kept while running, so pollers join them instead of running them again
+    assert list(runner.jobs.keys()) == ['a', 'b']
+    assert runner.get('a') is job_a
+    assert runner.submit('b', _compute, 2) is job_b
+
+    # the excess is dropped once finished
+    releases[1].set()
+    _wait_until_finished(job_a)
+    deadline = time.monotonic() + 5
+    while 'a' in runner.jobs:
+        assert time.monotonic() < deadline, 'Timed out'
+        time.sleep(0.01)
+    assert list(runner.jobs.keys()) == ['b']
+
+    releases[2].set()
+    _wait_until_finished(job_b)
+    assert sorted(calls) == [1, 2]
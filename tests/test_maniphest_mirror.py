@@ -0,0 +1,191 @@
+# Python Standard Library Imports
+import threading
+import time
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.constants import MANIPHEST_ASSIGNED_NONE
+from phablytics.repos.maniphest_tasks import ManiphestTaskRepo
+from phablytics.utils import phab
+
+# Local Imports
+from .factories import make_task_data
+
+
+class FakeManiphest:
+    """Stands in for `maniphest.search`, answering only `modifiedStart`
+    """
+    def __init__(self):
+        self.tasks_data = {}
+        self.queries = []
+        # called before each task is yielded
+        self.on_task = None
+
+    def upsert(self, id_, created_ts, closed_ts=None, modified_ts=None, **kwargs):
+        task_data = make_task_data(id_, created_ts, closed_ts=closed_ts, **kwargs)
+        if modified_ts is not None:
+            task_data['fields']['dateModified'] = modified_ts
+        self.tasks_data[id_] = task_data
+
+    def iter_maniphest_tasks(
+        self,
+        constraints,
+        order=None,
+        use_mirror=True,
+        keep_raw_data=True,
+        with_columns=False,
+        prefetch=False
+    ):
+        assert use_mirror is False
+        self.queries.append(dict(constraints))
+
+        for task_data in sorted(self.tasks_data.values(), key=lambda data: -data['id']):
+            if task_data['fields']['dateModified'] >= constraints.get('modifiedStart', 0):
+                if self.on_task is not None:
+                    self.on_task(task_data)
+                yield Maniphest(task_data, keep_raw_data=keep_raw_data)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(ManiphestTaskRepo, 'DB_FILE', str(tmp_path / 'mirror.sqlite'))
+    repo = ManiphestTaskRepo()
+    monkeypatch.setattr(phab, 'maniphest_task_repo', repo)
+    return repo
+
+
+@pytest.fixture
+def maniphest(monkeypatch):
+    maniphest = FakeManiphest()
+    monkeypatch.setattr(phab, 'iter_maniphest_tasks', maniphest.iter_maniphest_tasks)
+    return maniphest
+
+
+def _search_ids(repo, constraints, order=None):
+    assert repo.can_search(constraints, order=order)
+    ids = [task.id_ for task in repo.search(constraints, order=order)]
+    return ids
+
+
+def test_incremental_sync_fetches_only_modified_tasks(repo, maniphest):
+    maniphest.upsert(1, 100)
+    maniphest.upsert(2, 200)
+    first_run = phab.sync_maniphest_tasks()
+
+    maniphest.upsert(2, 200, closed_ts=300)
+    second_run = phab.sync_maniphest_tasks()
+
+    assert maniphest.queries == [{}, {'modifiedStart': 200}]
+    assert (first_run['num_fetched'], first_run['num_updated'], ) == (2, 2, )
+    assert (second_run['num_fetched'], second_run['num_updated'], ) == (1, 1, )
+    assert second_run['high_water_mark'] == 300
+    assert second_run['version'] == first_run['version'] + 1
+
+    # unchanged; the last task of the previous sync is re-fetched, but not updated
+    third_run = phab.sync_maniphest_tasks()
+    assert (third_run['num_fetched'], third_run['num_updated'], ) == (1, 0, )
+
+
+def test_search_matches_conduit_constraints(repo, maniphest):
+    maniphest.upsert(1, 100, owner_phid='PHID-USER-1', project_phids=['PHID-PROJ-1', 'PHID-PROJ-2'])
+    maniphest.upsert(2, 200, closed_ts=250, owner_phid='PHID-USER-2', project_phids=['PHID-PROJ-1'])
+    maniphest.upsert(3, 300, subtype='bug')
+    phab.sync_maniphest_tasks()
+
+    assert _search_ids(repo, {}) == [1, 2, 3]
+    assert _search_ids(repo, {}, order=['id']) == [3, 2, 1]
+    assert _search_ids(repo, {'assigned': ['PHID-USER-2']}) == [2]
+    assert _search_ids(repo, {'assigned': ['PHID-USER-1', MANIPHEST_ASSIGNED_NONE]}) == [1, 3]
+    # `projects` is 'AND'
+    assert _search_ids(repo, {'projects': ['PHID-PROJ-1']}) == [1, 2]
+    assert _search_ids(repo, {'projects': ['PHID-PROJ-1', 'PHID-PROJ-2']}) == [1]
+    assert _search_ids(repo, {'subtypes': ['bug']}) == [3]
+    assert _search_ids(repo, {'statuses': ['resolved']}) == [2]
+    # ranges are inclusive
+    assert _search_ids(repo, {'createdStart': 100, 'createdEnd': 200}) == [1, 2]
+    assert _search_ids(repo, {'closedStart': 250, 'closedEnd': 250}) == [2]
+
+    # the stored payload round-trips
+    task = repo.search({'ids': [2]})[0]
+    assert (task.closed_ts, task.owner_phid, task.project_phids, ) == (250, 'PHID-USER-2', ('PHID-PROJ-1', ), )
+
+
+def test_can_search(repo, maniphest):
+    # not before the initial sync
+    assert not repo.can_search({})
+
+    phab.sync_maniphest_tasks()
+
+    assert repo.can_search({'projects': ['PHID-PROJ-1']})
+    # slugs are not mirrored
+    assert not repo.can_search({'projects': ['my-project']})
+    assert not repo.can_search({'query': 'title'})
+    assert not repo.can_search({}, order=['priority'])
+
+
+def test_task_changes_are_tracked_by_version(repo, maniphest):
+    maniphest.upsert(1, 100, closed_ts=150)
+    maniphest.upsert(2, 200)
+    initial_version = phab.sync_maniphest_tasks()['version']
+
+    # nothing can have been derived from the mirror before the initial sync
+    assert not repo.has_changes_since(0, 0, 1000)
+
+    # task 1 reopened: its previous close date is affected
+    maniphest.upsert(1, 100, modified_ts=400)
+    phab.sync_maniphest_tasks()
+
+    assert repo.has_changes_since(initial_version, 140, 160)
+    assert repo.has_changes_since(initial_version, 90, 110)
+    assert not repo.has_changes_since(initial_version, 200, 300)
+    assert not repo.has_changes_since(initial_version + 1, 0, 1000)
+
+
+def test_ensure_fresh_syncs_when_stale(repo, maniphest, monkeypatch):
+    phab.ensure_maniphest_mirror_is_fresh()
+    phab.ensure_maniphest_mirror_is_fresh()
+    assert len(maniphest.queries) == 1
+
+    monkeypatch.setattr(phab, 'MANIPHEST_MIRROR_MAX_AGE', -1)
+    phab.ensure_maniphest_mirror_is_fresh()
+    assert len(maniphest.queries) == 2
+
+
+def test_threads_finding_the_mirror_stale_wait_for_one_sync(repo, maniphest):
+    maniphest.upsert(1, 100)
+    maniphest.on_task = lambda task_data: time.sleep(0.2)
+    barrier = threading.Barrier(4)
+
+    def _ensure_fresh():
+        barrier.wait(timeout=5)
+        phab.ensure_maniphest_mirror_is_fresh()
+
+    threads = [threading.Thread(target=_ensure_fresh) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert maniphest.queries == [{}]
+
+
+def test_sync_writes_tasks_page_by_page(repo, maniphest, monkeypatch):
+    monkeypatch.setattr(repo, 'SAVE_BATCH_SIZE', 2)
+    for id_ in range(1, 6):
+        maniphest.upsert(id_, id_ * 100)
+
+    num_saved_by_task_id = {}
+
+    def _on_task(task_data):
+        num_saved_by_task_id[task_data['id']] = len(repo.search({}))
+
+    maniphest.on_task = _on_task
+    sync_run = phab.sync_maniphest_tasks()
+
+    # earlier pages are written while later ones are fetched
+    assert num_saved_by_task_id == {5: 0, 4: 0, 3: 2, 2: 2, 1: 4}
+    assert (sync_run['num_fetched'], sync_run['num_updated'], sync_run['high_water_mark'], ) == (5, 5, 500, )
+    assert _search_ids(repo, {}) == [1, 2, 3, 4, 5]
@@ -0,0 +1,75 @@
+# Python Standard Library Imports
+import sqlite3
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.repos.metric_results import MetricResultRepo
+
+# Local Imports
+from .factories import make_task_data
+
+
+def _make_key(subtypes, **filters):
+    key = dict({
+        'subtypes': ','.join(sorted(subtypes)),
+        'team': '',
+        'customer': '',
+        'projects': '',
+        'username': '',
+    }, **filters)
+    return key
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(MetricResultRepo, 'DB_FILE', str(tmp_path / 'results.sqlite'))
+    repo = MetricResultRepo()
+    return repo
+
+
+def test_results_are_keyed_by_subtypes_and_filters(repo):
+    bug = Maniphest(make_task_data(1, 100, subtype='bug'))
+    story = Maniphest(make_task_data(2, 100, subtype='story'))
+
+    repo.save(_make_key(['bug']), 0, 200, [bug], [])
+    repo.save(_make_key(['story']), 0, 200, [story], [])
+
+    assert [task.id_ for task in repo.get(_make_key(['bug']), 0, 200)['tasks_created']] == [1]
+    assert [task.id_ for task in repo.get(_make_key(['story']), 0, 200)['tasks_created']] == [2]
+    assert repo.get(_make_key(['bug', 'story']), 0, 200) is None
+    assert repo.get(_make_key(['bug'], team='Team A'), 0, 200) is None
+    assert repo.get(_make_key(['bug']), 0, 300) is None
+
+
+def test_results_keyed_by_metric_type_are_dropped(tmp_path, monkeypatch):
+    db_file = str(tmp_path / 'old.sqlite')
+    conn = sqlite3.connect(db_file)
+    conn.execute(f"""CREATE TABLE {MetricResultRepo.TABLE_NAME}(
+metric_type VARCHAR,
+subtypes VARCHAR,
+team VARCHAR,
+customer VARCHAR,
+projects VARCHAR,
+username VARCHAR,
+interval_start INTEGER,
+interval_end INTEGER,
+mirror_version INTEGER,
+computed_at INTEGER,
+tasks_created TEXT,
+tasks_closed TEXT
+)""")
+    conn.execute(
+        f"""INSERT INTO {MetricResultRepo.TABLE_NAME} VALUES ('TaskMetric', 'bug', '', '', '', '', 0, 200, NULL, 0, '[]', '[]')"""
+    )
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(MetricResultRepo, 'DB_FILE', db_file)
+    repo = MetricResultRepo()
+
+    assert repo.get(_make_key(['bug']), 0, 200) is None
+    repo.save(_make_key(['bug']), 0, 200, [], [])
+    assert repo.get(_make_key(['bug']), 0, 200)['tasks_created'] == []
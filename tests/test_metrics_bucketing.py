@@ -0,0 +1,95 @@
+# Python Standard Library Imports
+import datetime
+import random
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.metrics import metrics as metrics_module
+from phablytics.metrics.metrics import Metrics
+from phablytics.metrics.utils import make_intervals
+
+# Local Imports
+from .factories import make_task_data
+
+
+PERIOD_START = datetime.datetime(2026, 1, 1)
+PERIOD_END = datetime.datetime(2026, 6, 1)
+
+
+def _make_tasks(intervals):
+    """Random tasks, plus tasks created and closed exactly on the boundaries of `intervals`
+    """
+    rng = random.Random(7)
+    start_ts = int(intervals[-1][0].timestamp())
+    end_ts = int(PERIOD_END.timestamp())
+
+    tasks_data = []
+    for id_ in range(1, 501):
+        created_ts = rng.randint(start_ts - 86400, end_ts + 86400)
+        closed_ts = created_ts + rng.randint(0, 30 * 86400) if rng.random() < 0.6 else None
+        tasks_data.append(make_task_data(id_, created_ts, closed_ts=closed_ts))
+
+    for i, (start, end) in enumerate(intervals):
+        boundary_ts = int(start.timestamp())
+        tasks_data.append(make_task_data(1000 + i, boundary_ts, closed_ts=int(end.timestamp())))
+
+    rng.shuffle(tasks_data)
+    tasks = [Maniphest(task_data) for task_data in tasks_data]
+    return tasks
+
+
+def _fake_get_tasks_created_and_closed_over_periods(tasks):
+    """Answers queries the way `maniphest.search` does: inclusive date constraints, oldest first
+    """
+    def _query(periods, subtypes=None, user_phids=None, project_phids=None, keep_raw_data=True):
+        results = []
+        for period_start, period_end in periods:
+            start_ts = int(period_start.timestamp())
+            end_ts = int(period_end.timestamp())
+            tasks_created = sorted(
+                [task for task in tasks if start_ts <= task.created_ts <= end_ts],
+                key=lambda task: task.id_
+            )
+            tasks_closed = sorted(
+                [task for task in tasks if task.closed_ts and start_ts <= task.closed_ts <= end_ts],
+                key=lambda task: task.id_
+            )
+            results.append((tasks_created, tasks_closed, ))
+        return results
+
+    return _query
+
+
+@pytest.mark.parametrize('interval', ['week', 'month'])
+def test_local_bucketing_matches_per_interval_queries(monkeypatch, interval):
+    intervals = make_intervals(PERIOD_START, PERIOD_END, interval)
+    tasks = _make_tasks(intervals)
+    monkeypatch.setattr(
+        metrics_module,
+        'get_tasks_created_and_closed_over_periods',
+        _fake_get_tasks_created_and_closed_over_periods(tasks)
+    )
+
+    def _retrieve(bucket_locally):
+        monkeypatch.setattr(metrics_module, 'METRICS_BUCKET_INTERVALS_LOCALLY', bucket_locally)
+        tasks_by_interval = Metrics()._retrieve_tasks_by_interval(intervals, ['default'])
+        ids_by_interval = [
+            (list(created_columns.ids), list(closed_columns.ids), )
+            for created_columns, closed_columns
+            in tasks_by_interval
+        ]
+        return ids_by_interval
+
+    bucketed = _retrieve(True)
+    queried = _retrieve(False)
+
+    assert bucketed == queried
+    # boundary tasks land in both adjacent buckets
+    assert sum(len(created_ids) for created_ids, closed_ids in bucketed) > len({
+        id_
+        for created_ids, closed_ids in bucketed
+        for id_ in created_ids
+    })
@@ -0,0 +1,71 @@
+# Python Standard Library Imports
+from types import SimpleNamespace
+
+# Phablytics Imports
+from phablytics.web.metrics import forms
+from phablytics.web.metrics.forms import (
+    AUTOCOMPLETE_OPTIONS,
+    MetricsFilterForm,
+    get_autocomplete_suggestions,
+)
+
+
+USERNAMES = ['alan', 'al', 'bob', 'carla', 'kaleb', 'sally']
+
+
+def test_form_choices_are_looked_up_when_a_form_is_made(monkeypatch):
+    # Phablytics Imports
+    from phablytics.web import application
+
+    customers = [SimpleNamespace(name='Zeta Corp'), SimpleNamespace(name='Acme')]
+    looked_up = []
+
+    def _get_customers():
+        looked_up.append('customers')
+        return customers
+
+    def _get_active_usernames():
+        looked_up.append('usernames')
+        return USERNAMES
+
+    monkeypatch.setattr(forms, 'get_customers', _get_customers)
+    monkeypatch.setattr(forms, 'get_active_usernames', _get_active_usernames)
+
+    with application.test_request_context('/metrics'):
+        form = MetricsFilterForm(meta={'csrf': False})
+        assert form.customer.choices == [('', ''), ('Acme', 'Acme'), ('Zeta Corp', 'Zeta Corp')]
+
+        # not frozen: a new customer shows up in the next form
+        customers.append(SimpleNamespace(name='Beta'))
+        form = MetricsFilterForm(meta={'csrf': False})
+        assert [value for value, label in form.customer.choices] == ['', 'Acme', 'Beta', 'Zeta Corp']
+
+    if forms.METRICS_FILTER_USERNAME_AUTOCOMPLETE:
+        # active users are only listed by the autocomplete endpoint
+        assert looked_up == ['customers', 'customers']
+        assert form.username.render_kw['data-autocomplete'] == 'username'
+    else:
+        assert looked_up == ['customers', 'usernames', 'customers', 'usernames']
+        assert len(form.username.choices) == len(USERNAMES) + 1
+
+
+def test_autocomplete_suggestions_list_prefix_matches_first(monkeypatch):
+    monkeypatch.setitem(AUTOCOMPLETE_OPTIONS, 'username', lambda: USERNAMES)
+
+    assert get_autocomplete_suggestions('username', ' AL') == ['alan', 'al', 'kaleb', 'sally']
+    assert get_autocomplete_suggestions('username', 'al', limit=3) == ['alan', 'al', 'kaleb']
+    assert get_autocomplete_suggestions('username', 'xyz') == []
+
+
+def test_autocomplete_endpoint(monkeypatch):
+    # Phablytics Imports
+    from phablytics.web import application
+
+    monkeypatch.setitem(AUTOCOMPLETE_OPTIONS, 'username', lambda: USERNAMES)
+    client = application.test_client()
+
+    response = client.get('/metrics/autocomplete/username.json?q=b')
+    assert (response.status_code, response.get_json(), ) == (200, {'suggestions': ['bob', 'kaleb']}, )
+
+    # only the fields which can be autocompleted
+    assert client.get('/metrics/autocomplete/team.json?q=b').status_code == 404
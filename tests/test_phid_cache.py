@@ -0,0 +1,64 @@
+# Python Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.cache import invalidate_caches
+from phablytics.cache.backends import LRUCacheBackend
+from phablytics.cache.utils import CacheStats
+from phablytics.utils import phab
+
+
+@pytest.fixture
+def queried_phids(monkeypatch):
+    queried_phids = []
+
+    def _query_phids(phids):
+        queried_phids.extend(phids)
+        results = {phid: {'phid': phid, 'name': phid.lower()} for phid in phids}
+        return results
+
+    monkeypatch.setattr(phab, 'query_phids', _query_phids)
+    monkeypatch.setattr(phab, 'PHID_CACHE', LRUCacheBackend(maxsize=100))
+    monkeypatch.setattr(phab, 'PHID_CACHE_STATS', CacheStats())
+    monkeypatch.setattr(phab, 'PHID_CACHE_ENABLED', True)
+    return queried_phids
+
+
+def test_only_missing_phids_are_queried(queried_phids):
+    phab.get_phids(['PHID-USER-1', 'PHID-PROJ-1'])
+    lookup = phab.get_phids(['PHID-USER-1', 'PHID-USER-2'])
+
+    assert sorted(queried_phids) == ['PHID-PROJ-1', 'PHID-USER-1', 'PHID-USER-2']
+    assert lookup['PHID-USER-1'].raw_data['name'] == 'phid-user-1'
+    assert (phab.PHID_CACHE_STATS.hits, phab.PHID_CACHE_STATS.misses, ) == (1, 3, )
+
+
+def test_stats_are_thread_safe(queried_phids):
+    phids = [f'PHID-USER-{i}' for i in range(10)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: phab.get_phids(phids[i % 10:] + phids[:i % 10]), range(500)))
+
+    assert phab.PHID_CACHE_STATS.hits + phab.PHID_CACHE_STATS.misses == 5000
+
+
+def test_invalidate_caches_drops_phids(queried_phids):
+    phab.get_phids(['PHID-USER-1'])
+
+    invalidate_caches()
+    phab.get_phids(['PHID-USER-1'])
+
+    assert queried_phids == ['PHID-USER-1', 'PHID-USER-1']
+
+
+def test_refresh_projects_drops_project_phids_only(queried_phids):
+    phab.get_phids(['PHID-USER-1', 'PHID-PROJ-1'])
+    del queried_phids[:]
+
+    phab.refresh_projects()
+    phab.get_phids(['PHID-USER-1', 'PHID-PROJ-1'])
+
+    assert queried_phids == ['PHID-PROJ-1']
@@ -0,0 +1,175 @@
+# Python Standard Library Imports
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.classes import Revision
+from phablytics.reports import planner
+from phablytics.reports.base import PhablyticsReport
+from phablytics.reports.planner import (
+    DifferentialRevisionsRequirement,
+    ManiphestTasksRequirement,
+    plan_report_data,
+    prefetch_report_data,
+)
+from phablytics.settings import ReportConfig
+
+# Local Imports
+from .factories import make_revision_data
+
+
+class FakeReport:
+    """Stands in for a `PhablyticsReport`, declaring `requirements`
+    """
+    def __init__(self, requirements, name='Report'):
+        self.report_config = ReportConfig(name=name, report_type='Fake')
+        self.requirements = requirements
+        self.prefetched_data = {}
+
+    def _get_data_requirements(self):
+        if isinstance(self.requirements, Exception):
+            raise self.requirements
+        return self.requirements
+
+
+def _dt(ts):
+    dt = datetime.datetime.fromtimestamp(ts)
+    return dt
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    queries = []
+
+    def _get_maniphest_tasks(constraints, order=None, with_columns=False):
+        queries.append(('maniphest', constraints, ))
+        if constraints.get('projects') == ['PHID-PROJ-FAIL']:
+            raise Exception('Conduit error')
+        tasks = [f"task-{constraints['projects'][0]}"]
+        return tasks
+
+    def _fetch_differential_revisions(query_key, reviewer_phids=None, modified_after_dt=None):
+        queries.append(('differential', query_key, modified_after_dt, ))
+        revisions = [
+            Revision(make_revision_data(id_, modified_ts))
+            for id_, modified_ts
+            in ((1, 100, ), (2, 200, ), (3, 300, ), )
+            if modified_after_dt is None or modified_ts >= modified_after_dt.timestamp()
+        ]
+        return revisions
+
+    monkeypatch.setattr(planner, 'get_maniphest_tasks', _get_maniphest_tasks)
+    monkeypatch.setattr(planner, 'fetch_differential_revisions', _fetch_differential_revisions)
+    return queries
+
+
+def test_equal_maniphest_requirements_are_merged():
+    report_a = FakeReport({
+        'tasks': ManiphestTasksRequirement({'projects': ['PHID-PROJ-1'], 'statuses': ['open']}),
+    })
+    report_b = FakeReport({
+        # same constraints, in another order
+        'open_tasks': ManiphestTasksRequirement({'statuses': ['open'], 'projects': ['PHID-PROJ-1']}),
+        'ordered_tasks': ManiphestTasksRequirement({'projects': ['PHID-PROJ-1'], 'statuses': ['open']}, order=['id']),
+        'tasks_with_columns': ManiphestTasksRequirement(
+            {'projects': ['PHID-PROJ-1'], 'statuses': ['open']},
+            with_columns=True
+        ),
+    })
+
+    plan = plan_report_data([report_a, report_b])
+
+    names_by_query = sorted([sorted(name for _, name, _ in slices) for _, slices in plan])
+    assert names_by_query == [['open_tasks', 'tasks'], ['ordered_tasks'], ['tasks_with_columns']]
+
+
+def test_differential_requirements_are_merged_from_the_earliest_and_sliced(queries):
+    report_a = FakeReport({
+        'revisions': DifferentialRevisionsRequirement(query_key='active', modified_after_dt=_dt(250)),
+    })
+    report_b = FakeReport({
+        'revisions': DifferentialRevisionsRequirement(query_key='active', modified_after_dt=_dt(150)),
+    })
+    report_c = FakeReport({
+        # other reviewers are another query
+        'revisions': DifferentialRevisionsRequirement(query_key='active', reviewer_phids=['PHID-USER-1']),
+    })
+
+    num_queries = prefetch_report_data([report_a, report_b, report_c])
+
+    assert num_queries == 2
+    assert sorted(queries, key=str) == sorted([
+        ('differential', 'active', _dt(150), ),
+        ('differential', 'active', None, ),
+    ], key=str)
+    assert [revision.id_ for revision in report_a.prefetched_data['revisions']] == [3]
+    assert [revision.id_ for revision in report_b.prefetched_data['revisions']] == [2, 3]
+    assert [revision.id_ for revision in report_c.prefetched_data['revisions']] == [1, 2, 3]
+
+
+def test_unbounded_differential_requirement_wins_the_merge():
+    merged = DifferentialRevisionsRequirement.merge([
+        DifferentialRevisionsRequirement(query_key='active', modified_after_dt=_dt(150)),
+        DifferentialRevisionsRequirement(query_key='active'),
+    ])
+
+    assert merged.modified_after_dt is None
+
+
+def test_prefetch_fetches_each_merged_query_once(queries):
+    reports = [
+        FakeReport({'tasks': ManiphestTasksRequirement({'projects': ['PHID-PROJ-1']})})
+        for _
+        in range(3)
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        num_queries = prefetch_report_data(reports, executor=executor)
+
+    assert num_queries == 1
+    assert queries == [('maniphest', {'projects': ['PHID-PROJ-1']}, )]
+    assert all(report.prefetched_data == {'tasks': ['task-PHID-PROJ-1']} for report in reports)
+    # each report gets its own list
+    assert reports[0].prefetched_data['tasks'] is not reports[1].prefetched_data['tasks']
+
+
+def test_failures_are_left_to_the_reports(queries, capsys):
+    failing_report = FakeReport({'tasks': ManiphestTasksRequirement({'projects': ['PHID-PROJ-FAIL']})}, name='Failing')
+    broken_report = FakeReport(Exception('Invalid report config'), name='Broken')
+    report = FakeReport({'tasks': ManiphestTasksRequirement({'projects': ['PHID-PROJ-1']})})
+
+    num_queries = prefetch_report_data([failing_report, broken_report, report])
+
+    assert num_queries == 2
+    assert failing_report.prefetched_data == {}
+    assert broken_report.prefetched_data == {}
+    assert report.prefetched_data == {'tasks': ['task-PHID-PROJ-1']}
+
+    # failures are reported with the affected reports, and tracebacks
+    err = capsys.readouterr().err
+    assert 'report Broken:' in err and 'Invalid report config' in err
+    assert 'reports Failing:' in err and 'Conduit error' in err
+
+
+def test_requirements_are_declared_once_per_report(queries):
+    class Report(PhablyticsReport):
+        num_declarations = 0
+
+        def data_requirements(self):
+            self.num_declarations += 1
+            requirements = {
+                'tasks': ManiphestTasksRequirement({'projects': ['PHID-PROJ-1']}),
+            }
+            return requirements
+
+    report = Report(ReportConfig(name='Report', report_type='Report'))
+
+    prefetch_report_data([report])
+    report.prefetched_data.clear()
+    tasks = report.get_data('tasks')
+
+    assert tasks == ['task-PHID-PROJ-1']
+    assert report.num_declarations == 1
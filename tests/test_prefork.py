@@ -0,0 +1,175 @@
+# Python Standard Library Imports
+import glob
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Local Imports
+from .conftest import ROOT_DIR
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, 'fork') or not os.path.isdir('/proc/self'),
+    reason='requires `os.fork()` and /proc'
+)
+
+
+SERVER_SCRIPT = textwrap.dedent('''
+    import os
+    import sys
+    import time
+
+    from phablytics.web.prefork import PreforkWSGIServer
+
+
+    def application(environ, start_response):
+        if environ['PATH_INFO'] == '/slow':
+            time.sleep(float(environ['QUERY_STRING']))
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [str(os.getpid()).encode('utf-8')]
+
+
+    port, graceful_timeout = int(sys.argv[1]), float(sys.argv[2])
+    PreforkWSGIServer(application, '127.0.0.1', port, workers=2, threads=4, graceful_timeout=graceful_timeout).run()
+''')
+
+
+def _get_free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return port
+
+
+def _get_child_pids(pid):
+    child_pids = set()
+    for stat_file in glob.glob('/proc/[0-9]*/stat'):
+        try:
+            with open(stat_file) as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # the command name (2nd field) may contain spaces, but is in parentheses
+        fields = stat.rsplit(')', 1)[1].split()
+        if fields[0] != 'Z' and int(fields[1]) == pid:
+            child_pids.add(int(stat_file.split('/')[2]))
+    return child_pids
+
+
+def _wait_for(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError('Timed out')
+        time.sleep(0.05)
+
+
+class Server:
+    def __init__(self, tmp_path, graceful_timeout=30):
+        self.port = _get_free_port()
+        script = tmp_path / 'server.py'
+        script.write_text(SERVER_SCRIPT)
+        self.process = subprocess.Popen(
+            [sys.executable, str(script), str(self.port), str(graceful_timeout)],
+            env=dict(os.environ, PYTHONPATH=ROOT_DIR),
+            cwd=str(tmp_path),
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        _wait_for(lambda: len(self.worker_pids) == 2 and self.is_up())
+
+    @property
+    def worker_pids(self):
+        pids = _get_child_pids(self.process.pid)
+        return pids
+
+    def get(self, path='/'):
+        with urllib.request.urlopen(f'http://127.0.0.1:{self.port}{path}', timeout=10) as response:
+            body = response.read().decode('utf-8')
+        return body
+
+    def is_up(self):
+        try:
+            self.get()
+            is_up = True
+        except (urllib.error.URLError, ConnectionError):
+            is_up = False
+        return is_up
+
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.send_signal(signal.SIGTERM)
+        exit_code = self.process.wait(timeout=15)
+        return exit_code
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = Server(tmp_path)
+    yield server
+    server.stop()
+
+
+def test_workers_are_spawned_and_serve_requests(server):
+    worker_pids = server.worker_pids
+
+    assert len(worker_pids) == 2
+    assert all(int(server.get()) in worker_pids for _ in range(20))
+
+
+def test_dead_workers_are_replaced(server):
+    worker_pids = server.worker_pids
+    dead_pid = sorted(worker_pids)[0]
+
+    os.kill(dead_pid, signal.SIGKILL)
+
+    _wait_for(lambda: len(server.worker_pids) == 2 and dead_pid not in server.worker_pids)
+    assert len(server.worker_pids - worker_pids) == 1
+    assert all(int(server.get()) != dead_pid for _ in range(20))
+
+
+def test_graceful_stop_finishes_requests_in_flight(server):
+    responses = []
+    request = threading.Thread(target=lambda: responses.append(server.get('/slow?1')))
+    request.start()
+    time.sleep(0.3)
+
+    exit_code = server.stop()
+    request.join()
+
+    assert exit_code == 0
+    assert len(responses) == 1
+    assert not server.is_up()
+    assert server.worker_pids == set()
+
+
+def test_graceful_stop_kills_workers_after_timeout(tmp_path):
+    server = Server(tmp_path, graceful_timeout=0.5)
+
+    def _request():
+        try:
+            server.get('/slow?30')
+        except (urllib.error.URLError, ConnectionError):
+            # the worker is killed
+            pass
+
+    request = threading.Thread(target=_request, daemon=True)
+    request.start()
+    time.sleep(0.3)
+
+    start = time.monotonic()
+    exit_code = server.stop()
+
+    assert exit_code == 0
+    assert time.monotonic() - start < 10
+    assert 'Killing worker' in server.process.stderr.read()
@@ -0,0 +1,98 @@
+# Python Standard Library Imports
+from types import SimpleNamespace
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.utils import phab
+
+# Local Imports
+from .factories import (
+    ConduitResults,
+    make_project_data,
+)
+
+
+PROJECTS_DATA = [
+    make_project_data(1, 'Alpha'),
+    make_project_data(2, 'Beta'),
+    make_project_data(3, 'Gamma'),
+]
+
+MEMBER_PHIDS = {
+    'PHID-PROJ-1': ['PHID-USER-1'],
+    'PHID-PROJ-2': ['PHID-USER-1', 'PHID-USER-2'],
+    'PHID-PROJ-3': [],
+}
+
+
+class FakeProjectSearch:
+    """Stands in for `project.search`: all projects, or those in a `phids` constraint, with members attached
+    """
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, constraints=None, attachments=None, after=None):
+        self.queries.append(constraints)
+
+        if constraints and 'phids' in constraints:
+            projects_data = [
+                make_project_data(project_data['id'], project_data['fields']['name'], MEMBER_PHIDS[project_data['phid']])
+                for project_data
+                in PROJECTS_DATA
+                if project_data['phid'] in constraints['phids']
+            ]
+        else:
+            projects_data = PROJECTS_DATA
+
+        results = ConduitResults(projects_data)
+        return results
+
+
+@pytest.fixture
+def project_search(monkeypatch):
+    project_search = FakeProjectSearch()
+    monkeypatch.setattr(phab, 'PHAB', SimpleNamespace(project=SimpleNamespace(search=project_search)))
+    phab.refresh_projects()
+    yield project_search
+    phab.refresh_projects()
+
+
+def test_project_names_are_resolved_at_once(project_search):
+    projects, unknown_names = phab.resolve_projects_by_name(['Gamma', ' Alpha ', 'Delta', 'Alpha', 'alpha'])
+
+    # in the order of the names, matched exactly once surrounding whitespace is stripped
+    assert [project.name for project in projects] == ['Gamma', 'Alpha', 'Alpha']
+    assert unknown_names == ['Delta', 'alpha']
+    # from the list of all projects, without a query per name
+    assert project_search.queries == [None]
+
+    phab.resolve_projects_by_name(['Beta'])
+    assert project_search.queries == [None]
+
+
+def test_members_are_attached_by_a_single_query(project_search):
+    projects, unknown_names = phab.resolve_projects_by_name(['Beta', 'Alpha', 'Beta', 'Delta'], include_members=True)
+
+    assert [(project.name, project.member_phids, ) for project in projects] == [
+        ('Beta', ['PHID-USER-1', 'PHID-USER-2']),
+        ('Alpha', ['PHID-USER-1']),
+        ('Beta', ['PHID-USER-1', 'PHID-USER-2']),
+    ]
+    assert unknown_names == ['Delta']
+    assert project_search.queries == [None, {'phids': ['PHID-PROJ-2', 'PHID-PROJ-1']}]
+
+
+def test_unknown_project_names_are_listed_in_the_error(project_search):
+    with pytest.raises(Exception, match='No project named `Delta`, `Epsilon` found.'):
+        phab.get_projects_by_name(['Alpha', 'Delta', 'Epsilon'])
+
+    assert phab.get_project_by_name('Beta').phid == 'PHID-PROJ-2'
+
+
+def test_bulk_projects_by_name_skips_unknown_names(project_search):
+    projects = phab.get_bulk_projects_by_name(['Gamma', 'Delta', 'Alpha'])
+
+    # in the order of all projects
+    assert [project.name for project in projects] == ['Alpha', 'Gamma']
@@ -0,0 +1,284 @@
+# Python Standard Library Imports
+import threading
+import time
+from types import SimpleNamespace
+
+# Third Party (PyPI) Imports
+import pytest
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.constants import (
+    MANIPHEST_ASSIGNED_NONE,
+    MANIPHEST_STATUSES_OPEN,
+)
+from phablytics.reports import (
+    base,
+    new_project_tasks,
+    recent_tasks,
+)
+from phablytics.reports.base import PhablyticsReport
+from phablytics.reports.new_project_tasks import NewProjectTasksReport
+from phablytics.reports.planner import DataRequirement
+from phablytics.reports.recent_tasks import RecentTasksReport
+from phablytics.reports.upcoming_tasks_due import UpcomingProjectTasksDueReport
+from phablytics.repos.report_outputs import ReportOutputRepo
+from phablytics.settings import ReportConfig
+from phablytics.utils import merge_maniphest_tasks
+
+# Local Imports
+from .factories import make_task_data
+
+
+class FakeRequirement(DataRequirement):
+    def __init__(self, data, barrier=None):
+        self.data = data
+        self.barrier = barrier
+        self.num_fetches = 0
+
+    @property
+    def merge_key(self):
+        return id(self)
+
+    def fetch(self):
+        self.num_fetches += 1
+        if self.barrier is not None:
+            # only passes once every requirement is being fetched at the same time
+            self.barrier.wait(timeout=5)
+        return self.data
+
+
+def test_get_all_data_fetches_only_missing_data_concurrently():
+    barrier = threading.Barrier(2)
+    requirements = {
+        'a': FakeRequirement(['a'], barrier=barrier),
+        'b': FakeRequirement(['b'], barrier=barrier),
+        'c': FakeRequirement(['c']),
+    }
+
+    class Report(PhablyticsReport):
+        def data_requirements(self):
+            return requirements
+
+    report = Report(ReportConfig(name='Report', report_type='Report'))
+    report.prefetched_data['c'] = ['prefetched c']
+
+    data = report.get_all_data(['a', 'b', 'c', 'a'])
+
+    assert data == [['a'], ['b'], ['prefetched c'], ['a']]
+    assert not barrier.broken
+    assert [requirement.num_fetches for requirement in requirements.values()] == [1, 1, 0]
+
+
+def _make_task_in_columns(id_, column_phids):
+    task = Maniphest(dict(
+        make_task_data(id_, 100),
+        attachments={'columns': {'boards': {'PHID-PROJ-1': {'columns': [{'phid': phid} for phid in column_phids]}}}}
+    ))
+    return task
+
+
+def test_prepared_report_renders_the_same_tasks_in_every_format():
+    report = UpcomingProjectTasksDueReport(ReportConfig(
+        name='UpcomingTasksDue',
+        report_type='UpcomingProjectTasksDue',
+        project_name='Project',
+        column_names=['Doing'],
+        excluded_tasks=[2]
+    ))
+    # `column_lookup` is cached
+    report.column_lookup = {'PHID-PCOL-1': SimpleNamespace(phid='PHID-PCOL-1', name='Doing')}
+    report.prefetched_data['tasks'] = [_make_task_in_columns(id_, ['PHID-PCOL-1']) for id_ in [1, 2, 3]]
+
+    report._prepare_report()
+    text_report = report.render_report('text')
+    slack_report = report.render_report('slack')
+
+    assert ['T1' in text_report, 'T2' in text_report, 'T3' in text_report] == [True, False, True]
+    assert slack_report[0].attachments[0]['pretext'] == '*2 Doing Tasks*:'
+
+
+def test_upcoming_tasks_due_are_fetched_in_one_query_and_partitioned_by_column():
+    report = UpcomingProjectTasksDueReport(ReportConfig(
+        name='UpcomingTasksDue',
+        report_type='UpcomingProjectTasksDue',
+        project_name='Project',
+        column_names=['Doing', 'Review'],
+        order=['newest']
+    ))
+    # `project` and `column_lookup` are cached
+    report.project = SimpleNamespace(phid='PHID-PROJ-1')
+    report.column_lookup = {
+        'PHID-PCOL-1': SimpleNamespace(phid='PHID-PCOL-1', name='Doing'),
+        'PHID-PCOL-2': SimpleNamespace(phid='PHID-PCOL-2', name='Review'),
+    }
+
+    requirement = report.data_requirements()['tasks']
+
+    assert requirement.constraints == {
+        'projects': ['PHID-PROJ-1'],
+        'statuses': MANIPHEST_STATUSES_OPEN,
+        'columnPHIDs': ['PHID-PCOL-1', 'PHID-PCOL-2'],
+    }
+    assert (requirement.order, requirement.with_columns, ) == (['newest'], True, )
+
+    report.prefetched_data['tasks'] = [
+        _make_task_in_columns(4, ['PHID-PCOL-2']),
+        # on several boards' columns at once, and in a column which wasn't asked for
+        _make_task_in_columns(3, ['PHID-PCOL-1', 'PHID-PCOL-2']),
+        _make_task_in_columns(2, ['PHID-PCOL-3']),
+        _make_task_in_columns(1, ['PHID-PCOL-1']),
+    ]
+    report._prepare_report()
+
+    # in the order of the query, within each column
+    assert [
+        (section.column.name, [task.id_ for task in section.tasks], )
+        for section
+        in report.report_sections
+    ] == [('Doing', [3, 1]), ('Review', [4, 3])]
+
+
+def test_upcoming_tasks_due_without_columns_needs_no_data():
+    report = UpcomingProjectTasksDueReport(ReportConfig(
+        name='UpcomingTasksDue',
+        report_type='UpcomingProjectTasksDue',
+        project_name='Project'
+    ))
+
+    assert report.data_requirements() == {}
+    report._prepare_report()
+    assert report.report_sections == []
+
+
+def _get_project_tasks_constraints(project_names):
+    constraints = {
+        'projects': [f'PHID-PROJ-{project_name}' for project_name in project_names],
+        'statuses': MANIPHEST_STATUSES_OPEN,
+    }
+    return constraints
+
+
+def test_new_project_tasks_are_filtered_by_conduit(monkeypatch):
+    monkeypatch.setattr(new_project_tasks, 'get_project_tasks_constraints', _get_project_tasks_constraints)
+
+    def _make_report(projects_and_vs_or):
+        report = NewProjectTasksReport(ReportConfig(
+            name='NewProjectTasks',
+            report_type='NewProjectTasks',
+            project_names=['A', 'B'],
+            projects_and_vs_or=projects_and_vs_or,
+            threshold_lower_hours=24
+        ))
+        return report
+
+    and_report = _make_report('and')
+    or_report = _make_report('or')
+
+    # created in the last `threshold_lower_hours`, and unassigned
+    assert abs(and_report.created_start - (time.time() - 24 * 60 * 60)) < 60
+    assert {
+        name: requirement.constraints
+        for name, requirement
+        in and_report.data_requirements().items()
+    } == {
+        'tasks': {
+            'projects': ['PHID-PROJ-A', 'PHID-PROJ-B'],
+            'statuses': MANIPHEST_STATUSES_OPEN,
+            'createdStart': and_report.created_start,
+            'assigned': [MANIPHEST_ASSIGNED_NONE],
+        },
+    }
+    assert {
+        name: requirement.constraints
+        for name, requirement
+        in or_report.data_requirements().items()
+    } == {
+        project_name: {
+            'projects': [f'PHID-PROJ-{project_name}'],
+            'statuses': MANIPHEST_STATUSES_OPEN,
+            'createdStart': or_report.created_start,
+            'assigned': [MANIPHEST_ASSIGNED_NONE],
+        }
+        for project_name
+        in ['A', 'B']
+    }
+
+
+def test_new_project_tasks_in_several_projects_are_listed_once(monkeypatch):
+    monkeypatch.setattr(new_project_tasks, 'get_project_tasks_constraints', _get_project_tasks_constraints)
+    report = NewProjectTasksReport(ReportConfig(
+        name='NewProjectTasks',
+        report_type='NewProjectTasks',
+        project_names=['A', 'B'],
+        projects_and_vs_or='or'
+    ))
+    report.prefetched_data = {
+        'A': [Maniphest(make_task_data(id_, 100)) for id_ in [1, 3]],
+        'B': [Maniphest(make_task_data(id_, 100)) for id_ in [2, 3]],
+    }
+
+    report._prepare_report()
+
+    # in the default order, oldest first
+    assert [task.id_ for task in report.report_sections[0].tasks] == [1, 2, 3]
+
+
+def test_saved_html_output_is_rendered_from_the_prepared_report(monkeypatch, tmp_path):
+    fetched_owner_phids = []
+
+    def _iter_maniphest_tasks_by_owners(owner_phids):
+        fetched_owner_phids.append(owner_phids)
+        yield Maniphest(make_task_data(1, 100, owner_phid='PHID-USER-1'))
+
+    monkeypatch.setattr(ReportOutputRepo, 'DB_FILE', str(tmp_path / 'outputs.sqlite'))
+    repo = ReportOutputRepo()
+    monkeypatch.setattr(base, 'report_output_repo', repo)
+    monkeypatch.setattr(
+        recent_tasks,
+        'get_users_by_username',
+        lambda usernames: [SimpleNamespace(phid='PHID-USER-1', username='alice')]
+    )
+    monkeypatch.setattr(recent_tasks, 'iter_maniphest_tasks_by_owners', _iter_maniphest_tasks_by_owners)
+
+    report = RecentTasksReport(ReportConfig(
+        name='RecentTasks',
+        report_type='RecentTasks',
+        slack=True,
+        usernames=['alice']
+    ))
+    slack_report = report.generate_report(save_output=True)
+
+    # tasks are fetched once, for both formats
+    assert fetched_owner_phids == [['PHID-USER-1']]
+    assert 'T1' in slack_report[0].text
+    assert repo.get('RecentTasks')['report'] == f'<pre>{report.generate_text_report()}</pre>'
+
+
+def test_merged_tasks_are_deduplicated_and_sorted_by_order():
+    def _task(id_, modified_ts):
+        task_data = make_task_data(id_, 100)
+        task_data['fields']['dateModified'] = modified_ts
+        task = Maniphest(task_data)
+        return task
+
+    task_lists = [
+        [_task(1, 300), _task(3, 100)],
+        [_task(2, 200), _task(3, 100)],
+    ]
+
+    def _merged_ids(order):
+        ids = [task.id_ for task in merge_maniphest_tasks(task_lists, order=order)]
+        return ids
+
+    assert _merged_ids(None) == [1, 2, 3]
+    assert _merged_ids(['-id']) == [1, 2, 3]
+    assert _merged_ids(['id']) == [3, 2, 1]
+    assert _merged_ids('newest') == [3, 2, 1]
+    assert _merged_ids(['updated', 'id']) == [1, 2, 3]
+    assert _merged_ids('outdated') == [3, 2, 1]
+
+
+def test_tasks_cannot_be_merged_in_other_orders():
+    with pytest.raises(Exception, match='cannot be merged'):
+        merge_maniphest_tasks([[]], order=['priority'])
@@ -0,0 +1,46 @@
+# Phablytics Imports
+from phablytics.reports import runner
+from phablytics.reports.runner import (
+    format_report_runs_summary,
+    run_reports,
+)
+from phablytics.settings import ReportConfig
+
+
+class FakeReport:
+    """Stands in for a `PhablyticsReport`, without data requirements
+    """
+    def __init__(self, name, error=None):
+        self.report_config = ReportConfig(name=name, report_type='Fake')
+        self.error = error
+        self.prefetched_data = {}
+
+    def data_requirements(self):
+        return {}
+
+    def generate_report(self, save_last_run=False, save_output=False):
+        if self.error is not None:
+            raise self.error
+        report = f'{self.report_config.name} report'
+        return report
+
+
+def test_failed_warm_up_does_not_stop_reports(monkeypatch, capsys):
+    def _get_all_projects():
+        raise Exception('Conduit error')
+
+    reports = {
+        'A': FakeReport('A'),
+        'B': FakeReport('B', error=Exception('Report error')),
+    }
+    monkeypatch.setattr(runner, 'get_all_projects', _get_all_projects)
+    monkeypatch.setattr(runner, 'get_customers', lambda: [])
+    monkeypatch.setattr(runner, 'build_report', lambda report_name, overrides=None: reports[report_name])
+
+    runs, prefetch = run_reports(['A', 'B'])
+    summary = format_report_runs_summary(runs, prefetch=prefetch)
+
+    assert [(run.name, run.report, run.is_success, ) for run in runs] == [('A', 'A report', True), ('B', None, False)]
+    assert '1 of 2 reports succeeded' in summary
+    assert 'Report error' in summary
+    assert 'Conduit error' in capsys.readouterr().err
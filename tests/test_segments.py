@@ -0,0 +1,118 @@
+# Python Standard Library Imports
+import datetime
+import random
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.metrics.columns import TaskColumns
+from phablytics.metrics.metrics import TaskMetric
+from phablytics.metrics.segments import (
+    SegmentGroup,
+    group_tasks,
+    top_groups,
+)
+
+# Local Imports
+from .factories import make_task_data
+
+
+def _make_tasks():
+    rng = random.Random(10)
+    tasks = []
+    for id_ in range(1, 201):
+        created_ts = rng.randint(0, 100 * 86400)
+        tasks.append(Maniphest(make_task_data(
+            id_,
+            created_ts,
+            closed_ts=created_ts + rng.randint(0, 20 * 86400),
+            subtype=rng.choice(['default', 'bug', 'feature']),
+            points=rng.choice([None, '1', '2', '3', '0.5']),
+            owner_phid=rng.choice([None, 'PHID-USER-1', 'PHID-USER-2', 'PHID-USER-3'])
+        )))
+    return tasks
+
+
+def _per_group_metric(tasks):
+    """The metric of a group as segments were built before: a `TaskMetric` over the tasks of each group
+    """
+    metric = TaskMetric('Group', datetime.datetime(2026, 1, 1), datetime.datetime(2026, 2, 1), [], tasks)
+    return metric
+
+
+def test_group_tasks_matches_per_group_metrics():
+    tasks = _make_tasks()
+    dimensions = {
+        'subtype': lambda task: task.subtype,
+        'owner': lambda task: task.owner_phid or task.author_phid,
+        # several attributes at once
+        'subtype_and_owner': lambda task: (task.subtype, task.owner_phid, ),
+    }
+
+    groups_by_dimension = group_tasks(TaskColumns.from_tasks(tasks), dimensions)
+
+    for name, get_key in dimensions.items():
+        tasks_by_key = {}
+        for task in tasks:
+            tasks_by_key.setdefault(get_key(task), []).append(task)
+
+        groups = groups_by_dimension[name]
+        assert groups.keys() == tasks_by_key.keys()
+        for key, key_tasks in tasks_by_key.items():
+            metric = _per_group_metric(key_tasks)
+            group = groups[key]
+            assert (group.name, group.num_closed, group.points_completed, ) == (key, metric.num_closed, metric.points_completed, )
+            assert group.mean_days_to_resolution == metric.mean_days_to_resolution
+
+        # every task is counted once per dimension
+        assert sum(group.num_closed for group in groups.values()) == len(tasks)
+
+
+def test_group_tasks_leaves_out_tasks_without_a_key():
+    tasks = _make_tasks()
+
+    groups = group_tasks(TaskColumns.from_tasks(tasks), {'owner': lambda task: task.owner_phid})['owner']
+
+    assert None not in groups
+    assert sum(group.num_closed for group in groups.values()) == len([task for task in tasks if task.owner_phid])
+
+
+def test_top_groups_sorts_by_key():
+    groups = {
+        'b': SegmentGroup('b', num_closed=1),
+        'a': SegmentGroup('a', num_closed=2),
+    }
+
+    assert [group.name for group in top_groups(groups)] == ['a', 'b']
+    assert [group.name for group in top_groups(groups, max_groups=2)] == ['a', 'b']
+
+
+def test_top_groups_merges_the_rest_into_other():
+    groups = {
+        'a': SegmentGroup('a', num_closed=1, points_completed=1, days_to_resolution=4),
+        'b': SegmentGroup('b', num_closed=5, points_completed=2, days_to_resolution=1),
+        'c': SegmentGroup('c', num_closed=3, points_completed=0.5, days_to_resolution=2),
+        'd': SegmentGroup('d', num_closed=1, points_completed=3, days_to_resolution=3),
+    }
+
+    top = top_groups(groups, max_groups=3)
+    other = top[-1]
+
+    assert [group.name for group in top] == ['b', 'c', 'Other']
+    assert (other.num_closed, other.points_completed, other.days_to_resolution, ) == (2, 4, 7, )
+    assert other.mean_days_to_resolution == 3.5
+    # totals are kept
+    assert sum(group.num_closed for group in top) == sum(group.num_closed for group in groups.values())
+    assert sum(group.points_completed for group in top) == sum(group.points_completed for group in groups.values())
+
+
+
+def test_top_groups_breaks_ties_by_key():
+    groups = {
+        'e': SegmentGroup('e', num_closed=1),
+        'a': SegmentGroup('a', num_closed=1),
+        'd': SegmentGroup('d', num_closed=1),
+    }
+
+    top = top_groups(groups, max_groups=2)
+
+    assert [(group.name, group.num_closed, ) for group in top] == [('a', 1), ('Other', 2)]
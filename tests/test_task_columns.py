@@ -0,0 +1,142 @@
+# Python Standard Library Imports
+import datetime
+import os
+import time
+
+# Third Party (PyPI) Imports
+import numpy
+import pytest
+
+# Phablytics Imports
+from phablytics.classes import Maniphest
+from phablytics.metrics.columns import TaskColumns
+from phablytics.metrics.metrics import TaskMetric
+
+# Local Imports
+from .factories import make_task_data
+
+
+@pytest.fixture
+def new_york_time(monkeypatch):
+    if not os.path.exists('/usr/share/zoneinfo/America/New_York'):
+        pytest.skip('requires the tz database')
+
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _ts(*args):
+    ts = int(datetime.datetime(*args).timestamp())
+    return ts
+
+
+def _make_columns(*tasks_args):
+    tasks = [
+        Maniphest(make_task_data(id_, created_ts, closed_ts=closed_ts, **kwargs))
+        for id_, created_ts, closed_ts, kwargs
+        in tasks_args
+    ]
+    columns = TaskColumns.from_tasks(tasks)
+    return columns
+
+
+def test_bucket_by_intervals_is_inclusive_on_both_ends():
+    intervals = [
+        (datetime.datetime(2026, 1, 1), datetime.datetime(2026, 1, 8)),
+        (datetime.datetime(2026, 1, 8), datetime.datetime(2026, 1, 15)),
+    ]
+    columns = _make_columns(
+        (1, _ts(2026, 1, 10), None, {}),
+        # on the boundary between both intervals
+        (2, _ts(2026, 1, 8), None, {}),
+        (3, _ts(2026, 1, 1), None, {}),
+        (4, _ts(2026, 1, 15), None, {}),
+        # outside of both
+        (5, _ts(2026, 1, 15) + 1, None, {}),
+        (6, _ts(2026, 1, 1) - 1, None, {}),
+    )
+
+    buckets = columns.bucket_by_intervals(intervals, columns.created_ts)
+
+    # tasks keep their order within each bucket
+    assert [bucket.ids.tolist() for bucket in buckets] == [[2, 3], [1, 2, 4]]
+    assert [[task.id_ for task in bucket.tasks] for bucket in buckets] == [[2, 3], [1, 2, 4]]
+
+
+def test_bucket_by_intervals_by_closed_ts_skips_open_tasks():
+    intervals = [
+        (datetime.datetime(2026, 1, 1), datetime.datetime(2026, 1, 8)),
+    ]
+    columns = _make_columns(
+        (1, _ts(2026, 1, 2), _ts(2026, 1, 3), {}),
+        (2, _ts(2026, 1, 2), None, {}),
+    )
+
+    bucket, = columns.bucket_by_intervals(intervals, columns.closed_ts)
+
+    assert bucket.ids.tolist() == [1]
+
+
+def test_days_to_resolution_matches_tasks():
+    columns = _make_columns(
+        (1, _ts(2026, 1, 1, 12), _ts(2026, 1, 2, 11, 59), {}),
+        (2, _ts(2026, 1, 1, 12), _ts(2026, 1, 3, 12), {}),
+        (3, _ts(2026, 1, 1, 12), None, {}),
+    )
+
+    assert columns.days_to_resolution.tolist() == [0, 2, 0]
+    assert columns.days_to_resolution.tolist() == [task.days_to_resolution for task in columns.tasks]
+
+
+def test_days_to_resolution_is_counted_in_local_time(new_york_time):
+    # a day of 23 hours: clocks go forward on 2026-03-08
+    columns = _make_columns(
+        (1, _ts(2026, 3, 7, 12), _ts(2026, 3, 8, 12), {}),
+        (2, _ts(2026, 10, 31, 12), _ts(2026, 11, 1, 11, 30), {}),
+    )
+
+    assert columns.closed_ts[0] - columns.created_ts[0] == 23 * 60 * 60
+    assert columns.days_to_resolution.tolist() == [1, 0]
+    assert columns.days_to_resolution.tolist() == [task.days_to_resolution for task in columns.tasks]
+
+
+def test_points_sums_match_tasks():
+    tasks = [
+        Maniphest(make_task_data(1, 100, closed_ts=200, points='3')),
+        Maniphest(make_task_data(2, 100, closed_ts=200, points=None)),
+        Maniphest(make_task_data(3, 100, closed_ts=200, points='0.5')),
+    ]
+    metric = TaskMetric('Period', datetime.datetime(2026, 1, 1), datetime.datetime(2026, 2, 1), tasks, tasks[:1])
+    empty_metric = TaskMetric('Period', datetime.datetime(2026, 1, 1), datetime.datetime(2026, 2, 1), [], [])
+
+    # as with `sum()` of `Maniphest.points`: floats, or 0 without tasks
+    assert (metric.points_added, metric.points_completed, ) == (3.5, 3.0, )
+    assert metric.points_added == sum(task.points for task in tasks)
+    assert (type(metric.points_added), type(metric.points_completed), ) == (float, float, )
+    assert (empty_metric.points_added, empty_metric.points_completed, ) == (0, 0, )
+    assert type(empty_metric.points_added) is int
+
+
+def test_concatenate_merges_codes():
+    columns_a = _make_columns(
+        (1, 100, None, {'subtype': 'bug', 'owner_phid': 'PHID-USER-1'}),
+        (2, 100, None, {}),
+    )
+    columns_b = _make_columns(
+        (3, 100, None, {'subtype': 'default', 'owner_phid': 'PHID-USER-2'}),
+        (4, 100, None, {'subtype': 'bug', 'owner_phid': 'PHID-USER-1'}),
+    )
+
+    columns = TaskColumns.concatenate([columns_a, columns_b])
+
+    assert columns.ids.tolist() == [1, 2, 3, 4]
+    assert [columns.subtypes[code] for code in columns.subtype_codes] == ['bug', 'default', 'default', 'bug']
+    assert [
+        columns.owner_phids[code] if code >= 0 else None
+        for code
+        in columns.owner_codes
+    ] == ['PHID-USER-1', None, 'PHID-USER-2', 'PHID-USER-1']
+    assert numpy.array_equal(columns.points, numpy.zeros(4))
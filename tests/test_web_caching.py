@@ -0,0 +1,148 @@
+# Python Standard Library Imports
+import gzip
+import time
+
+# Third Party (PyPI) Imports
+import pytest
+from flask import (
+    Blueprint,
+    Flask,
+)
+
+# Phablytics Imports
+from phablytics.repos.report_outputs import ReportOutputRepo
+from phablytics.web import caching
+from phablytics.web.caching import (
+    add_cache_control,
+    compress_response,
+    conditional_response,
+)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(caching, 'WEB_CACHE_CONTROL', {'pages': 'private, max-age=300'})
+
+    app = Flask('test_web_caching')
+    app.versions = {'page': 1}
+    app.view_calls = []
+
+    pages = Blueprint('pages', __name__)
+
+    @pages.route('/versioned/<name>')
+    @conditional_response(get_version=lambda name: app.versions.get(name))
+    def versioned(name):
+        app.view_calls.append(name)
+        return f'{name} v{app.versions.get(name)} ' * 200
+
+    @pages.route('/unversioned')
+    @conditional_response()
+    def unversioned():
+        app.view_calls.append('unversioned')
+        return 'unversioned'
+
+    app.register_blueprint(pages, url_prefix='/pages')
+    app.after_request(add_cache_control)
+    app.after_request(compress_response)
+    return app
+
+
+def test_versioned_page_is_not_modified_without_running_the_view(app):
+    client = app.test_client()
+
+    response = client.get('/pages/versioned/page')
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+    assert etag.startswith('W/')
+
+    not_modified_response = client.get('/pages/versioned/page', headers={'If-None-Match': etag})
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.data == b''
+    assert not_modified_response.headers['ETag'] == etag
+    assert app.view_calls == ['page']
+
+    # a new version of the data is a new ETag
+    app.versions['page'] = 2
+    modified_response = client.get('/pages/versioned/page', headers={'If-None-Match': etag})
+    assert modified_response.status_code == 200
+    assert modified_response.headers['ETag'] != etag
+    assert app.view_calls == ['page', 'page']
+
+
+def test_etags_differ_by_query_string(app):
+    client = app.test_client()
+
+    etag = client.get('/pages/versioned/page?interval=week').headers['ETag']
+    response = client.get('/pages/versioned/page?interval=month', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+
+
+def test_unversioned_page_etag_is_a_hash_of_the_response(app):
+    client = app.test_client()
+
+    etag = client.get('/pages/unversioned').headers['ETag']
+    response = client.get('/pages/unversioned', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    # the view still runs
+    assert app.view_calls == ['unversioned', 'unversioned']
+
+
+def test_cache_control_and_compression(app):
+    client = app.test_client()
+
+    response = client.get('/pages/versioned/page', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Cache-Control'] == 'private, max-age=300'
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.data).startswith(b'page v1 ')
+
+    not_modified_response = client.get(
+        '/pages/versioned/page',
+        headers={'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']}
+    )
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.headers['Cache-Control'] == 'private, max-age=300'
+
+    # too small to compress
+    assert 'Content-Encoding' not in client.get('/pages/unversioned', headers={'Accept-Encoding': 'gzip'}).headers
+
+
+def test_stored_report_page_is_not_modified(monkeypatch, tmp_path):
+    # Phablytics Imports
+    from phablytics.web import application
+    from phablytics.web.reports import utils as reports_utils
+    from phablytics.web.reports import views as reports_views
+
+    monkeypatch.setattr(ReportOutputRepo, 'DB_FILE', str(tmp_path / 'outputs.sqlite'))
+    repo = ReportOutputRepo()
+    monkeypatch.setattr(reports_utils, 'report_output_repo', repo)
+    # the page layout looks up the current user, etc.
+    monkeypatch.setattr(reports_views, '_r', lambda template, context_data: context_data['report_content'])
+
+    loaded_report_names = []
+
+    def _get_report_output(report_name, refresh=False):
+        loaded_report_names.append(report_name)
+        output = reports_utils.get_report_output(report_name, refresh=refresh)
+        return output
+
+    monkeypatch.setattr(reports_views, 'get_report_output', _get_report_output)
+
+    client = application.test_client()
+    repo.save('GroupReviewStatus', '<p>Stored report</p>', generated_at=time.time())
+
+    response = client.get('/reports/GroupReviewStatus')
+    etag = response.headers['ETag']
+    assert (response.status_code, response.data, ) == (200, b'<p>Stored report</p>', )
+    assert response.headers['Cache-Control']
+
+    # the stored report is not loaded again
+    assert client.get('/reports/GroupReviewStatus', headers={'If-None-Match': etag}).status_code == 304
+    assert loaded_report_names == ['GroupReviewStatus']
+
+    # generated again
+    repo.save('GroupReviewStatus', '<p>New report</p>', generated_at=time.time() + 1)
+    response = client.get('/reports/GroupReviewStatus', headers={'If-None-Match': etag})
+    assert (response.status_code, response.data, ) == (200, b'<p>New report</p>', )